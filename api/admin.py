@@ -1,5 +1,19 @@
 from django.contrib import admin
-from .models import Item, Category, Permission, Role, UserRole, UserActivity, Subscription, Plan, Invoice, NewsCategory, News, FAQCategory, FAQ, PageCategory, Page, UserProfile, Story, StorySession, StoryRevision, Playlist, StoryScene
+from .models import Item, Category, Permission, Role, UserRole, UserActivity, Subscription, Plan, Invoice, NewsCategory, News, FAQCategory, FAQ, PageCategory, Page, UserProfile, Story, StoryContent, StorySession, StoryRevision, Playlist, StoryScene
+
+
+@admin.action(description='Publish selected items')
+def make_published(modeladmin, request, queryset):
+    """Publish the selected rows with a single UPDATE instead of saving each one."""
+    updated = modeladmin.model.bulk_publish(queryset)
+    modeladmin.message_user(request, f"{updated} item(s) published.")
+
+
+@admin.action(description='End selected sessions')
+def end_sessions(modeladmin, request, queryset):
+    """End the selected open sessions with a single UPDATE instead of saving each one."""
+    ended = StorySession.bulk_end(queryset)
+    modeladmin.message_user(request, f"{ended} session(s) ended.")
 
 
 @admin.register(Item)
@@ -91,6 +105,7 @@ class NewsAdmin(admin.ModelAdmin):
     search_fields = ['title', 'slug', 'content', 'excerpt']
     prepopulated_fields = {'slug': ('title',)}
     readonly_fields = ['views_count', 'created_at', 'updated_at']
+    actions = [make_published]
     date_hierarchy = 'created_at'
     filter_horizontal = []
     fieldsets = (
@@ -124,10 +139,12 @@ class FAQCategoryAdmin(admin.ModelAdmin):
 @admin.register(FAQ)
 class FAQAdmin(admin.ModelAdmin):
     list_display = ['question', 'slug', 'category', 'author', 'status', 'display_order', 'views_count', 'published_at', 'created_at']
+    list_select_related = ['category', 'author', 'stats']
     list_filter = ['status', 'category', 'created_at', 'published_at']
     search_fields = ['question', 'answer', 'slug']
     prepopulated_fields = {'slug': ('question',)}
     readonly_fields = ['views_count', 'helpful_count', 'not_helpful_count', 'created_at', 'updated_at']
+    actions = [make_published]
     date_hierarchy = 'created_at'
     fieldsets = (
         ('Basic Information', {
@@ -147,6 +164,22 @@ class FAQAdmin(admin.ModelAdmin):
         }),
     )
 
+    def _stat(self, obj, field):
+        stats = getattr(obj, 'stats', None) if obj.pk else None
+        return getattr(stats, field, 0)
+
+    @admin.display(description='Views', ordering='stats__views_count')
+    def views_count(self, obj):
+        return self._stat(obj, 'views_count')
+
+    @admin.display(description='Helpful')
+    def helpful_count(self, obj):
+        return self._stat(obj, 'helpful_count')
+
+    @admin.display(description='Not helpful')
+    def not_helpful_count(self, obj):
+        return self._stat(obj, 'not_helpful_count')
+
 
 @admin.register(PageCategory)
 class PageCategoryAdmin(admin.ModelAdmin):
@@ -164,6 +197,7 @@ class PageAdmin(admin.ModelAdmin):
     search_fields = ['title', 'slug', 'description']
     prepopulated_fields = {'slug': ('title',)}
     readonly_fields = ['views_count', 'created_at', 'updated_at']
+    actions = [make_published]
     date_hierarchy = 'created_at'
     fieldsets = (
         ('Basic Information', {
@@ -203,19 +237,27 @@ class UserProfileAdmin(admin.ModelAdmin):
     )
 
 
+class StoryContentInline(admin.StackedInline):
+    model = StoryContent
+    can_delete = False
+    fields = ['prompt', 'system_prompt_used', 'story_text', 'image_description']
+    readonly_fields = ['system_prompt_used', 'story_text', 'image_description']
+
+
 @admin.register(Story)
 class StoryAdmin(admin.ModelAdmin):
     list_display = ['title', 'user', 'template', 'is_published', 'created_at', 'updated_at']
     list_filter = ['template', 'is_published', 'created_at']
-    search_fields = ['title', 'prompt', 'story_text', 'user__username', 'user__email']
-    readonly_fields = ['id', 'created_at', 'updated_at', 'story_text', 'image_description']
+    search_fields = ['title', 'content__prompt', 'content__story_text', 'user__username', 'user__email']
+    readonly_fields = ['id', 'created_at', 'updated_at']
     date_hierarchy = 'created_at'
+    inlines = [StoryContentInline]
     fieldsets = (
         ('Basic Information', {
-            'fields': ('user', 'title', 'template', 'prompt')
+            'fields': ('user', 'title', 'template')
         }),
-        ('Story Content', {
-            'fields': ('story_text', 'image', 'image_description', 'audio_file')
+        ('Media', {
+            'fields': ('image', 'audio_file')
         }),
         ('Status', {
             'fields': ('is_published',)
@@ -244,11 +286,15 @@ class StoryRevisionAdmin(admin.ModelAdmin):
 
 @admin.register(StorySession)
 class StorySessionAdmin(admin.ModelAdmin):
-    list_display = ['story', 'user', 'started_at', 'ended_at', 'duration_seconds', 'completed', 'created_at']
-    list_filter = ['completed', 'started_at', 'created_at']
+    list_display = ['story', 'user', 'started_at', 'ended_at', 'duration_seconds', 'completed']
+    list_filter = ['completed', 'started_at']
     search_fields = ['story__title', 'user__username', 'user__email']
-    readonly_fields = ['id', 'created_at', 'updated_at', 'duration_seconds']
+    # story__user as well: the story column renders Story.__str__, which reads its author
+    list_select_related = ['user', 'story__user']
+    actions = [end_sessions]
+    readonly_fields = ['id', 'started_at', 'updated_at', 'duration_seconds']
     date_hierarchy = 'started_at'
+    ordering = ['-started_at']
     fieldsets = (
         ('Session Information', {
             'fields': ('story', 'user')
@@ -257,7 +303,7 @@ class StorySessionAdmin(admin.ModelAdmin):
             'fields': ('started_at', 'ended_at', 'duration_seconds', 'completed')
         }),
         ('Timestamps', {
-            'fields': ('created_at', 'updated_at')
+            'fields': ('updated_at',)
         }),
     )
 
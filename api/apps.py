@@ -2,4 +2,6 @@ from django.apps import AppConfig
 
 
 class ApiConfig(AppConfig):
+    # Matches the BigAutoField ids every api migration was generated with
+    default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
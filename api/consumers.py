@@ -8,7 +8,7 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth.models import User
 from .models import Story
-from .nova_service import NovaService, NovaSonicStream
+from .nova_service import NovaService, NovaSonicStream, TextChunk
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,6 +17,9 @@ logger = logging.getLogger(__name__)
 class VoiceStoryConsumer(AsyncWebsocketConsumer):
     """WebSocket consumer for voice story interactions using Nova 2 Sonic."""
     
+    # Nova Sonic audio is forwarded to the client in pieces of about half a second (24kHz, 16-bit mono)
+    AUDIO_CHUNK_BYTES = 24000
+    
     async def connect(self):
         """Handle WebSocket connection."""
         self.story_id = self.scope['url_route']['kwargs']['story_id']
@@ -171,7 +174,8 @@ class VoiceStoryConsumer(AsyncWebsocketConsumer):
                 return
             
             logger.info(f"Received audio data: {len(audio_base64)} base64 characters")
-            audio_bytes = base64.b64decode(audio_base64)
+            # A recording can be several hundred KB; decode it off the event loop
+            audio_bytes = await asyncio.to_thread(base64.b64decode, audio_base64)
             logger.info(f"Decoded audio: {len(audio_bytes)} bytes")
             
             # Send processing status
@@ -270,42 +274,59 @@ If they asked a question, answer it. If they made a comment, acknowledge it.
                 'message': 'Processing your message...'
             }))
             
-            # Process text through Nova Sonic (run in thread to avoid blocking)
-            import asyncio
-            loop = asyncio.get_event_loop()
+            # Audio is forwarded in chunks while Nova Sonic is still generating; the next
+            # event is read in a worker thread while the current chunk goes out
+            responses = self.sonic_stream.send_text(text)
+            audio = bytearray()
+            text_responses = []
+            streamed_audio = False
             
-            def process_text():
-                audio_chunks = []
-                text_responses = []
-                try:
-                    for response in self.sonic_stream.send_text(text):
-                        if isinstance(response, dict):
-                            if response.get('type') == 'text':
-                                text_responses.append(response.get('content', ''))
-                        elif isinstance(response, bytes):
-                            audio_chunks.append(response)
-                except Exception as e:
-                    logger.error(f"Error in text processing: {e}", exc_info=True)
-                return audio_chunks, text_responses
+            async def send_audio_chunk():
+                await self.send(text_data=json.dumps({
+                    'type': 'audio_chunk',
+                    'audio': base64.b64encode(audio).decode('utf-8'),
+                    'sample_rate': 24000
+                }))
+                audio.clear()
             
-            audio_chunks, text_responses = await loop.run_in_executor(None, process_text)
+            pending = asyncio.ensure_future(asyncio.to_thread(next, responses, None))
+            try:
+                while (response := await pending) is not None:
+                    pending = asyncio.ensure_future(asyncio.to_thread(next, responses, None))
+                    if isinstance(response, TextChunk):
+                        text_responses.append(response.content)
+                    elif isinstance(response, bytes):
+                        audio += response
+                        if len(audio) >= self.AUDIO_CHUNK_BYTES:
+                            await send_audio_chunk()
+                            streamed_audio = True
+            except Exception as e:
+                logger.error(f"Error in text processing: {e}", exc_info=True)
             
-            # Combine audio chunks
-            if audio_chunks:
-                combined_audio = b''.join(audio_chunks)
-                audio_base64_out = base64.b64encode(combined_audio).decode('utf-8')
+            response_text = ' '.join(text_responses) if text_responses else None
+            if streamed_audio:
+                if audio:
+                    await send_audio_chunk()
+                if response_text:
+                    await self.send(text_data=json.dumps({
+                        'type': 'text_output',
+                        'text': response_text
+                    }))
+            elif audio:
+                # Short responses still arrive as a single message
+                audio_base64_out = base64.b64encode(audio).decode('utf-8')
                 
                 # Send audio response
                 await self.send(text_data=json.dumps({
                     'type': 'audio_output',
                     'audio': audio_base64_out,
                     'sample_rate': 24000,
-                    'text': ' '.join(text_responses) if text_responses else None
+                    'text': response_text
                 }))
             else:
                 await self.send(text_data=json.dumps({
                     'type': 'text_output',
-                    'text': ' '.join(text_responses) if text_responses else 'No response generated'
+                    'text': response_text or 'No response generated'
                 }))
                 
         except Exception as e:
@@ -337,18 +358,17 @@ If they asked a question, answer it. If they made a comment, acknowledge it.
             # Break story into chunks for streaming
             nova = NovaService()
             story_chunks = nova.parse_story_parts(story.story_text)
+            texts_to_narrate = [part['text'] for part in story_chunks if part['text'].strip()]
             
-            for part in story_chunks:
-                text_to_narrate = part['text']
-                if not text_to_narrate.strip():
-                    continue
-                
-                # Synthesize speech using Polly (run in thread to avoid blocking)
-                audio_bytes_pcm = await asyncio.to_thread(
-                    nova.synthesize_speech,
-                    text=text_to_narrate,
-                    voice_id=getattr(story, 'voice_id', 'Joanna') or 'Joanna'
-                )
+            # All parts are synthesized concurrently; each arrives in story order
+            audio_chunks = nova.synthesize_speech_batch(
+                texts_to_narrate,
+                voice_id=getattr(story, 'voice_id', 'Joanna') or 'Joanna'
+            )
+            
+            for text_to_narrate in texts_to_narrate:
+                # Wait for this part's audio in a thread to avoid blocking
+                audio_bytes_pcm = await asyncio.to_thread(next, audio_chunks)
                 
                 if audio_bytes_pcm:
                     # Send audio chunk directly as bytes
@@ -384,9 +404,9 @@ If they asked a question, answer it. If they made a comment, acknowledge it.
     
     @database_sync_to_async
     def get_story(self, story_id):
-        """Get story from database."""
+        """Get story from database, with its text loaded so async callers never query lazily."""
         try:
-            return Story.objects.get(id=story_id)
+            return Story.objects.with_content().get(id=story_id)
         except Story.DoesNotExist:
             return None
     
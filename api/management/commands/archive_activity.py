@@ -0,0 +1,30 @@
+"""
+Management command to move old UserActivity rows into the archive table.
+
+Keeps api_useractivity limited to the recent, frequently queried window so its
+indexes stay small and cached; older rows remain available in
+api_useractivityarchive.
+
+Run with: python manage.py archive_activity [--months 12] [--batch-size 5000]
+Schedule it monthly (e.g. from cron) to keep the live table bounded.
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models import UserActivity
+
+
+class Command(BaseCommand):
+    help = 'Move UserActivity rows older than the retention window into UserActivityArchive'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months', type=int, default=12, help='Months of activity to keep in the live table')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows moved per transaction')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=30 * options['months'])
+        self.stdout.write(f'Archiving activity created before {cutoff:%Y-%m-%d}...')
+        archived = UserActivity.archive_older_than(cutoff, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} activity row(s).'))
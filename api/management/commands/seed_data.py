@@ -21,7 +21,7 @@ from django.utils.text import slugify
 from datetime import timedelta
 from api.models import (
     Item, Category, Permission, Role, UserRole, UserActivity, Subscription, Plan, Invoice,
-    NewsCategory, News, FAQCategory, FAQ, PageCategory, Page, UserProfile,
+    NewsCategory, News, FAQCategory, FAQ, FAQStats, PageCategory, Page, UserProfile,
     Story
 )
 
@@ -242,21 +242,21 @@ class Command(BaseCommand):
         if not users:
             self.stdout.write(self.style.WARNING('  No users found. Skipping user activities creation.'))
         else:
-            activity_count = 0
+            activities = []
             for i in range(50):  # Create 50 sample activities
                 user = users[i % len(users)]
                 
-                UserActivity.objects.create(
-                    user=user,
-                    action=actions[i % len(actions)],
-                    resource_type=resource_types[i % len(resource_types)],
-                    resource_id=i % 10 + 1,
-                    description=f'Sample activity {i+1}: {actions[i % len(actions)]} {resource_types[i % len(resource_types)]}',
-                    ip_address=f'192.168.1.{i % 255}',
-                    user_agent=f'Mozilla/5.0 (Sample Browser {i})',
-                    created_at=timezone.now() - timedelta(days=i % 30, hours=i % 24)
-                )
-                activity_count += 1
+                activities.append({
+                    'user': user,
+                    'action': actions[i % len(actions)],
+                    'resource_type': resource_types[i % len(resource_types)],
+                    'resource_id': i % 10 + 1,
+                    'description': f'Sample activity {i+1}: {actions[i % len(actions)]} {resource_types[i % len(resource_types)]}',
+                    'ip_address': f'192.168.1.{i % 255}',
+                    'user_agent': f'Mozilla/5.0 (Sample Browser {i})',
+                    'created_at': timezone.now() - timedelta(days=i % 30, hours=i % 24),
+                })
+            activity_count = len(UserActivity.bulk_log(activities))
             
             self.stdout.write(f'  Created {activity_count} sample user activities')
         
@@ -452,12 +452,14 @@ class Command(BaseCommand):
                         'status': status,
                         'display_order': i + 1,
                         'published_at': published_at,
-                        'views_count': (i % 50) * 5,
-                        'helpful_count': (i % 20) * 2,
-                        'not_helpful_count': i % 5
                     }
                 )
                 if created:
+                    FAQStats.objects.filter(pk=faq.pk).update(
+                        views_count=(i % 50) * 5,
+                        helpful_count=(i % 20) * 2,
+                        not_helpful_count=i % 5
+                    )
                     self.stdout.write(f'  Created FAQ: {faq.question}')
         
         # Create Page Categories
@@ -711,7 +711,7 @@ class Migration(migrations.Migration):
                             payment_method VARCHAR(20) NULL,
                             due_date DATETIME(6) NULL,
                             paid_date DATETIME(6) NULL,
-                            notes LONGTEXT NOT NULL,
+                            notes VARCHAR(1024) NOT NULL DEFAULT '',
                             created_at DATETIME(6) NOT NULL,
                             updated_at DATETIME(6) NOT NULL,
                             subscription_id BIGINT NULL,
@@ -734,7 +734,7 @@ class Migration(migrations.Migration):
                     name='Invoice',
                     fields=[
                         ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                        ('uuid', models.UUIDField(null=True, blank=True, db_index=True)),
+                        ('uuid', models.UUIDField(default=uuid.uuid4, unique=True, editable=False, db_index=True)),
                         ('invoice_number', models.CharField(db_index=True, max_length=50, unique=True)),
                         ('subtotal', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
                         ('discount', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
@@ -764,49 +764,27 @@ class Migration(migrations.Migration):
             ],
         ),
         # Add UUID to Invoice if table exists but column doesn't
+        # The CreateModel state above already declares the final uuid field, so the
+        # steps below only touch the database and never rebuild the project state
         migrations.RunPython(add_uuid_to_invoice_if_not_exists, migrations.RunPython.noop),
-        # Update state for Django's migration tracking
-        # Database column is handled by Python function above (or created with table), this only updates Django's state
-        SeparateDatabaseAndState(
-            database_operations=[],  # Don't touch database, column already handled by Python function or CREATE TABLE
-            state_operations=[
-                migrations.AddField(
-                    model_name='invoice',
-                    name='uuid',
-                    field=models.UUIDField(null=True, blank=True, db_index=True),
-                ),
-            ],
-        ),
         migrations.RunPython(generate_uuids_for_invoices, migrations.RunPython.noop),
         migrations.RunPython(prepare_invoice_uuid_for_alter, migrations.RunPython.noop),
-        # Use SeparateDatabaseAndState to handle database changes manually
-        SeparateDatabaseAndState(
-            database_operations=[
-                migrations.RunSQL(
-                    sql="""
-                        -- Ensure column is VARCHAR(36) and has unique constraint
-                        ALTER TABLE api_invoice MODIFY COLUMN uuid VARCHAR(36) NOT NULL;
-                        -- Add unique constraint if it doesn't exist
-                        SET @constraint_exists = (SELECT COUNT(*) FROM information_schema.table_constraints 
-                            WHERE table_schema = DATABASE() 
-                            AND table_name = 'api_invoice' 
-                            AND constraint_name = 'api_invoice_uuid_key');
-                        SET @sql = IF(@constraint_exists = 0, 
-                            'ALTER TABLE api_invoice ADD CONSTRAINT api_invoice_uuid_key UNIQUE (uuid)',
-                            'SELECT 1 AS skip');
-                        PREPARE stmt FROM @sql;
-                        EXECUTE stmt;
-                        DEALLOCATE PREPARE stmt;
-                    """,
-                    reverse_sql=migrations.RunSQL.noop,
-                ),
-            ],
-            state_operations=[
-                migrations.AlterField(
-                    model_name='invoice',
-                    name='uuid',
-                    field=models.UUIDField(default=uuid.uuid4, unique=True, editable=False, db_index=True),
-                ),
-            ],
+        migrations.RunSQL(
+            sql="""
+                -- Ensure column is VARCHAR(36) and has unique constraint
+                ALTER TABLE api_invoice MODIFY COLUMN uuid VARCHAR(36) NOT NULL;
+                -- Add unique constraint if it doesn't exist
+                SET @constraint_exists = (SELECT COUNT(*) FROM information_schema.table_constraints 
+                    WHERE table_schema = DATABASE() 
+                    AND table_name = 'api_invoice' 
+                    AND constraint_name = 'api_invoice_uuid_key');
+                SET @sql = IF(@constraint_exists = 0, 
+                    'ALTER TABLE api_invoice ADD CONSTRAINT api_invoice_uuid_key UNIQUE (uuid)',
+                    'SELECT 1 AS skip');
+                PREPARE stmt FROM @sql;
+                EXECUTE stmt;
+                DEALLOCATE PREPARE stmt;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
         ),
     ]
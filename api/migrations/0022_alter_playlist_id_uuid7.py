@@ -0,0 +1,23 @@
+# Generated manually
+#
+# Switch the Playlist primary key default from random uuid4 to time-ordered
+# uuid7. Only the Python-side default changes, so no SQL is emitted and
+# existing rows keep their ids; new rows append to the end of the clustered
+# index instead of causing random page splits.
+import api.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_story_system_prompt_used'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='playlist',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
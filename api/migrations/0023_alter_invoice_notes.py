@@ -0,0 +1,20 @@
+# Generated manually
+#
+# Invoice notes are short terms/remarks; a bounded VARCHAR is stored inline in
+# the InnoDB row instead of on overflow pages like LONGTEXT.
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_alter_playlist_id_uuid7'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='invoice',
+            name='notes',
+            field=models.CharField(blank=True, default='', help_text='Invoice notes or terms', max_length=1024),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated manually
+#
+# - Drop the plain invoice_number index; the UNIQUE constraint already indexes it.
+# - Replace (user, created_at) with (user, status, created_at) for the
+#   "invoices for user with status X, newest first" listing.
+# - Add (status, due_date) for overdue sweeps. MySQL has no partial indexes,
+#   so a plain composite serves filter(status='pending', due_date__lt=...).
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_subscription_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='invoice',
+            name='api_invoice_invoice_59a3b3_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='invoice',
+            name='api_invoice_user_id_8dad79_idx',
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='inv_user_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['status', 'due_date'], name='inv_status_due_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-16 12:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_created_at_brin_index(apps, schema_editor):
+    """Add a BRIN index on created_at for time-range reports (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS useractivity_created_brin "
+        "ON api_useractivity USING BRIN (created_at) WITH (pages_per_range = 32)"
+    )
+
+
+def drop_created_at_brin_index(apps, schema_editor):
+    """Remove the PostgreSQL BRIN index on created_at."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS useractivity_created_brin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_invoice_composite_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='useractivity',
+            index=models.Index(fields=['action', '-created_at'], name='api_useract_action_7c0803_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='useractivity',
+            index=models.Index(fields=['resource_type', 'resource_id'], name='api_useract_resourc_c9650f_idx'),
+        ),
+        migrations.RunPython(create_created_at_brin_index, drop_created_at_brin_index),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 6.0 on 2026-10-16 12:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_faq_counters(apps, schema_editor):
+    """Move existing FAQ counters into the FAQStats sidecar table."""
+    FAQ = apps.get_model('api', 'FAQ')
+    FAQStats = apps.get_model('api', 'FAQStats')
+    FAQStats.objects.bulk_create(
+        [
+            FAQStats(
+                faq_id=row['id'],
+                views_count=row['views_count'],
+                helpful_count=row['helpful_count'],
+                not_helpful_count=row['not_helpful_count'],
+            )
+            for row in FAQ.objects.values('id', 'views_count', 'helpful_count', 'not_helpful_count').iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def restore_faq_counters(apps, schema_editor):
+    """Copy FAQStats counters back onto the FAQ rows."""
+    FAQ = apps.get_model('api', 'FAQ')
+    FAQStats = apps.get_model('api', 'FAQStats')
+    for stats in FAQStats.objects.all().iterator():
+        FAQ.objects.filter(pk=stats.faq_id).update(
+            views_count=stats.views_count,
+            helpful_count=stats.helpful_count,
+            not_helpful_count=stats.not_helpful_count,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_useractivity_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FAQStats',
+            fields=[
+                ('faq', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='api.faq')),
+                ('views_count', models.IntegerField(default=0, help_text='Number of times this FAQ has been viewed')),
+                ('helpful_count', models.IntegerField(default=0, help_text='Number of users who found this helpful')),
+                ('not_helpful_count', models.IntegerField(default=0, help_text='Number of users who did not find this helpful')),
+            ],
+            options={
+                'verbose_name': 'FAQ Stats',
+                'verbose_name_plural': 'FAQ Stats',
+            },
+        ),
+        migrations.RunPython(copy_faq_counters, restore_faq_counters),
+        migrations.RemoveField(
+            model_name='faq',
+            name='helpful_count',
+        ),
+        migrations.RemoveField(
+            model_name='faq',
+            name='not_helpful_count',
+        ),
+        migrations.RemoveField(
+            model_name='faq',
+            name='views_count',
+        ),
+    ]
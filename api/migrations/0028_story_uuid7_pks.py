@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-16 12:28
+
+import api.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0027_faqstats'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='story',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='storyrevision',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='storyscene',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-10-16 12:29
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0028_story_uuid7_pks'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='storyrevision',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='useractivity',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
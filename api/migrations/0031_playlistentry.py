@@ -0,0 +1,64 @@
+# Generated manually
+#
+# Turn Playlist.stories into an explicit through model. PlaylistEntry reuses
+# the existing api_playlist_stories table (same id/playlist_id/story_id columns
+# and unique pair), so only the state is swapped; the database just gains the
+# position column, its (playlist, position) index and a backfill that numbers
+# existing rows in insertion order.
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def number_entries(apps, schema_editor):
+    PlaylistEntry = apps.get_model('api', 'PlaylistEntry')
+    updated = []
+    positions = {}
+    for entry in PlaylistEntry.objects.order_by('playlist_id', 'id').only('id', 'playlist_id'):
+        entry.position = positions.get(entry.playlist_id, 0)
+        positions[entry.playlist_id] = entry.position + 1
+        updated.append(entry)
+    PlaylistEntry.objects.bulk_update(updated, ['position'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0030_shrink_status_action_length'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='PlaylistEntry',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('playlist', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='api.playlist')),
+                        ('story', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='playlist_entries', to='api.story')),
+                    ],
+                    options={
+                        'verbose_name': 'Playlist Entry',
+                        'verbose_name_plural': 'Playlist Entries',
+                        'db_table': 'api_playlist_stories',
+                        'ordering': ['position'],
+                        'unique_together': {('playlist', 'story')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='playlist',
+                    name='stories',
+                    field=models.ManyToManyField(blank=True, help_text='Stories in this playlist', related_name='playlists', through='api.PlaylistEntry', to='api.story'),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='playlistentry',
+            name='position',
+            field=models.PositiveIntegerField(default=0, help_text='Zero-based playback position within the playlist'),
+        ),
+        migrations.RunPython(number_entries, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='playlistentry',
+            index=models.Index(fields=['playlist', 'position'], name='playlist_entry_pos_idx'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 6.0 on 2026-10-16 12:36
+
+from django.core.files.images import get_image_dimensions
+from django.db import migrations, models
+
+
+def backfill_media_metadata(apps, schema_editor):
+    """Measure existing uploads once so serializers never have to open them."""
+    for model_name in ('News', 'Page'):
+        Model = apps.get_model('api', model_name)
+        for obj in Model.objects.exclude(featured_image='').exclude(featured_image__isnull=True).iterator():
+            try:
+                obj.featured_image_width, obj.featured_image_height = get_image_dimensions(obj.featured_image)
+                obj.featured_image_size = obj.featured_image.size
+            except (OSError, ValueError):
+                continue
+            obj.save(update_fields=['featured_image_width', 'featured_image_height', 'featured_image_size'])
+
+    Story = apps.get_model('api', 'Story')
+    for story in Story.objects.exclude(audio_file='').exclude(audio_file__isnull=True).iterator():
+        try:
+            story.audio_file_size = story.audio_file.size
+        except (OSError, ValueError):
+            continue
+        story.save(update_fields=['audio_file_size'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0031_playlistentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='featured_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='featured_image_size',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Featured image size in bytes', null=True),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='featured_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='featured_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='featured_image_size',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Featured image size in bytes', null=True),
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='featured_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='audio_duration_ms',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Audio playback length in milliseconds, recorded when the audio is generated', null=True),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='audio_file_size',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Audio file size in bytes, recorded when the audio is generated', null=True),
+        ),
+        migrations.RunPython(backfill_media_metadata, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0 on 2026-10-16 12:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0032_media_metadata'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserActivityArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('action', models.CharField(choices=[('login', 'Login'), ('logout', 'Logout'), ('create', 'Create'), ('update', 'Update'), ('delete', 'Delete'), ('view', 'View'), ('download', 'Download'), ('upload', 'Upload')], max_length=10)),
+                ('resource_type', models.CharField(blank=True, max_length=100)),
+                ('resource_id', models.IntegerField(blank=True, null=True)),
+                ('description', models.TextField(blank=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Archived User Activity',
+                'verbose_name_plural': 'Archived User Activities',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='useractivityarchive',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_activities', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='useractivityarchive',
+            index=models.Index(fields=['user', '-created_at'], name='api_useract_user_id_52502b_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated manually
+#
+# Index Plan.features so features__contains lookups (JSON_CONTAINS on MySQL)
+# don't scan every plan. MySQL's counterpart to a PostgreSQL GIN index on a
+# JSON array is a multi-valued index over the array elements; Django has no
+# Index expression for it, so it exists only on the database side.
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0033_useractivityarchive'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                SET @exists = (SELECT COUNT(*) FROM INFORMATION_SCHEMA.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                    AND TABLE_NAME = 'api_plan'
+                    AND INDEX_NAME = 'plan_features_mvi');
+                SET @sql = IF(@exists = 0,
+                    'CREATE INDEX `plan_features_mvi` ON `api_plan` ((CAST(`features` AS CHAR(255) ARRAY)))',
+                    'SELECT 1');
+                PREPARE stmt FROM @sql;
+                EXECUTE stmt;
+                DEALLOCATE PREPARE stmt;
+            """,
+            reverse_sql="""
+                SET @exists = (SELECT COUNT(*) FROM INFORMATION_SCHEMA.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                    AND TABLE_NAME = 'api_plan'
+                    AND INDEX_NAME = 'plan_features_mvi');
+                SET @sql = IF(@exists > 0,
+                    'DROP INDEX `plan_features_mvi` ON `api_plan`',
+                    'SELECT 1');
+                PREPARE stmt FROM @sql;
+                EXECUTE stmt;
+                DEALLOCATE PREPARE stmt;
+            """,
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 6.0 on 2026-10-16 12:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CONTENT_FIELDS = ('prompt', 'system_prompt_used', 'story_text', 'image_description')
+
+
+def copy_story_content(apps, schema_editor):
+    """Move the large Story text columns into the StoryContent sidecar table."""
+    Story = apps.get_model('api', 'Story')
+    StoryContent = apps.get_model('api', 'StoryContent')
+    batch = []
+    for row in Story.objects.values('id', *CONTENT_FIELDS).iterator(chunk_size=500):
+        batch.append(StoryContent(story_id=row.pop('id'), **row))
+        if len(batch) >= 500:
+            StoryContent.objects.bulk_create(batch)
+            batch = []
+    StoryContent.objects.bulk_create(batch)
+
+
+def restore_story_content(apps, schema_editor):
+    """Copy StoryContent text back onto the Story rows."""
+    Story = apps.get_model('api', 'Story')
+    StoryContent = apps.get_model('api', 'StoryContent')
+    for content in StoryContent.objects.all().iterator(chunk_size=500):
+        Story.objects.filter(pk=content.story_id).update(
+            **{field: getattr(content, field) for field in CONTENT_FIELDS}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0034_plan_features_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoryContent',
+            fields=[
+                ('story', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='content', serialize=False, to='api.story')),
+                ('prompt', models.TextField(help_text="User's initial story prompt")),
+                ('system_prompt_used', models.TextField(blank=True, help_text='Full system prompt used for story generation (includes template and user settings)')),
+                ('story_text', models.TextField(blank=True, help_text='Generated story text from Nova AI')),
+                ('image_description', models.TextField(blank=True, help_text='AI-generated image description from Titan Embeddings')),
+            ],
+            options={
+                'verbose_name': 'Story Content',
+                'verbose_name_plural': 'Story Content',
+            },
+        ),
+        migrations.RunPython(copy_story_content, restore_story_content),
+        migrations.RemoveField(
+            model_name='story',
+            name='image_description',
+        ),
+        migrations.RemoveField(
+            model_name='story',
+            name='prompt',
+        ),
+        migrations.RemoveField(
+            model_name='story',
+            name='story_text',
+        ),
+        migrations.RemoveField(
+            model_name='story',
+            name='system_prompt_used',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 12:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0035_storycontent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='storysession',
+            index=models.Index(fields=['user', 'completed', '-started_at'], name='storysession_usr_cmp_start_i'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated manually
+#
+# Turn StorySession.duration_seconds into a stored generated column computed
+# from started_at/ended_at. Django cannot alter a regular column into a
+# generated one, so the column is dropped and re-added; the database fills in
+# the value for every existing row from their timestamps.
+import api.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0036_storysession_usr_cmp_start_i'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='storysession',
+            name='duration_seconds',
+        ),
+        migrations.AddField(
+            model_name='storysession',
+            name='duration_seconds',
+            field=models.GeneratedField(db_persist=True, expression=api.models.SecondsBetween('started_at', 'ended_at'), help_text='Duration of the session in seconds', output_field=models.IntegerField(blank=True, null=True)),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 12:47
+
+import api.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0037_storysession_duration_generated'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='storysession',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 6.0 on 2026-10-16 12:48
+
+from django.db import migrations, models
+
+# Bit for each former BooleanField, matching the _FLAG_* constants in api.models
+FLAG_BITS = {
+    'include_diversity': 1,
+    'include_sensory_details': 2,
+    'include_interactive_questions': 4,
+    'include_sound_effects': 8,
+    'explain_complex_words': 16,
+}
+
+
+def pack_flags(apps, schema_editor):
+    """Fold the five boolean columns into the flags bitmask."""
+    UserStorySettings = apps.get_model('api', 'UserStorySettings')
+    for row in UserStorySettings.objects.values('id', *FLAG_BITS).iterator():
+        flags = sum(bit for name, bit in FLAG_BITS.items() if row[name])
+        UserStorySettings.objects.filter(pk=row['id']).update(flags=flags)
+
+
+def unpack_flags(apps, schema_editor):
+    """Restore the boolean columns from the flags bitmask."""
+    UserStorySettings = apps.get_model('api', 'UserStorySettings')
+    for row in UserStorySettings.objects.values('id', 'flags').iterator():
+        UserStorySettings.objects.filter(pk=row['id']).update(
+            **{name: bool(row['flags'] & bit) for name, bit in FLAG_BITS.items()}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0038_storysession_uuid7_pk'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userstorysettings',
+            name='flags',
+            field=models.SmallIntegerField(default=31, help_text='Bitmask of the story content toggles (all enabled by default)'),
+        ),
+        migrations.RunPython(pack_flags, unpack_flags),
+        migrations.RemoveField(
+            model_name='userstorysettings',
+            name='explain_complex_words',
+        ),
+        migrations.RemoveField(
+            model_name='userstorysettings',
+            name='include_diversity',
+        ),
+        migrations.RemoveField(
+            model_name='userstorysettings',
+            name='include_interactive_questions',
+        ),
+        migrations.RemoveField(
+            model_name='userstorysettings',
+            name='include_sensory_details',
+        ),
+        migrations.RemoveField(
+            model_name='userstorysettings',
+            name='include_sound_effects',
+        ),
+    ]
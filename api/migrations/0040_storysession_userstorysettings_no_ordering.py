@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-16 12:51
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0039_userstorysettings_flags'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='storysession',
+            options={'verbose_name': 'Story Session', 'verbose_name_plural': 'Story Sessions'},
+        ),
+        migrations.AlterModelOptions(
+            name='userstorysettings',
+            options={'verbose_name': 'User Story Settings', 'verbose_name_plural': 'User Story Settings'},
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 12:53
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0040_storysession_userstorysettings_no_ordering'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='storysession',
+            name='created_at',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-16 12:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0041_remove_storysession_created_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='storysession',
+            name='api_storyse_user_id_5edd6f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='storysession',
+            index=models.Index(fields=['user', '-started_at', 'story', 'ended_at', 'duration_seconds', 'completed'], name='storysession_usr_start_cov_i'),
+        ),
+    ]
@@ -1,8 +1,84 @@
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.functions import Coalesce
+from django.core.cache import cache
+from django.core.files.images import get_image_dimensions
 from django.utils import timezone
 from django.contrib.auth.models import User
+from collections import namedtuple
+import functools
+import os
+import sys
+import time
 import uuid
-from .utils import story_image_upload_path, story_audio_upload_path, story_scene_image_upload_path
+from django.utils.text import slugify
+from .utils import story_image_upload_path, story_audio_upload_path, story_scene_image_upload_path, uuid7
+
+
+# ========== Managers ==========
+# Default managers pre-join the forward relations serializers always read, so list
+# endpoints can't fall into per-row queries. Reverse 1:N relations are opt-in only.
+
+class UserActivityManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
+
+class SubscriptionManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('user', 'plan')
+
+
+class InvoiceManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('user', 'subscription', 'plan')
+
+
+class StoryQuerySet(models.QuerySet):
+    def with_content(self):
+        """Join the StoryContent text columns; use wherever prompt/story text is read."""
+        return self.select_related('content')
+
+    def with_scenes(self):
+        """Prefetch scenes in order; use on detail endpoints only."""
+        return self.prefetch_related(
+            models.Prefetch('scenes', queryset=StoryScene.objects.order_by('scene_number'))
+        )
+
+
+class StoryManager(models.Manager.from_queryset(StoryQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
+
+class StoryRevisionManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('story', 'created_by')
+
+
+class UserStorySettingsManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
+
+class StorySessionManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('user', 'story')
+
+
+class PlaylistQuerySet(models.QuerySet):
+    def with_entries(self):
+        """Prefetch entries in order with their stories; use where the stories are rendered."""
+        return self.prefetch_related(
+            models.Prefetch(
+                'entries',
+                queryset=PlaylistEntry.objects.select_related('story', 'story__user').order_by('position')
+            )
+        )
+
+
+class PlaylistManager(models.Manager.from_queryset(PlaylistQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
 
 
 class Item(models.Model):
@@ -112,13 +188,16 @@ class UserActivity(models.Model):
     ]
     
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activities')
-    action = models.CharField(max_length=20, choices=ACTION_CHOICES)
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
     resource_type = models.CharField(max_length=100, blank=True, help_text="Type of resource (e.g., 'User', 'Role', 'Subscription')")
     resource_id = models.IntegerField(null=True, blank=True, help_text="ID of the resource")
     description = models.TextField(blank=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # A default rather than auto_now_add, so rows given an explicit time (e.g. via bulk_log) keep it
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    objects = UserActivityManager()
 
     class Meta:
         ordering = ['-created_at']
@@ -127,6 +206,81 @@ class UserActivity(models.Model):
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['action', '-created_at']),
+            models.Index(fields=['resource_type', 'resource_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.action} - {self.created_at}"
+
+    @classmethod
+    def bulk_log(cls, rows, batch_size=1000):
+        """
+        Insert many activity rows with multi-row INSERT statements.
+
+        Args:
+            rows: Iterable of UserActivity instances or dicts of field values
+            batch_size: Rows per INSERT statement
+
+        Returns:
+            list: Created UserActivity instances
+        """
+        activities = [row if isinstance(row, cls) else cls(**row) for row in rows]
+        return cls.objects.bulk_create(activities, batch_size=batch_size)
+
+    @classmethod
+    def archive_older_than(cls, cutoff, batch_size=5000):
+        """
+        Move rows created before cutoff into UserActivityArchive, oldest first.
+
+        Each batch is copied and deleted in its own transaction so the hot table
+        is never locked for the whole run.
+
+        Args:
+            cutoff: Datetime; rows with created_at before it are archived
+            batch_size: Rows moved per transaction
+
+        Returns:
+            int: Number of rows archived
+        """
+        fields = [f.attname for f in cls._meta.concrete_fields]
+        archived = 0
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    cls.objects.filter(created_at__lt=cutoff)
+                    .order_by('id')
+                    .values(*fields)[:batch_size]
+                )
+                if not rows:
+                    return archived
+                UserActivityArchive.objects.bulk_create(
+                    [UserActivityArchive(**row) for row in rows],
+                    batch_size=batch_size
+                )
+                cls.objects.filter(id__in=[row['id'] for row in rows]).delete()
+            archived += len(rows)
+
+
+class UserActivityArchive(models.Model):
+    """Cold storage for UserActivity rows past the retention window of the live log."""
+    # Keeps the id the row had in UserActivity
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_activities')
+    action = models.CharField(max_length=10, choices=UserActivity.ACTION_CHOICES)
+    resource_type = models.CharField(max_length=100, blank=True)
+    resource_id = models.IntegerField(null=True, blank=True)
+    description = models.TextField(blank=True)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Archived User Activity'
+        verbose_name_plural = 'Archived User Activities'
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
         ]
 
     def __str__(self):
@@ -147,6 +301,9 @@ class Plan(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Feature strings are capped so they fit the multi-valued index on features
+    FEATURE_MAX_LENGTH = 255
+
     class Meta:
         ordering = ['display_order', 'name']
         verbose_name = 'Plan'
@@ -155,6 +312,11 @@ class Plan(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def with_feature(cls, feature):
+        """Plans whose features list includes feature (served by the plan_features_mvi index)."""
+        return cls.objects.filter(features__contains=[feature])
+
 
 class Subscription(models.Model):
     """Subscription model for user subscriptions."""
@@ -168,7 +330,7 @@ class Subscription(models.Model):
     uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False, db_index=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='subscriptions')
     plan = models.ForeignKey(Plan, on_delete=models.SET_NULL, null=True, related_name='subscriptions')
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='inactive')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='inactive')
     start_date = models.DateTimeField(null=True, blank=True)
     end_date = models.DateTimeField(null=True, blank=True)
     price = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
@@ -176,10 +338,17 @@ class Subscription(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SubscriptionManager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Subscription'
         verbose_name_plural = 'Subscriptions'
+        indexes = [
+            models.Index(fields=['user', 'status', '-created_at']),
+            models.Index(fields=['status', 'end_date'], name='sub_status_end_idx'),
+            models.Index(fields=['plan', 'status']),
+        ]
 
     def __str__(self):
         plan_name = self.plan.name if self.plan else 'No Plan'
@@ -212,58 +381,98 @@ class Invoice(models.Model):
     subtotal = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
     discount = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
     total = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
     payment_method = models.CharField(max_length=20, choices=PAYMENT_METHOD_CHOICES, blank=True, null=True)
     due_date = models.DateTimeField(null=True, blank=True)
     paid_date = models.DateTimeField(null=True, blank=True)
-    notes = models.TextField(blank=True, help_text="Invoice notes or terms")
+    notes = models.CharField(max_length=1024, blank=True, default='', help_text="Invoice notes or terms")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = InvoiceManager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Invoice'
         verbose_name_plural = 'Invoices'
         indexes = [
-            models.Index(fields=['invoice_number']),
-            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'status', '-created_at'], name='inv_user_status_created_idx'),
+            # Spans every status: MySQL has no partial indexes to narrow it to open invoices
             models.Index(fields=['status', '-created_at']),
+            # Overdue sweeps: filter(status='pending', due_date__lt=...)
+            models.Index(fields=['status', 'due_date'], name='inv_status_due_idx'),
         ]
 
     def __str__(self):
         return f"Invoice #{self.invoice_number} - {self.user.username}"
 
 
+# ========== Publishing ==========
+
+class PublishableMixin:
+    """Publishing helpers for content models with status and published_at fields."""
+
+    @classmethod
+    def bulk_publish(cls, queryset):
+        """Publish every row in queryset with one UPDATE, keeping any existing published_at."""
+        now = timezone.now()
+        return queryset.update(
+            status='published',
+            published_at=Coalesce('published_at', models.Value(now)),
+            updated_at=now,
+        )
+
+    def _set_published_at(self, update_fields=None):
+        """Stamp published_at on first publish; skipped for saves that don't touch status."""
+        if update_fields is not None and 'status' not in update_fields:
+            return
+        if self.status == 'published' and not self.published_at:
+            self.published_at = timezone.now()
+
+
+class FeaturedImageMixin:
+    """Keeps featured_image width/height/size on the row so reads never touch storage."""
+
+    def _set_featured_image_metadata(self, update_fields=None):
+        """Measure a newly uploaded featured_image once, before it is committed to storage."""
+        if update_fields is not None and 'featured_image' not in update_fields:
+            return
+        image = self.featured_image
+        if not image:
+            self.featured_image_width = None
+            self.featured_image_height = None
+            self.featured_image_size = None
+            return
+        if image._committed:
+            return
+        self.featured_image_width, self.featured_image_height = get_image_dimensions(image)
+        self.featured_image_size = image.size
+
+
 # ========== Image Upload Path Functions ==========
 
 def news_image_upload_path(instance, filename):
     """Generate upload path for news images: yy/mm/news-uuid.extension"""
-    import uuid
-    from datetime import datetime
-    ext = filename.split('.')[-1]
-    year_month = datetime.now().strftime('%y/%m')
-    unique_id = str(uuid.uuid4())
-    return f'news/{year_month}/news-{unique_id}.{ext}'
+    ext = os.path.splitext(filename)[1].lower()
+    year_month = time.strftime('%y/%m')
+    unique_id = uuid.uuid4().hex
+    return f'news/{year_month}/news-{unique_id}{ext}'
 
 
 def page_image_upload_path(instance, filename):
     """Generate upload path for page images: yy/mm/page-uuid.extension"""
-    import uuid
-    from datetime import datetime
-    ext = filename.split('.')[-1]
-    year_month = datetime.now().strftime('%y/%m')
-    unique_id = str(uuid.uuid4())
-    return f'pages/{year_month}/page-{unique_id}.{ext}'
+    ext = os.path.splitext(filename)[1].lower()
+    year_month = time.strftime('%y/%m')
+    unique_id = uuid.uuid4().hex
+    return f'pages/{year_month}/page-{unique_id}{ext}'
 
 
 def user_avatar_upload_path(instance, filename):
     """Generate upload path for user avatars: yy/mm/media-uuid.extension"""
-    import uuid
-    from datetime import datetime
-    ext = filename.split('.')[-1]
-    year_month = datetime.now().strftime('%y/%m')
-    unique_id = str(uuid.uuid4())
-    return f'media/{year_month}/media-{unique_id}.{ext}'
+    ext = os.path.splitext(filename)[1].lower()
+    year_month = time.strftime('%y/%m')
+    unique_id = uuid.uuid4().hex
+    return f'media/{year_month}/media-{unique_id}{ext}'
 
 
 # ========== News Management Models ==========
@@ -287,7 +496,7 @@ class NewsCategory(models.Model):
         return self.name
 
 
-class News(models.Model):
+class News(PublishableMixin, FeaturedImageMixin, models.Model):
     """News article model."""
     STATUS_CHOICES = [
         ('draft', 'Draft'),
@@ -303,7 +512,10 @@ class News(models.Model):
     content = models.TextField(help_text="Full article content")
     excerpt = models.TextField(blank=True, max_length=500, help_text="Short summary (max 500 characters)")
     featured_image = models.ImageField(upload_to=news_image_upload_path, blank=True, null=True, help_text="Featured image (max 50KB)")
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
+    featured_image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    featured_image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    featured_image_size = models.PositiveIntegerField(null=True, blank=True, editable=False, help_text="Featured image size in bytes")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='draft')
     is_featured = models.BooleanField(default=False, help_text="Feature this news on homepage")
     views_count = models.IntegerField(default=0, help_text="Number of times this news has been viewed")
     published_at = models.DateTimeField(null=True, blank=True, help_text="Publication date and time")
@@ -324,14 +536,21 @@ class News(models.Model):
         return self.title
 
     def save(self, *args, **kwargs):
-        """Auto-set published_at when status changes to published."""
-        if self.status == 'published' and not self.published_at:
-            self.published_at = timezone.now()
+        """Auto-set published_at on publish and record featured image metadata on upload."""
+        self._set_published_at(kwargs.get('update_fields'))
+        self._set_featured_image_metadata(kwargs.get('update_fields'))
         super().save(*args, **kwargs)
 
 
 # ========== FAQ Management Models ==========
 
+@functools.lru_cache(maxsize=4096)
+def _slugify_prefix(text):
+    """Slugify text once per distinct value; bulk imports repeat the same questions."""
+    # Limit to 240 chars so a counter suffix still fits MySQL's 255-char slug index
+    return slugify(text)[:240]
+
+
 class FAQCategory(models.Model):
     """Category model for organizing FAQs."""
     uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False, db_index=True)
@@ -352,7 +571,7 @@ class FAQCategory(models.Model):
         return self.name
 
 
-class FAQ(models.Model):
+class FAQ(PublishableMixin, models.Model):
     """FAQ (Frequently Asked Question) model."""
     STATUS_CHOICES = [
         ('draft', 'Draft'),
@@ -366,11 +585,8 @@ class FAQ(models.Model):
     answer = models.TextField(help_text="Detailed answer to the question")
     category = models.ForeignKey(FAQCategory, on_delete=models.SET_NULL, null=True, blank=True, related_name='faq_items')
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='authored_faqs')
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='draft')
     display_order = models.IntegerField(default=0, help_text="Order for display within category (lower numbers appear first)")
-    views_count = models.IntegerField(default=0, help_text="Number of times this FAQ has been viewed")
-    helpful_count = models.IntegerField(default=0, help_text="Number of users who found this helpful")
-    not_helpful_count = models.IntegerField(default=0, help_text="Number of users who did not find this helpful")
     published_at = models.DateTimeField(null=True, blank=True, help_text="Publication date and time")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -390,23 +606,56 @@ class FAQ(models.Model):
 
     def save(self, *args, **kwargs):
         """Auto-set published_at when status changes to published and generate slug from question if not set."""
-        if self.status == 'published' and not self.published_at:
-            self.published_at = timezone.now()
+        self._set_published_at(kwargs.get('update_fields'))
         if not self.slug:
-            from django.utils.text import slugify
-            # Generate slug from question, limiting to 255 chars for MySQL compatibility
-            base_slug = slugify(self.question[:200])  # Limit to 200 chars to leave room for counter suffix
-            if len(base_slug) > 240:  # Ensure we have room for counter
-                base_slug = base_slug[:240]
-            slug = base_slug
-            counter = 1
-            while FAQ.objects.filter(slug=slug).exclude(pk=self.pk if self.pk else None).exists():
-                slug = f"{base_slug}-{counter}"
-                if len(slug) > 255:  # Truncate if still too long
-                    slug = slug[:255]
-                counter += 1
-            self.slug = slug
+            base_slug = self._base_slug(self.question)
+            # Fetch every colliding slug in one query instead of probing suffixes one at a time
+            taken = FAQ.objects.filter(slug__startswith=base_slug)
+            if self.pk:
+                taken = taken.exclude(pk=self.pk)
+            self.slug = self._next_free_slug(base_slug, set(taken.values_list('slug', flat=True)))
+        is_new = self._state.adding
         super().save(*args, **kwargs)
+        if is_new:
+            FAQStats.objects.get_or_create(faq=self)
+
+    @staticmethod
+    def _base_slug(question):
+        """Build the slug prefix for a question, leaving room for a counter suffix."""
+        return _slugify_prefix(question[:200])
+
+    @staticmethod
+    def _next_free_slug(base_slug, taken):
+        """Return base_slug, or base_slug-N with the lowest N not present in taken."""
+        slug = base_slug
+        counter = 1
+        while slug in taken:
+            slug = f"{base_slug}-{counter}"[:255]
+            counter += 1
+        return slug
+
+
+class FAQStats(models.Model):
+    """Hot counters for an FAQ, kept off the FAQ row so view/vote increments don't lock or rewrite it."""
+    faq = models.OneToOneField(FAQ, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    views_count = models.IntegerField(default=0, help_text="Number of times this FAQ has been viewed")
+    helpful_count = models.IntegerField(default=0, help_text="Number of users who found this helpful")
+    not_helpful_count = models.IntegerField(default=0, help_text="Number of users who did not find this helpful")
+
+    class Meta:
+        verbose_name = 'FAQ Stats'
+        verbose_name_plural = 'FAQ Stats'
+
+    def __str__(self):
+        return f"Stats for {self.faq_id}"
+
+    @classmethod
+    def increment(cls, faq_id, field='views_count', amount=1):
+        """Atomically add amount to a counter with a single UPDATE, creating the row on first use."""
+        expression = {field: models.F(field) + amount}
+        if not cls.objects.filter(pk=faq_id).update(**expression):
+            cls.objects.get_or_create(faq_id=faq_id)
+            cls.objects.filter(pk=faq_id).update(**expression)
 
 
 # ========== Page Management Models ==========
@@ -431,7 +680,7 @@ class PageCategory(models.Model):
         return self.name
 
 
-class Page(models.Model):
+class Page(PublishableMixin, FeaturedImageMixin, models.Model):
     """Page model for static content pages."""
     STATUS_CHOICES = [
         ('draft', 'Draft'),
@@ -446,7 +695,10 @@ class Page(models.Model):
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='authored_pages')
     description = models.TextField(help_text="Page content (rich text)")
     featured_image = models.ImageField(upload_to=page_image_upload_path, blank=True, null=True, help_text="Featured image (max 50KB)")
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
+    featured_image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    featured_image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    featured_image_size = models.PositiveIntegerField(null=True, blank=True, editable=False, help_text="Featured image size in bytes")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='draft')
     is_featured = models.BooleanField(default=False, help_text="Feature this page on homepage")
     views_count = models.IntegerField(default=0, help_text="Number of times this page has been viewed")
     published_at = models.DateTimeField(null=True, blank=True, help_text="Publication date and time")
@@ -468,9 +720,9 @@ class Page(models.Model):
         return self.title
 
     def save(self, *args, **kwargs):
-        """Auto-set published_at when status changes to published."""
-        if self.status == 'published' and not self.published_at:
-            self.published_at = timezone.now()
+        """Auto-set published_at on publish and record featured image metadata on upload."""
+        self._set_published_at(kwargs.get('update_fields'))
+        self._set_featured_image_metadata(kwargs.get('update_fields'))
         super().save(*args, **kwargs)
 
 
@@ -495,6 +747,18 @@ class UserProfile(models.Model):
         return f"{self.user.username}'s Profile"
 
 
+def _story_content_field(name):
+    """Expose a StoryContent column as a read/write attribute on Story."""
+    def getter(self):
+        return getattr(self._get_content(), name)
+
+    def setter(self, value):
+        setattr(self._get_content(), name, value)
+        self._content_changed = True
+
+    return property(getter, setter)
+
+
 class Story(models.Model):
     """Story model for storing user-generated stories with Nova AI integration."""
     STORY_TEMPLATES = [
@@ -505,7 +769,7 @@ class Story(models.Model):
         ('educational', 'Educational'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -516,17 +780,6 @@ class Story(models.Model):
         max_length=200,
         help_text="Story title"
     )
-    prompt = models.TextField(
-        help_text="User's initial story prompt"
-    )
-    system_prompt_used = models.TextField(
-        blank=True,
-        help_text="Full system prompt used for story generation (includes template and user settings)"
-    )
-    story_text = models.TextField(
-        blank=True,
-        help_text="Generated story text from Nova AI"
-    )
     template = models.CharField(
         max_length=20,
         choices=STORY_TEMPLATES,
@@ -539,16 +792,24 @@ class Story(models.Model):
         blank=True,
         help_text="Optional uploaded image for story (stored in YYYY/MM/<story-id>/)"
     )
-    image_description = models.TextField(
-        blank=True,
-        help_text="AI-generated image description from Titan Embeddings"
-    )
     audio_file = models.FileField(
         upload_to=story_audio_upload_path,
         null=True,
         blank=True,
         help_text="Generated audio file from Nova 2 Sonic (stored in YYYY/MM/<story-id>/)"
     )
+    audio_file_size = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Audio file size in bytes, recorded when the audio is generated"
+    )
+    audio_duration_ms = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Audio playback length in milliseconds, recorded when the audio is generated"
+    )
     voice_id = models.CharField(
         max_length=50,
         default='Joanna',
@@ -561,6 +822,8 @@ class Story(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = StoryManager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Story'
@@ -574,10 +837,78 @@ class Story(models.Model):
     def __str__(self):
         return f"{self.title} by {self.user.username}"
 
+    # Large text columns live on StoryContent so list queries read narrow rows.
+    # They stay readable/writable as story.<name>; save() writes them through.
+    CONTENT_FIELDS = ('prompt', 'system_prompt_used', 'story_text', 'image_description')
+
+    prompt = _story_content_field('prompt')
+    system_prompt_used = _story_content_field('system_prompt_used')
+    story_text = _story_content_field('story_text')
+    image_description = _story_content_field('image_description')
+
+    def _get_content(self):
+        """Return the StoryContent row, starting an unsaved one if the story has none yet."""
+        if self._state.adding and not Story.content.is_cached(self):
+            self.content = StoryContent(story=self)
+        try:
+            return self.content
+        except StoryContent.DoesNotExist:
+            self.content = StoryContent(story=self)
+            return self.content
+
+    def save(self, *args, **kwargs):
+        """Save the story, then any StoryContent changes made through the text properties."""
+        if self._state.adding:
+            # Every story gets a content row, even if no text was set yet
+            self._get_content()
+            self._content_changed = True
+        update_fields = kwargs.get('update_fields')
+        content_fields = None
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            content_fields = update_fields & set(self.CONTENT_FIELDS)
+            kwargs['update_fields'] = update_fields - content_fields
+        super().save(*args, **kwargs)
+        if not getattr(self, '_content_changed', False):
+            return
+        content = self.content
+        if content._state.adding or content_fields is None:
+            content.save()
+        elif content_fields:
+            content.save(update_fields=content_fields)
+        self._content_changed = False
+
+
+class StoryContent(models.Model):
+    """Large text columns of a Story, kept off the story row; only detail views join them."""
+    story = models.OneToOneField(Story, on_delete=models.CASCADE, primary_key=True, related_name='content')
+    prompt = models.TextField(
+        help_text="User's initial story prompt"
+    )
+    system_prompt_used = models.TextField(
+        blank=True,
+        help_text="Full system prompt used for story generation (includes template and user settings)"
+    )
+    story_text = models.TextField(
+        blank=True,
+        help_text="Generated story text from Nova AI"
+    )
+    image_description = models.TextField(
+        blank=True,
+        help_text="AI-generated image description from Titan Embeddings"
+    )
+
+    class Meta:
+        verbose_name = 'Story Content'
+        verbose_name_plural = 'Story Content'
+
+    def __str__(self):
+        return f"Content for {self.story_id}"
+
 
 class StoryRevision(models.Model):
     """Model to store revision history of story edits."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     story = models.ForeignKey(
         Story,
         on_delete=models.CASCADE,
@@ -587,7 +918,7 @@ class StoryRevision(models.Model):
     story_text = models.TextField(
         help_text="Story text at this revision"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
     created_by = models.ForeignKey(
         User,
         on_delete=models.SET_NULL,
@@ -596,6 +927,8 @@ class StoryRevision(models.Model):
         help_text="User who created this revision"
     )
     
+    objects = StoryRevisionManager()
+
     class Meta:
         verbose_name = "Story Revision"
         verbose_name_plural = "Story Revisions"
@@ -610,7 +943,7 @@ class StoryRevision(models.Model):
 
 class StoryScene(models.Model):
     """Model to store generated scene images for stories."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     story = models.ForeignKey(
         Story,
         on_delete=models.CASCADE,
@@ -635,7 +968,7 @@ class StoryScene(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
     class Meta:
         verbose_name = "Story Scene"
         verbose_name_plural = "Story Scenes"
@@ -648,10 +981,30 @@ class StoryScene(models.Model):
     def __str__(self):
         return f"Scene {self.scene_number} of {self.story.title}"
 
+    @classmethod
+    def bulk_upsert(cls, scenes, update_fields, batch_size=500):
+        """
+        Insert scenes, updating update_fields on rows whose (story, scene_number) already exists.
+
+        Runs one INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE per batch. Conflicting
+        rows keep their existing primary key, so re-query the story's scenes afterwards
+        instead of trusting the ids on the passed-in objects.
+        """
+        # MySQL upserts on any unique key and rejects an explicit conflict target
+        unique_fields = ['story', 'scene_number'] if connection.features.supports_update_conflicts_with_target else None
+        return cls.objects.bulk_create(
+            scenes,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=[*update_fields, 'updated_at'],
+            batch_size=batch_size,
+        )
+
 
 class Playlist(models.Model):
     """Playlist model for organizing user's stories."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered UUIDv7 keeps inserts sequential in the clustered PK index
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -668,6 +1021,7 @@ class Playlist(models.Model):
     )
     stories = models.ManyToManyField(
         Story,
+        through='PlaylistEntry',
         related_name='playlists',
         blank=True,
         help_text="Stories in this playlist"
@@ -679,6 +1033,8 @@ class Playlist(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PlaylistManager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Playlist'
@@ -691,6 +1047,152 @@ class Playlist(models.Model):
     def __str__(self):
         return f"{self.name} ({self.user.username})"
 
+    def set_stories(self, stories):
+        """Replace the playlist contents, keeping the given order as positions."""
+        stories = list(dict.fromkeys(stories))
+        with transaction.atomic():
+            self.entries.all().delete()
+            PlaylistEntry.objects.bulk_create([
+                PlaylistEntry(playlist=self, story=story, position=position)
+                for position, story in enumerate(stories)
+            ])
+
+
+class PlaylistEntry(models.Model):
+    """Ordered membership of a story in a playlist."""
+    playlist = models.ForeignKey(
+        Playlist,
+        on_delete=models.CASCADE,
+        related_name='entries'
+    )
+    story = models.ForeignKey(
+        Story,
+        on_delete=models.CASCADE,
+        related_name='playlist_entries'
+    )
+    position = models.PositiveIntegerField(
+        default=0,
+        help_text="Zero-based playback position within the playlist"
+    )
+
+    class Meta:
+        # Reuse the table Django created for the original auto M2M
+        db_table = 'api_playlist_stories'
+        ordering = ['position']
+        verbose_name = 'Playlist Entry'
+        verbose_name_plural = 'Playlist Entries'
+        unique_together = [('playlist', 'story')]
+        indexes = [
+            models.Index(fields=['playlist', 'position'], name='playlist_entry_pos_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.playlist.name} #{self.position}: {self.story.title}"
+
+
+# System prompt preset lines, keyed by the UserStorySettings choice values.
+# Built once at import so get_system_prompt_presets() only does lookups.
+_AGE_LINES = {
+    '3-5': '- Length: 200-300 words, basic words, short sentences',
+    '6-8': '- Length: 400-500 words, introduce morals, engaging challenges',
+    '9-12': '- Length: 600-700 words, encourage critical thinking, deeper themes',
+}
+_AGE_LINE_DEFAULT = '- Length: 400-500 words'
+
+_GENRE_LINES = {
+    'fantasy': '- Genre: Fantasy elements (magic, wizards, dragons)',
+    'adventure': '- Genre: Adventure elements (quests, treasure, exploration)',
+    'sci-fi': '- Genre: Science fiction elements (space, robots, technology)',
+    'mystery': '- Genre: Mystery elements (clues, puzzles, detective work)',
+    'educational': '- Genre: Educational elements (facts, learning moments)',
+    'mixed': '- Genre: Mix fantasy, adventure, and real-world elements',
+}
+_GENRE_LINE_DEFAULT = '- Genre: Mixed'
+
+_MORAL_LINES = {
+    theme: f'- Moral: Always end with a positive lesson on {theme}'
+    for theme in ('friendship', 'kindness', 'bravery', 'curiosity', 'teamwork', 'growth', 'empathy')
+}
+_MORAL_LINES['mixed'] = '- Moral: Always end with a positive lesson on empathy, teamwork, or growth'
+
+
+@functools.lru_cache(maxsize=64)
+def _custom_moral_line(theme):
+    """Preset line for a moral theme outside UserStorySettings.MORAL_THEMES, formatted once per theme."""
+    return f'- Moral: Always end with a positive lesson on {theme}'
+
+_LANGUAGE_LINES = {
+    'simple': '- Language Level: Use simple words; explain any complex ones',
+    'moderate': '- Language Level: Use moderate vocabulary; explain complex terms',
+    'advanced': '- Language Level: Use rich vocabulary; provide context for complex terms',
+}
+_LANGUAGE_LINE_DEFAULT = '- Language Level: Moderate'
+
+# Bits of UserStorySettings.flags
+_FLAG_DIVERSITY = 1
+_FLAG_SENSORY_DETAILS = 2
+_FLAG_INTERACTIVE_QUESTIONS = 4
+_FLAG_SOUND_EFFECTS = 8
+_FLAG_EXPLAIN_COMPLEX_WORDS = 16
+_ALL_FLAGS = 0b11111
+
+_DIVERSITY_LINE = '- Diversity: Include diverse characters from different backgrounds and abilities'
+_SENSORY_LINE = '- Engagement: Add sensory details (sights, sounds) to make stories vivid'
+_QUESTIONS_LINE = '- Engagement: Add questions mid-story to pause for user input'
+_SOUND_EFFECTS_LINE = "- Style: Include sound effects (e.g., 'Whoosh!', 'Bang!') for excitement"
+
+# Optional lines for every flags value, split into those before and after the language line
+_FLAG_LINES = {
+    flags: (
+        tuple(line for mask, line in (
+            (_FLAG_DIVERSITY, _DIVERSITY_LINE),
+            (_FLAG_SENSORY_DETAILS, _SENSORY_LINE),
+            (_FLAG_INTERACTIVE_QUESTIONS, _QUESTIONS_LINE),
+        ) if flags & mask),
+        (_SOUND_EFFECTS_LINE,) if flags & _FLAG_SOUND_EFFECTS else (),
+    )
+    for flags in range(_ALL_FLAGS + 1)
+}
+
+
+# Settings values are hashable, so profiles shared by many users are built only once
+@functools.lru_cache(maxsize=512)
+def _presets_for_profile(age_range, genre_preference, moral_theme, language_level, flags):
+    """
+    Return the system prompt preset string for one combination of settings.
+    
+    Args:
+        age_range: UserStorySettings.age_range value
+        genre_preference: UserStorySettings.genre_preference value
+        moral_theme: UserStorySettings.moral_theme value
+        language_level: UserStorySettings.language_level value
+        flags: UserStorySettings.flags bitmask
+    
+    Returns:
+        str: Newline-separated preset lines, the same object for every user with this profile
+    """
+    before_language, after_language = _FLAG_LINES[flags & _ALL_FLAGS]
+    # Interned so equal profiles share one string even if cached under different keys
+    return sys.intern("\n".join((
+        _AGE_LINES.get(age_range, _AGE_LINE_DEFAULT),
+        _GENRE_LINES.get(genre_preference, _GENRE_LINE_DEFAULT),
+        _MORAL_LINES.get(moral_theme) or _custom_moral_line(moral_theme),
+        *before_language,
+        _LANGUAGE_LINES.get(language_level, _LANGUAGE_LINE_DEFAULT),
+        *after_language,
+    )))
+
+
+def _settings_flag(mask):
+    """Expose one bit of UserStorySettings.flags as a boolean attribute."""
+    def getter(self):
+        return bool(self.flags & mask)
+
+    def setter(self, value):
+        self.flags = self.flags | mask if value else self.flags & ~mask
+
+    return property(getter, setter)
+
 
 class UserStorySettings(models.Model):
     """User settings for story generation that apply to all stories created by the user."""
@@ -764,19 +1266,11 @@ class UserStorySettings(models.Model):
         help_text="Preferred moral themes in stories"
     )
     
-    include_diversity = models.BooleanField(
-        default=True,
-        help_text="Include diverse characters from different backgrounds and abilities"
-    )
-    
-    include_sensory_details = models.BooleanField(
-        default=True,
-        help_text="Add sensory details (sights, sounds) to make stories more engaging"
-    )
-    
-    include_interactive_questions = models.BooleanField(
-        default=True,
-        help_text="Add questions mid-story to pause for user input"
+    # include_* / explain_complex_words toggles packed into one column; see the
+    # boolean properties below
+    flags = models.SmallIntegerField(
+        default=_ALL_FLAGS,
+        help_text="Bitmask of the story content toggles (all enabled by default)"
     )
     
     max_word_count = models.IntegerField(
@@ -790,86 +1284,134 @@ class UserStorySettings(models.Model):
         help_text="Number of story parts/sections (default: 5, range: 3-8)"
     )
     
-    # Additional preferences
-    include_sound_effects = models.BooleanField(
-        default=True,
-        help_text="Include sound effects in stories (e.g., 'Whoosh!', 'Bang!')"
-    )
-    
-    explain_complex_words = models.BooleanField(
-        default=True,
-        help_text="Explain complex words in simple terms for younger readers"
-    )
+    include_diversity = _settings_flag(_FLAG_DIVERSITY)
+    include_sensory_details = _settings_flag(_FLAG_SENSORY_DETAILS)
+    include_interactive_questions = _settings_flag(_FLAG_INTERACTIVE_QUESTIONS)
+    include_sound_effects = _settings_flag(_FLAG_SOUND_EFFECTS)
+    explain_complex_words = _settings_flag(_FLAG_EXPLAIN_COMPLEX_WORDS)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = UserStorySettingsManager()
+    
     class Meta:
         verbose_name = 'User Story Settings'
         verbose_name_plural = 'User Story Settings'
-        ordering = ['-updated_at']
     
     def __str__(self):
         return f"Story Settings for {self.user.username}"
     
-    def get_system_prompt_presets(self):
-        """Generate preset string for system prompt based on user settings."""
-        presets = []
-        
-        # Age range and length
-        age_info = {
-            '3-5': '200-300 words, basic words, short sentences',
-            '6-8': '400-500 words, introduce morals, engaging challenges',
-            '9-12': '600-700 words, encourage critical thinking, deeper themes'
-        }
-        presets.append(f"- Length: {age_info.get(self.age_range, '400-500 words')}")
-        
-        # Genre
-        genre_info = {
-            'fantasy': 'Fantasy elements (magic, wizards, dragons)',
-            'adventure': 'Adventure elements (quests, treasure, exploration)',
-            'sci-fi': 'Science fiction elements (space, robots, technology)',
-            'mystery': 'Mystery elements (clues, puzzles, detective work)',
-            'educational': 'Educational elements (facts, learning moments)',
-            'mixed': 'Mix fantasy, adventure, and real-world elements'
-        }
-        presets.append(f"- Genre: {genre_info.get(self.genre_preference, 'Mixed')}")
-        
-        # Moral theme
-        if self.moral_theme != 'mixed':
-            presets.append(f"- Moral: Always end with a positive lesson on {self.moral_theme}")
-        else:
-            presets.append("- Moral: Always end with a positive lesson on empathy, teamwork, or growth")
-        
-        # Diversity
-        if self.include_diversity:
-            presets.append("- Diversity: Include diverse characters from different backgrounds and abilities")
-        
-        # Engagement
-        if self.include_sensory_details:
-            presets.append("- Engagement: Add sensory details (sights, sounds) to make stories vivid")
-        
-        if self.include_interactive_questions:
-            presets.append("- Engagement: Add questions mid-story to pause for user input")
+    CACHE_KEY = 'user_story_settings:{user_id}'
+    # Short, so a write that bypasses save()/delete() (e.g. queryset.update()) is stale only briefly
+    CACHE_TIMEOUT = 300
+    
+    # Columns needed to build the system prompt; see StorySettingsRow
+    RAW_FIELDS = (
+        'age_range', 'genre_preference', 'language_level', 'moral_theme',
+        'flags', 'max_word_count', 'story_parts',
+    )
+    
+    @classmethod
+    def get_for_user(cls, user_id):
+        """
+        Return the user's settings row or None, cached since they're read on every story generation.
         
-        # Language level
-        language_info = {
-            'simple': 'Use simple words; explain any complex ones',
-            'moderate': 'Use moderate vocabulary; explain complex terms',
-            'advanced': 'Use rich vocabulary; provide context for complex terms'
-        }
-        presets.append(f"- Language Level: {language_info.get(self.language_level, 'Moderate')}")
+        save() and delete() drop the entry, which only reaches other workers when the default
+        cache is shared (see CACHE_REDIS_URL in settings); with the per-process LocMemCache a
+        save in one worker leaves the others serving the old row for up to CACHE_TIMEOUT.
+        """
+        key = cls.CACHE_KEY.format(user_id=user_id)
+        settings_obj = cache.get(key)
+        if settings_obj is None:
+            settings_obj = cls.get_raw(user_id)
+            # Cache a miss as False so users without settings don't hit the database each time
+            cache.set(key, settings_obj or False, cls.CACHE_TIMEOUT)
+        return settings_obj or None
+    
+    @classmethod
+    def get_raw(cls, user_id):
+        """
+        Fetch the prompt-building columns with a plain cursor, skipping model instantiation.
         
-        # Sound effects
-        if self.include_sound_effects:
-            presets.append("- Style: Include sound effects (e.g., 'Whoosh!', 'Bang!') for excitement")
+        Args:
+            user_id: ID of the user whose settings to load
         
-        return "\n".join(presets)
+        Returns:
+            StorySettingsRow or None: Read-only row with the preset string prebuilt
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(_USER_STORY_SETTINGS_SQL, [user_id])
+            row = cursor.fetchone()
+        if not row:
+            return None
+        # Build the preset string once; it is cached along with the row by get_for_user
+        settings_row = StorySettingsRow._make((*row, None))
+        return settings_row._replace(presets=settings_row._build_system_prompt_presets())
+    
+    def save(self, *args, **kwargs):
+        """Invalidate the cached settings for this user."""
+        super().save(*args, **kwargs)
+        cache.delete(self.CACHE_KEY.format(user_id=self.user_id))
+    
+    def delete(self, *args, **kwargs):
+        """Invalidate the cached settings for this user."""
+        cache.delete(self.CACHE_KEY.format(user_id=self.user_id))
+        return super().delete(*args, **kwargs)
+    
+    def get_system_prompt_presets(self):
+        """Return the preset string; _presets_for_profile caches it per combination of settings."""
+        return self._build_system_prompt_presets()
+    
+    def _build_system_prompt_presets(self):
+        """Generate preset string for system prompt based on user settings."""
+        return _presets_for_profile(
+            self.age_range, self.genre_preference, self.moral_theme, self.language_level, self.flags,
+        )
+
+
+_USER_STORY_SETTINGS_SQL = (
+    f"SELECT {', '.join(UserStorySettings.RAW_FIELDS)} "
+    f"FROM {UserStorySettings._meta.db_table} WHERE user_id = %s"
+)
+
+
+class StorySettingsRow(namedtuple('StorySettingsRow', UserStorySettings.RAW_FIELDS + ('presets',))):
+    """Lightweight stand-in for UserStorySettings on the story generation path."""
+    __slots__ = ()
+    
+    _build_system_prompt_presets = UserStorySettings._build_system_prompt_presets
+    
+    def get_system_prompt_presets(self):
+        """Return the preset string built when the row was loaded."""
+        return self.presets
+
+
+class SecondsBetween(models.Func):
+    """Whole seconds from one datetime expression to another; NULL while either is NULL."""
+    arity = 2
+    output_field = models.IntegerField()
+    
+    # Only deterministic built-ins, so the expression can back a generated column
+    templates = {
+        'mysql': 'TIMESTAMPDIFF(SECOND, %(start)s, %(end)s)',
+        'sqlite': 'CAST(ROUND((julianday(%(end)s) - julianday(%(start)s)) * 86400000) / 1000 AS INTEGER)',
+    }
+    default_template = 'CAST(TRUNC(EXTRACT(EPOCH FROM (%(end)s - %(start)s))) AS integer)'
+    
+    def as_sql(self, compiler, connection, **extra_context):
+        start, end = self.get_source_expressions()
+        start_sql, start_params = compiler.compile(start)
+        end_sql, end_params = compiler.compile(end)
+        template = self.templates.get(connection.vendor, self.default_template)
+        params = (*start_params, *end_params) if template.index('%(start)s') < template.index('%(end)s') else (*end_params, *start_params)
+        return template % {'start': start_sql, 'end': end_sql}, params
 
 
 class StorySession(models.Model):
     """Model for tracking story listening sessions."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered UUIDv7 keeps inserts sequential in the clustered PK index
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     story = models.ForeignKey(
         Story,
         on_delete=models.CASCADE,
@@ -882,6 +1424,8 @@ class StorySession(models.Model):
         related_name='story_sessions',
         help_text="User who listened to the story"
     )
+    # Set in Python rather than by db_default=Now(): MySQL has no INSERT ... RETURNING,
+    # so a database default would cost a SELECT after every insert to read it back
     started_at = models.DateTimeField(
         auto_now_add=True,
         help_text="When the listening session started"
@@ -891,24 +1435,39 @@ class StorySession(models.Model):
         blank=True,
         help_text="When the listening session ended"
     )
-    duration_seconds = models.IntegerField(
-        null=True,
-        blank=True,
+    # Computed and stored by the database whenever started_at/ended_at change
+    duration_seconds = models.GeneratedField(
+        expression=SecondsBetween('started_at', 'ended_at'),
+        output_field=models.IntegerField(null=True, blank=True),
+        db_persist=True,
         help_text="Duration of the session in seconds"
     )
+    # Deliberately no db_index: a two-value column makes a poor standalone index and
+    # costs every insert. Filtering on it, including completed=False for unfinished
+    # sessions, is served by storysession_usr_cmp_start_i in Meta.indexes.
     completed = models.BooleanField(
         default=False,
         help_text="Whether the story was listened to completion"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = StorySessionManager()
+
     class Meta:
-        ordering = ['-started_at']
+        # No default ordering so count()/aggregate() queries skip the ORDER BY;
+        # list views order by -started_at explicitly, matching the indexes below
         verbose_name = 'Story Session'
         verbose_name_plural = 'Story Sessions'
         indexes = [
-            models.Index(fields=['user', '-started_at']),
+            # Covers the session-table side of the recent-sessions list so it never reads
+            # the rows. MySQL has no INCLUDE (Django skips such indexes there), so the
+            # listed columns trail the key instead.
+            models.Index(
+                fields=['user', '-started_at', 'story', 'ended_at', 'duration_seconds', 'completed'],
+                name='storysession_usr_start_cov_i',
+            ),
+            # Also serves "continue listening" (completed=False) lookups; MySQL has no partial indexes
+            models.Index(fields=['user', 'completed', '-started_at'], name='storysession_usr_cmp_start_i'),
             models.Index(fields=['story', '-started_at']),
             models.Index(fields=['-started_at']),
         ]
@@ -916,15 +1475,29 @@ class StorySession(models.Model):
     def __str__(self):
         return f"Session for {self.story.title} by {self.user.username} at {self.started_at}"
     
-    def calculate_duration(self):
-        """Calculate duration in seconds if ended_at is set."""
-        if self.ended_at and self.started_at:
-            delta = self.ended_at - self.started_at
-            return int(delta.total_seconds())
-        return None
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded ended_at so save() can tell whether the duration changed
+        instance._loaded_ended_at = instance.__dict__.get('ended_at')
+        return instance
     
     def save(self, *args, **kwargs):
-        """Auto-calculate duration before saving."""
-        if self.ended_at and self.started_at:
-            self.duration_seconds = self.calculate_duration()
+        """Save, reloading the database-computed duration only when ended_at changed."""
+        update_fields = kwargs.get('update_fields')
+        ended_at_changed = (
+            (update_fields is None or 'ended_at' in update_fields)
+            and 'ended_at' in self.__dict__
+            and self.ended_at != getattr(self, '_loaded_ended_at', None)
+        )
         super().save(*args, **kwargs)
+        if ended_at_changed:
+            self._loaded_ended_at = self.ended_at
+            self.refresh_from_db(fields=['duration_seconds'])
+    
+    @classmethod
+    def bulk_end(cls, queryset, when=None):
+        """End every still-open session in queryset with one UPDATE; the database fills in durations."""
+        when = when or timezone.now()
+        return queryset.filter(ended_at__isnull=True).update(ended_at=when, updated_at=when)
+    
@@ -18,36 +18,403 @@ import boto3
 import json
 import os
 import base64
+import functools
+import hashlib
 import io
+import re
 import struct
+import threading
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from django.conf import settings
-from botocore.exceptions import ClientError
+from django.core.cache import cache
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+# End of a sentence followed by whitespace; streamed story text is cut for Polly here
+_SENTENCE_END = re.compile(r'[.!?]+["\')\]]*\s+')
+
+# Longest text sent in one Polly request; Polly rejects more than 3000 characters
+_POLLY_MAX_CHARS = 2500
+
+# Longest text whose audio is memoized; the lines that recur (intros, outros, morals)
+# are short, and streamed chunks up to _POLLY_MAX_CHARS would each hold megabytes of PCM
+_POLLY_CACHE_MAX_CHARS = 300
+
+# Words of a prompt; case, spacing and punctuation don't change the story cache key
+_WORDS = re.compile(r'\w+')
+
+# Output budget per age range; the base prompt asks for at most 300/500/700 words,
+# and a smaller maxTokens gets the first tokens back sooner
+_AGE_TO_MAX_TOKENS = {'3-5': 450, '6-8': 800, '9-12': 1100}
+_DEFAULT_MAX_TOKENS = 1000
+
+# Input audio format for Nova Sonic requests (16kHz mono PCM)
+_SONIC_INPUT_AUDIO_FORMAT = {"format": "pcm", "sampleRate": 16000, "channels": 1}
+
+# Shared stand-in for a contentBlockDelta without a 'delta'; never mutated
+_EMPTY_DELTA = {}
+
+# Non-audio items yielded by NovaSonicStream alongside the raw audio bytes
+TextChunk = namedtuple('TextChunk', 'content')
+MetadataChunk = namedtuple('MetadataChunk', 'content')
+
+# First image in a Titan ("images": ["..."]) or Stable Diffusion ("artifacts": [{"base64": "..."}])
+# response body; anything unusual (escapes, other layouts) is left to the JSON parser
+_IMAGE_BASE64 = re.compile(
+    rb'"(?:images|artifacts)"\s*:\s*\[\s*(?:\{[^{}\[\]]*?"base64"\s*:\s*)?"([A-Za-z0-9+/=]+)"'
+)
+
+
+def _json_dumps(data):
+    """Serialize a request body; orjson returns bytes, which boto3 accepts as is."""
+    return orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data)
+
+
+def _json_loads(raw):
+    """Parse a response body, with orjson when available (much faster on multi-MB image payloads)."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def _b64decode(data):
+    """Decode base64 audio/image data, with pybase64's SIMD decoder when available."""
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64decode(data, validate=True)
+    return base64.b64decode(data)
+
+
+@dataclass(frozen=True)
+class _AWSConfig:
+    """AWS settings read from the environment once per process."""
+    region: str
+    access_key: str
+    secret_key: str
+    performance_config: str
+    pool_size: int
+
+
+@functools.cache
+def _aws_config():
+    """
+    Read and validate the AWS environment on first use.
+    
+    Loaded lazily so .env has been applied by settings; a failed lookup is not cached,
+    so credentials added later are still picked up.
+    
+    Returns:
+        _AWSConfig: Region, credentials and Bedrock client tuning
+    
+    Raises:
+        ValueError: If AWS credentials are not configured
+    """
+    access_key = os.getenv('AWS_ACCESS_KEY_ID')
+    secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
+    if not access_key or not secret_key:
+        raise ValueError(
+            "AWS credentials not found. Please set AWS_ACCESS_KEY_ID and "
+            "AWS_SECRET_ACCESS_KEY in your .env file."
+        )
+    return _AWSConfig(
+        region=os.getenv('AWS_BEDROCK_REGION', os.getenv('AWS_REGION', 'us-east-1')),
+        access_key=access_key,
+        secret_key=secret_key,
+        # Latency-optimized inference for converse calls ("optimized" or "standard")
+        performance_config=os.getenv('AWS_BEDROCK_LATENCY', 'optimized'),
+        pool_size=int(os.getenv('AWS_BEDROCK_POOL_SIZE', '50'))
+    )
+
+# boto3 clients are thread-safe, so one per service/region/key is shared process-wide
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(service_name, region, aws_access_key, aws_secret_key):
+    """
+    Return the shared boto3 client for a service, creating it on first use.
+    
+    Args:
+        service_name (str): boto3 service name ('bedrock-runtime', 'polly')
+        region (str): AWS region
+        aws_access_key (str): AWS access key ID
+        aws_secret_key (str): AWS secret access key
+    
+    Returns:
+        botocore.client.BaseClient: Client reused across NovaService instances
+    """
+    key = (service_name, region, aws_access_key)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                # Pool sized for concurrent story generation (threads per worker x workers);
+                # the botocore default of 10 drops connections and redoes TLS handshakes
+                config = Config(
+                    max_pool_connections=_aws_config().pool_size,
+                    retries={'max_attempts': 3, 'mode': 'adaptive'},
+                    connect_timeout=5,
+                    read_timeout=120,
+                    tcp_keepalive=True
+                )
+                client = _clients[key] = boto3.client(
+                    service_name,
+                    region_name=region,
+                    aws_access_key_id=aws_access_key,
+                    aws_secret_access_key=aws_secret_key,
+                    config=config
+                )
+    return client
+
+
+# Base system prompt based on user requirements
+_BASE_SYSTEM_PROMPT = """You are Ace Storyteller, a fun, positive AI companion for kids aged 3-12. Your role is to create interactive, educational stories that spark imagination, teach gentle lessons, and adapt to the child's input. Always keep stories age-appropriate: short and simple for younger kids (3-5: 200-300 words, basic words), engaging with some challenges for mid-ages (6-8: 400-500 words, introduce morals), and adventurous with deeper themes for older kids (9-12: 600-700 words, encourage critical thinking).
+
+Core Rules:
+- Themes: Positive, inclusive, adventurous. Focus on friendship, kindness, bravery, curiosity, and learning from mistakes. Avoid scary, violent, or negative elements.
+- Structure: 4-6 parts with a beginning (setup characters/world), middle (adventure/challenge), end (resolution + moral). Pause for input if interactive.
+- Language: Simple vocabulary, short sentences for young kids; build complexity for older. Use repetition for learners. Make it vivid and fun with sounds (e.g., "Whoosh!").
+- Adaptation: Incorporate user details exactly (e.g., if they say "pet robot", add it seamlessly). If multimodal (e.g., image description), weave it in (e.g., "The hero found your drawn castle!").
+- End: Always include a moral (e.g., "Friendship makes us stronger") and a question to continue (e.g., "What happens next?").
+
+If age is specified, adjust accordingly. If not, default to 6-8. Start narrating in an expressive, storytelling voice."""
+
+_TEMPLATE_PROMPTS = {
+    "adventure": "Create an exciting adventure story with brave heroes, exciting quests, and amazing discoveries. Include elements like treasure, maps, and overcoming challenges.",
+    "fantasy": "Create a magical fantasy story with wizards, dragons, enchanted lands, and mystical creatures. Include elements like magic spells, quests, and good vs. evil.",
+    "sci-fi": "Create a science fiction story with space travel, robots, futuristic technology, and alien worlds. Include elements like spaceships, planets, and scientific discoveries.",
+    "mystery": "Create a mystery story with clues, puzzles, detective work, and solving problems. Include elements like hidden objects, secret codes, and finding answers.",
+    "educational": "Create an educational story that teaches while entertaining. Include facts, learning moments, and positive messages about topics like nature, science, or history."
+}
+
+# Ready-made prompt tail per template; unknown templates get the adventure style
+_TEMPLATE_STYLES = {
+    name: f"\n\nTemplate Style: {instruction}" for name, instruction in _TEMPLATE_PROMPTS.items()
+}
+
+
+# Story part header lines: "### Part 5" (markdown), "Chapter 2: ..." (labelled) or "3. ..." (numbered)
+_PART_HEADER = re.compile(
+    r'(?i)(?:#{1,6}\s+(?:Part|Chapter|Scene)\s+(?P<markdown>\d+)\s*$'
+    r'|(?:Part|Chapter|Scene)\s+(?P<labelled>\d+)[:.]\s*(?P<labelled_text>.*)'
+    r'|(?P<numbered>\d+)[:.]\s+(?P<numbered_text>.*))'
+)
+_PART_HEADER_FIRST_CHARS = frozenset('#0123456789PpCcSs')
+
+# Models that rejected a system prompt cache checkpoint with a ValidationException
+_models_without_prompt_cache = set()
+
+# Models that rejected performanceConfig={'latency': 'optimized'} with a ValidationException
+_models_without_latency_optimization = set()
+
+
+def _cached_system_blocks(system_prompt):
+    """
+    Split a system prompt into Converse blocks with a cache checkpoint after the static base prompt.
+    
+    Args:
+        system_prompt (str): Output of _build_system_prompt()
+    
+    Returns:
+        list: System content blocks for the Converse API
+    """
+    if not system_prompt.startswith(_BASE_SYSTEM_PROMPT):
+        return [{"text": system_prompt}]
+    return [
+        {"text": _BASE_SYSTEM_PROMPT},
+        {"cachePoint": {"type": "default"}},
+        {"text": system_prompt[len(_BASE_SYSTEM_PROMPT):].lstrip("\n")},
+    ]
+
+@functools.lru_cache(maxsize=128)
+def _build_system_prompt(template, presets=None):
+    """
+    Build the system prompt for a story template and user preset string.
+    
+    Args:
+        template (str): Story template type
+        presets (str, optional): Output of get_system_prompt_presets(), if the user has settings
+    
+    Returns:
+        str: System prompt for the template with the presets applied
+    """
+    # Templates are stored lowercase, so lower() only runs for unusual input
+    template_style = _TEMPLATE_STYLES.get(template) or _TEMPLATE_STYLES.get(template.lower(), _TEMPLATE_STYLES["adventure"])
+    if presets is None:
+        return _BASE_SYSTEM_PROMPT + template_style
+    return f"{_BASE_SYSTEM_PROMPT}\n\nPresets:\n{presets}{template_style}"
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_story_parts(story_text):
+    """
+    Split story text into numbered parts; see NovaService.parse_story_parts().
+    
+    Args:
+        story_text (str): Full story text
+    
+    Returns:
+        tuple: (number, text) pairs sorted by number
+    """
+    # splitlines() also drops the '\r' of CRLF text, so part text comes back with plain newlines
+    lines = story_text.splitlines()
+    
+    # One pass over the lines, noting every header as (line index, number, text after the header)
+    headers = {'markdown': [], 'labelled': [], 'numbered': []}
+    match_header = _PART_HEADER.match
+    for index, line in enumerate(lines):
+        line = line.strip()
+        # Most lines are prose; only run the regex on ones that could start a header
+        if not line or line[0] not in _PART_HEADER_FIRST_CHARS:
+            continue
+        match = match_header(line)
+        if match is None:
+            continue
+        for kind in headers:
+            if match[kind] is not None:
+                headers[kind].append((index, int(match[kind]), match.groupdict().get(f'{kind}_text')))
+                break
+    
+    # Markdown headers win, then "Part 1:"-style labels, then numbered sections;
+    # numbered sections only count if they're substantial (more than 50 chars)
+    parts = []
+    for kind, min_length in (('markdown', 0), ('labelled', 0), ('numbered', 50)):
+        kind_headers = headers[kind]
+        for position, (index, number, first_line) in enumerate(kind_headers):
+            end = kind_headers[position + 1][0] if position + 1 < len(kind_headers) else len(lines)
+            body = lines[index + 1:end]
+            part_text = '\n'.join([first_line, *body] if first_line is not None else body).strip()
+            if part_text and len(part_text) > min_length:
+                parts.append((number, part_text))
+        if parts:
+            break
+    
+    # If still no parts found, return the entire story as a single scene
+    if not parts:
+        parts.append((1, story_text.strip()))
+    
+    # Sort by number to ensure correct order
+    parts.sort(key=lambda part: part[0])
+    return tuple(parts)
+
+
+def _polly_pcm(polly_client, text, voice_id, language_code):
+    """
+    Synthesize text to 16kHz PCM with Polly.
+    
+    Args:
+        polly_client: Shared boto3 Polly client
+        text (str): Text to convert to speech
+        voice_id (str): Voice ID, or None for the language default
+        language_code (str): Language code
+    
+    Returns:
+        bytes: Audio data in PCM format (16kHz)
+    """
+    from .utils import text_to_audio_pcm
+    return text_to_audio_pcm(
+        text,
+        polly_client=polly_client,
+        language_code=language_code,
+        sample_rate=16000,
+        voice_id=voice_id
+    )
+
+
+# Only texts up to _POLLY_CACHE_MAX_CHARS (well under 1MB of PCM each) are kept
+@functools.lru_cache(maxsize=32)
+def _short_polly_pcm(polly_client, text, voice_id, language_code):
+    """
+    Synthesize a short text with _polly_pcm, remembering recent results.
+    """
+    return _polly_pcm(polly_client, text, voice_id, language_code)
+
+def _call_with_performance_config(operation, performance_config, **kwargs):
+    """
+    Call a Bedrock converse operation with latency-optimized inference when configured.
+    
+    Models and regions without latency-optimized inference reject performanceConfig
+    with a ValidationException naming the latency setting, so the call is retried once
+    with standard latency; if that retry succeeds, later calls for that model go
+    straight to standard latency. Other validation errors are raised unchanged.
+    
+    Args:
+        operation: Bound client method (converse or converse_stream)
+        performance_config (str): "optimized" or "standard"
+        **kwargs: Arguments for the operation
+    
+    Returns:
+        dict: The operation's response
+    """
+    model_id = kwargs.get('modelId')
+    if performance_config == 'optimized' and model_id not in _models_without_latency_optimization:
+        try:
+            return operation(performanceConfig={'latency': performance_config}, **kwargs)
+        except ClientError as e:
+            error = e.response.get('Error', {})
+            message = error.get('Message', '').lower()
+            if error.get('Code') != 'ValidationException' or not ('latency' in message or 'performanceconfig' in message):
+                raise
+        response = operation(**kwargs)
+        _models_without_latency_optimization.add(model_id)
+        return response
+    return operation(**kwargs)
+
+
+def _polly_chunks(text, max_chars=_POLLY_MAX_CHARS):
+    """
+    Split text into runs of whole sentences that each fit in one Polly request.
+    
+    Args:
+        text (str): Text to split
+        max_chars (int): Longest run to yield
+    
+    Yields:
+        str: Consecutive pieces of text, each at most max_chars long
+    """
+    start = 0
+    while len(text) - start > max_chars:
+        window_end = start + max_chars
+        cut = start
+        for match in _SENTENCE_END.finditer(text, start, window_end):
+            cut = match.end()
+        if cut == start:
+            # A single sentence longer than max_chars: break it at the last space
+            cut = text.rfind(' ', start, window_end) + 1 or window_end
+        yield text[start:cut]
+        start = cut
+    if text[start:].strip():
+        yield text[start:]
 
 
 class NovaService:
     """Service for interacting with Amazon Nova models via Bedrock."""
     
+    # How long a generated story is reused for a repeat of the same prompt and settings
+    STORY_CACHE_TIMEOUT = 24 * 3600
+    
+    # How long Titan gets before Stable Diffusion XL is started alongside it
+    IMAGE_HEDGE_SECONDS = 10
+    
     def __init__(self):
         """Initialize Bedrock client with credentials from environment."""
-        self.region = os.getenv('AWS_BEDROCK_REGION', os.getenv('AWS_REGION', 'us-east-1'))
-        
-        # Get AWS credentials from environment
-        aws_access_key = os.getenv('AWS_ACCESS_KEY_ID')
-        aws_secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
-        
-        if not aws_access_key or not aws_secret_key:
-            raise ValueError(
-                "AWS credentials not found. Please set AWS_ACCESS_KEY_ID and "
-                "AWS_SECRET_ACCESS_KEY in your .env file."
-            )
+        aws = _aws_config()
+        self.region = aws.region
         
-        # Initialize Bedrock Runtime client
-        self.bedrock_runtime = boto3.client(
-            'bedrock-runtime',
-            region_name=self.region,
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key
-        )
+        # Bedrock Runtime client, shared with other instances in this process
+        self.bedrock_runtime = _get_client('bedrock-runtime', aws.region, aws.access_key, aws.secret_key)
         
         # Model IDs for Amazon Bedrock
         self.nova_lite_model = "amazon.nova-lite-v1:0"
@@ -60,17 +427,14 @@ class NovaService:
         self.titan_image_generator_model = "amazon.titan-image-generator-v2:0"  # Primary
         self.stable_diffusion_model = "stability.stable-diffusion-xl-base-v1:0"  # Fallback
         
+        self.performance_config = aws.performance_config
+        
         # Initialize Polly client for text-to-audio conversion (AWS-native)
         # Used in hybrid approach: Text → Polly (PCM) → Nova 2 Sonic → Enhanced PCM
         # Polly supports direct PCM output at 16kHz, perfect for Nova 2 Sonic input
-        self.polly_client = boto3.client(
-            'polly',
-            region_name=self.region,
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key
-        )
+        self.polly_client = _get_client('polly', aws.region, aws.access_key, aws.secret_key)
     
-    def generate_story(self, prompt, image_description=None, template="adventure", user_settings=None, return_system_prompt=False):
+    def generate_story(self, prompt, image_description=None, template="adventure", user_settings=None, return_system_prompt=False, bypass_cache=False):
         """
         Generate a story using Nova 2 Lite.
         
@@ -78,12 +442,41 @@ class NovaService:
             prompt (str): User's story prompt (e.g., "Tell me a story about a brave astronaut")
             image_description (str, optional): Description of uploaded image
             template (str): Story template type (adventure, fantasy, sci-fi, mystery, educational)
-            user_settings (UserStorySettings, optional): User's story generation settings
+            user_settings (UserStorySettings or StorySettingsRow, optional): User's story generation settings
             return_system_prompt (bool): If True, returns tuple (story_text, system_prompt)
+            bypass_cache (bool): If True, always generate a new story (e.g. when regenerating)
         
         Returns:
             str or tuple: Generated story text, or (story_text, system_prompt) if return_system_prompt=True
         
+        Raises:
+            Exception: If story generation fails
+        """
+        story_text = "".join(self.generate_story_stream(
+            prompt, image_description, template, user_settings, bypass_cache=bypass_cache
+        ))
+        
+        if return_system_prompt:
+            return story_text, self._get_system_prompt(template, user_settings)
+        return story_text
+    
+    def generate_story_stream(self, prompt, image_description=None, template="adventure", user_settings=None, bypass_cache=False):
+        """
+        Generate a story using Nova 2 Lite, yielding the text as it is produced.
+        
+        A story generated for the same system prompt and the same prompt words within
+        STORY_CACHE_TIMEOUT is yielded whole from the cache instead.
+        
+        Args:
+            prompt (str): User's story prompt
+            image_description (str, optional): Description of uploaded image
+            template (str): Story template type (adventure, fantasy, sci-fi, mystery, educational)
+            user_settings (UserStorySettings or StorySettingsRow, optional): User's story generation settings
+            bypass_cache (bool): If True, skip the cached story and store the new one in its place
+        
+        Yields:
+            str: Story text fragments, in order
+        
         Raises:
             Exception: If story generation fails
         """
@@ -95,30 +488,63 @@ class NovaService:
         if image_description:
             user_message += f"\n\nIncorporate this image into the story: {image_description}"
         
+        max_tokens = _DEFAULT_MAX_TOKENS
+        if user_settings:
+            max_tokens = _AGE_TO_MAX_TOKENS.get(user_settings.age_range, _DEFAULT_MAX_TOKENS)
+        
+        cache_key = self._story_cache_key(system_prompt, user_message)
+        if not bypass_cache:
+            cached_story = cache.get(cache_key)
+            if cached_story is not None:
+                yield cached_story
+                return
+        
+        parts = []
         try:
-            # Use Bedrock Converse API for Nova Lite
-            response = self.bedrock_runtime.converse(
-                modelId=self.nova_lite_model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [{"text": user_message}]
-                    }
-                ],
-                system=[{"text": system_prompt}],
-                inferenceConfig={
-                    "maxTokens": 2000,
-                    "temperature": 0.7,
-                    "topP": 0.9
-                }
-            )
-            
-            # Extract story text from response
-            story_text = response['output']['message']['content'][0]['text']
+            # Use Bedrock ConverseStream API for Nova Lite. Latency-optimized inference
+            # doesn't combine with prompt cache checkpoints, so each call uses one: the
+            # optimized latency tier where the model has it, otherwise a cachePoint after
+            # the static part of the system prompt where the model supports that
+            plain_system = [{"text": system_prompt}]
+            if self.performance_config == 'optimized' and self.nova_lite_model not in _models_without_latency_optimization:
+                system_variants = [(plain_system, self.performance_config)]
+            elif self.nova_lite_model not in _models_without_prompt_cache:
+                system_variants = [(_cached_system_blocks(system_prompt), 'standard'), (plain_system, 'standard')]
+            else:
+                system_variants = [(plain_system, 'standard')]
+            for system, performance_config in system_variants:
+                try:
+                    response = _call_with_performance_config(
+                        self.bedrock_runtime.converse_stream,
+                        performance_config,
+                        modelId=self.nova_lite_model,
+                        messages=[
+                            {
+                                "role": "user",
+                                "content": [{"text": user_message}]
+                            }
+                        ],
+                        system=system,
+                        inferenceConfig={
+                            "maxTokens": max_tokens,
+                            "temperature": 0.7,
+                            "topP": 0.9
+                        }
+                    )
+                    break
+                except ClientError as e:
+                    if system is system_variants[-1][0] or e.response.get('Error', {}).get('Code') != 'ValidationException':
+                        raise
+                    # Model rejected the cache checkpoint; send the plain prompt from now on
+                    _models_without_prompt_cache.add(self.nova_lite_model)
             
-            if return_system_prompt:
-                return story_text, system_prompt
-            return story_text
+            # Extract story text from the stream events
+            for event in response['stream']:
+                if 'contentBlockDelta' in event:
+                    text = event['contentBlockDelta'].get('delta', {}).get('text')
+                    if text:
+                        parts.append(text)
+                        yield text
             
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
@@ -129,6 +555,58 @@ class NovaService:
             )
         except Exception as e:
             raise Exception(f"Unexpected error generating story: {str(e)}")
+        
+        if parts:
+            cache.set(cache_key, "".join(parts), self.STORY_CACHE_TIMEOUT)
+    
+    def _story_cache_key(self, system_prompt, user_message):
+        """Cache key for a story; the message is reduced to its lowercased words."""
+        canonical_message = " ".join(_WORDS.findall(user_message.lower()))
+        digest = hashlib.sha256(
+            f"{self.nova_lite_model}\0{system_prompt}\0{canonical_message}".encode()
+        ).hexdigest()
+        return f"nova_story:{digest}"
+    
+    def generate_story_with_speech(self, prompt, image_description=None, template="adventure", user_settings=None, voice_id=None, language_code="en-US", bypass_cache=False):
+        """
+        Generate a story and synthesize its narration while the text is still streaming in.
+        
+        Args:
+            prompt (str): User's story prompt
+            image_description (str, optional): Description of uploaded image
+            template (str): Story template type (adventure, fantasy, sci-fi, mystery, educational)
+            user_settings (UserStorySettings or StorySettingsRow, optional): User's story generation settings
+            voice_id (str, optional): Polly voice ID. If None, uses default.
+            language_code (str): Language code (default: "en-US")
+            bypass_cache (bool): If True, always generate a new story (e.g. when regenerating)
+        
+        Returns:
+            tuple: (story_text, system_prompt, pcm_audio); pcm_audio is None if speech
+                synthesis failed, so callers can keep the story and retry the audio
+        
+        Raises:
+            Exception: If story generation fails
+        """
+        parts = []
+        story_complete = False
+        
+        def story_fragments():
+            nonlocal story_complete
+            for fragment in self.generate_story_stream(
+                prompt, image_description, template, user_settings, bypass_cache=bypass_cache
+            ):
+                parts.append(fragment)
+                yield fragment
+            story_complete = True
+        
+        try:
+            pcm_audio = self.synthesize_speech_stream(story_fragments(), voice_id=voice_id, language_code=language_code)
+        except Exception:
+            if not story_complete:
+                raise
+            pcm_audio = None
+        
+        return "".join(parts), self._get_system_prompt(template, user_settings), pcm_audio
     
     def synthesize_speech_from_text(self, text, voice_id=None, system_prompt=None, language_code="en-US"):
         """
@@ -151,18 +629,10 @@ class NovaService:
             Exception: If speech synthesis fails
         """
         try:
-            # Convert text to PCM audio using Amazon Polly (AWS-native, reliable)
-            from .utils import text_to_audio_pcm
-            
-            # Convert text to PCM audio using Amazon Polly (16kHz output)
-            # Pass voice_id to ensure correct voice is used
-            pcm_audio = text_to_audio_pcm(
-                text,
-                polly_client=self.polly_client,
-                language_code=language_code,
-                sample_rate=16000,
-                voice_id=voice_id  # Pass voice_id to text_to_audio_pcm
-            )
+            # Convert text to PCM audio using Amazon Polly (16kHz output); repeated
+            # short texts (shared intros/outros, morals) come from memory
+            synthesize = _short_polly_pcm if len(text) <= _POLLY_CACHE_MAX_CHARS else _polly_pcm
+            pcm_audio = synthesize(self.polly_client, text, voice_id, language_code)
             
             # Return 16kHz PCM audio directly (no upsampling to avoid distortion)
             return pcm_audio
@@ -170,6 +640,85 @@ class NovaService:
         except Exception as e:
             raise Exception(f"Error converting text to speech: {str(e)}")
     
+    def synthesize_speech_batch(self, texts, voice_id=None, language_code="en-US", max_workers=8):
+        """
+        Convert several texts (e.g. story parts) to speech concurrently.
+        
+        Polly has no batch API, so the texts are synthesized in parallel threads
+        sharing one Polly client, and each result is yielded as soon as it and
+        every text before it are ready. Texts longer than one Polly request are
+        split at sentence ends and their audio joined.
+        
+        Args:
+            texts (list of str): Texts to convert, in playback order
+            voice_id (str, optional): Voice ID. If None, uses default.
+            language_code (str): Language code (default: "en-US")
+            max_workers (int): Most Polly requests in flight at once
+        
+        Yields:
+            bytes: Audio data in PCM format (16kHz) for each text, in order
+        
+        Raises:
+            Exception: If speech synthesis fails
+        """
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            # Texts over Polly's request limit (e.g. a story without part headers) become several requests
+            futures = [
+                [
+                    pool.submit(self.synthesize_speech_from_text, chunk, voice_id=voice_id, language_code=language_code)
+                    for chunk in _polly_chunks(text)
+                ]
+                for text in texts
+            ]
+            for text_futures in futures:
+                yield b"".join(future.result() for future in text_futures)
+        finally:
+            # A caller that stops early doesn't wait for (or pay for) the remaining texts
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def synthesize_speech_stream(self, text_fragments, voice_id=None, language_code="en-US", min_chunk_chars=200):
+        """
+        Convert streamed text to speech, sending complete sentences to Polly as they arrive.
+        
+        Args:
+            text_fragments (iterable of str): Text in order, e.g. from generate_story_stream()
+            voice_id (str, optional): Voice ID. If None, uses default.
+            language_code (str): Language code (default: "en-US")
+            min_chunk_chars (int): Shortest text sent in one Polly request; shorter runs of
+                sentences wait for the next one
+        
+        Returns:
+            bytes: Audio data in PCM format (16kHz) for the whole text
+        
+        Raises:
+            Exception: If speech synthesis fails
+        """
+        futures = []
+        pending = ""
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for fragment in text_fragments:
+                pending += fragment
+                if len(pending) < min_chunk_chars:
+                    continue
+                cut = 0
+                for match in _SENTENCE_END.finditer(pending):
+                    cut = match.end()
+                if cut >= min_chunk_chars:
+                    # A large fragment (e.g. a cached story arriving whole) becomes several requests
+                    for chunk in _polly_chunks(pending[:cut]):
+                        futures.append(pool.submit(
+                            self.synthesize_speech_from_text, chunk,
+                            voice_id=voice_id, language_code=language_code
+                        ))
+                    pending = pending[cut:]
+            for chunk in _polly_chunks(pending):
+                futures.append(pool.submit(
+                    self.synthesize_speech_from_text, chunk,
+                    voice_id=voice_id, language_code=language_code
+                ))
+            return b"".join(future.result() for future in futures)
+    
     def synthesize_speech_from_audio(self, audio_bytes, system_prompt=None, language_code="en-US"):
         """
         Convert audio input to speech output using Nova 2 Sonic.
@@ -221,7 +770,8 @@ class NovaService:
             bedrock_client=self.bedrock_runtime,
             model_id=self.nova_sonic_model,
             system_prompt=system_prompt,
-            language_code=language_code
+            language_code=language_code,
+            performance_config=self.performance_config
         )
     
     def synthesize_speech(self, text, voice_id=None, language_code="en-US"):
@@ -239,7 +789,8 @@ class NovaService:
         Returns:
             bytes: Audio data in PCM format (16kHz)
         """
-        return self.synthesize_speech_from_text(text, voice_id=voice_id, language_code=language_code)
+        # Texts over Polly's request limit are split at sentence ends and synthesized in parallel
+        return self.synthesize_speech_stream((text,), voice_id=voice_id, language_code=language_code)
     
     def analyze_image(self, image_bytes, image_format="jpeg"):
         """
@@ -257,7 +808,9 @@ class NovaService:
         """
         try:
             # Use Bedrock Converse API with image input
-            response = self.bedrock_runtime.converse(
+            response = _call_with_performance_config(
+                self.bedrock_runtime.converse,
+                self.performance_config,
                 modelId=self.titan_embedding_model,
                 messages=[
                     {
@@ -316,14 +869,16 @@ class NovaService:
         return self.generate_story(
             prompt=new_prompt,
             image_description=image_description,
-            template=template
+            template=template,
+            bypass_cache=True
         )
     
     def generate_image(self, prompt, width=1024, height=1024, style_preset="photographic"):
         """
         Generate an image from a text prompt using Amazon Bedrock.
         
-        Tries Stable Diffusion XL first, falls back to Titan Image Generator if not available.
+        Tries Titan Image Generator first. Stable Diffusion XL is started as soon as Titan
+        fails or has run for IMAGE_HEDGE_SECONDS, and the first valid image wins.
         
         Args:
             prompt (str): Text prompt describing the image to generate
@@ -338,82 +893,35 @@ class NovaService:
             Exception: If image generation fails
         """
         errors = []
-        
-        # Try Titan Image Generator v2 first (most reliable for programmatic use)
+        pool = ThreadPoolExecutor(max_workers=2)
         try:
-            # Titan Image Generator v2 request format
-            request_body = {
-                "taskType": "TEXT_IMAGE",
-                "textToImageParams": {
-                    "text": prompt,
-                    "width": width,
-                    "height": height,
-                    "numberOfImages": 1
-                }
-            }
-            
-            response = self.bedrock_runtime.invoke_model(
-                modelId=self.titan_image_generator_model,
-                body=json.dumps(request_body),
-                contentType="application/json",
-                accept="application/json"
-            )
-            
-            response_body = json.loads(response['body'].read())
-            
-            # Titan v2 returns images in 'images' array as base64 strings
-            if 'images' in response_body and len(response_body['images']) > 0:
-                image_base64 = response_body['images'][0]
-                if image_base64:
-                    image_bytes = base64.b64decode(image_base64)
-                    return image_bytes
-            
-            errors.append("Titan Image Generator: Empty response")
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            error_message = e.response.get('Error', {}).get('Message', str(e))
-            errors.append(f"Titan Image Generator: {error_code} - {error_message}")
-        except Exception as e:
-            errors.append(f"Titan Image Generator: {str(e)}")
-        
-        # Try Stable Diffusion XL as fallback (uses InvokeModel)
-        try:
-            request_body = {
-                "text_prompts": [
-                    {
-                        "text": prompt,
-                        "weight": 1.0
-                    }
-                ],
-                "cfg_scale": 7,
-                "height": height,
-                "width": width,
-                "steps": 50,
-                "style_preset": style_preset
-            }
-            
-            response = self.bedrock_runtime.invoke_model(
-                modelId=self.stable_diffusion_model,
-                body=json.dumps(request_body),
-                contentType="application/json",
-                accept="application/json"
-            )
-            
-            response_body = json.loads(response['body'].read())
-            
-            if 'artifacts' in response_body and len(response_body['artifacts']) > 0:
-                image_base64 = response_body['artifacts'][0].get('base64')
-                if image_base64:
-                    image_bytes = base64.b64decode(image_base64)
-                    return image_bytes
-            
-            errors.append("Stable Diffusion XL: Empty response")
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            error_message = e.response.get('Error', {}).get('Message', str(e))
-            errors.append(f"Stable Diffusion XL: {error_code} - {error_message}")
-        except Exception as e:
-            errors.append(f"Stable Diffusion XL: {str(e)}")
+            pending = {pool.submit(self._generate_titan_image, prompt, width, height): "Titan Image Generator"}
+            fallback_started = False
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=None if fallback_started else self.IMAGE_HEDGE_SECONDS,
+                    return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    model_name = pending.pop(future)
+                    try:
+                        return future.result()
+                    except ClientError as e:
+                        error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                        error_message = e.response.get('Error', {}).get('Message', str(e))
+                        errors.append(f"{model_name}: {error_code} - {error_message}")
+                    except Exception as e:
+                        errors.append(f"{model_name}: {str(e)}")
+                
+                # Titan failed or is slow: start Stable Diffusion XL alongside it
+                if not fallback_started:
+                    fallback_started = True
+                    future = pool.submit(self._generate_sdxl_image, prompt, width, height, style_preset)
+                    pending[future] = "Stable Diffusion XL"
+        finally:
+            # Don't wait for a slower model whose image is no longer needed
+            pool.shutdown(wait=False)
         
         # All models failed
         raise Exception(
@@ -421,6 +929,82 @@ class NovaService:
             "\n\nPlease check your AWS Bedrock model access and ensure at least one image generation model is enabled in your region."
         )
     
+    def _generate_titan_image(self, prompt, width, height):
+        """Generate an image with Titan Image Generator v2, raising if none is returned."""
+        # Titan Image Generator v2 request format
+        request_body = {
+            "taskType": "TEXT_IMAGE",
+            "textToImageParams": {
+                "text": prompt,
+                "width": width,
+                "height": height,
+                "numberOfImages": 1
+            }
+        }
+        
+        response = self.bedrock_runtime.invoke_model(
+            modelId=self.titan_image_generator_model,
+            body=_json_dumps(request_body),
+            contentType="application/json",
+            accept="application/json"
+        )
+        
+        raw_body = response['body'].read()
+        
+        # Fast path: pull the base64 image straight out of the raw bytes
+        image_match = _IMAGE_BASE64.search(raw_body)
+        if image_match:
+            return _b64decode(image_match.group(1))
+        
+        response_body = _json_loads(raw_body)
+        
+        # Titan v2 returns images in 'images' array as base64 strings
+        if 'images' in response_body and len(response_body['images']) > 0:
+            image_base64 = response_body['images'][0]
+            if image_base64:
+                return _b64decode(image_base64)
+        
+        raise Exception("Empty response")
+    
+    def _generate_sdxl_image(self, prompt, width, height, style_preset):
+        """Generate an image with Stable Diffusion XL, raising if none is returned."""
+        request_body = {
+            "text_prompts": [
+                {
+                    "text": prompt,
+                    "weight": 1.0
+                }
+            ],
+            "cfg_scale": 7,
+            "height": height,
+            "width": width,
+            "steps": 50,
+            "style_preset": style_preset
+        }
+        
+        response = self.bedrock_runtime.invoke_model(
+            modelId=self.stable_diffusion_model,
+            body=_json_dumps(request_body),
+            contentType="application/json",
+            accept="application/json"
+        )
+        
+        raw_body = response['body'].read()
+        
+        # Fast path: pull the base64 image straight out of the raw bytes
+        image_match = _IMAGE_BASE64.search(raw_body)
+        if image_match:
+            return _b64decode(image_match.group(1))
+        
+        response_body = _json_loads(raw_body)
+        
+        if 'artifacts' in response_body and len(response_body['artifacts']) > 0:
+            image_base64 = response_body['artifacts'][0].get('base64')
+            if image_base64:
+                return _b64decode(image_base64)
+        
+        raise Exception("Empty response")
+    
     def parse_story_parts(self, story_text):
         """
         Parse story text to extract parts/chapters.
@@ -438,97 +1022,11 @@ class NovaService:
         Returns:
             list: List of dictionaries with 'number' and 'text' keys, or single item if no parts found
         """
-        import re
-        
         if not story_text or not story_text.strip():
             return []
         
-        parts = []
-        
-        # First, try markdown headers (### Part 5, ### Scene 5, ## Part 2, etc.)
-        # Pattern: ### Part 5, ### Scene 5, ## Chapter 3, etc.
-        markdown_pattern = r'(?i)^#{1,6}\s+(?:Part|Chapter|Scene)\s+(\d+)\s*$'
-        markdown_matches = list(re.finditer(markdown_pattern, story_text, re.MULTILINE))
-        
-        if markdown_matches:
-            # Split text by markdown headers
-            lines = story_text.split('\n')
-            current_part = None
-            current_text = []
-            
-            for line in lines:
-                # Check if this line is a markdown header
-                header_match = re.match(markdown_pattern, line.strip())
-                if header_match:
-                    # Save previous part if exists
-                    if current_part is not None:
-                        part_text = '\n'.join(current_text).strip()
-                        if part_text:
-                            parts.append({
-                                'number': current_part,
-                                'text': part_text
-                            })
-                    
-                    # Start new part
-                    current_part = int(header_match.group(1))
-                    current_text = []
-                else:
-                    # Add line to current part
-                    if current_part is not None:
-                        current_text.append(line)
-            
-            # Save last part
-            if current_part is not None:
-                part_text = '\n'.join(current_text).strip()
-                if part_text:
-                    parts.append({
-                        'number': current_part,
-                        'text': part_text
-                    })
-        
-        # If no markdown headers found, try regular patterns
-        if not parts:
-            # Patterns to match: "Part 1:", "Chapter 2:", "Scene 3:", etc.
-            part_patterns = [
-                r'(?i)^(?:Part|Chapter|Scene)\s+(\d+)[:\.]\s*(.+?)(?=(?:Part|Chapter|Scene)\s+\d+[:\.]|$)',
-                r'(?i)^(\d+)[:\.]\s+(.+?)(?=^\d+[:\.]|$)',  # Numbered sections (1., 2., etc.)
-            ]
-            
-            # Try first pattern (Part/Chapter/Scene)
-            matches = re.finditer(part_patterns[0], story_text, re.MULTILINE | re.DOTALL)
-            for match in matches:
-                part_num = int(match.group(1))
-                part_text = match.group(2).strip()
-                if part_text:
-                    parts.append({
-                        'number': part_num,
-                        'text': part_text
-                    })
-            
-            # If no parts found with first pattern, try numbered sections
-            if not parts:
-                matches = re.finditer(part_patterns[1], story_text, re.MULTILINE | re.DOTALL)
-                for match in matches:
-                    part_num = int(match.group(1))
-                    part_text = match.group(2).strip()
-                    # Only include if it's a substantial section (at least 50 chars)
-                    if part_text and len(part_text) > 50:
-                        parts.append({
-                            'number': part_num,
-                            'text': part_text
-                        })
-        
-        # If still no parts found, return the entire story as a single scene
-        if not parts:
-            parts.append({
-                'number': 1,
-                'text': story_text.strip()
-            })
-        
-        # Sort by number to ensure correct order
-        parts.sort(key=lambda x: x['number'])
-        
-        return parts
+        # Parsing is cached per text; fresh dicts keep callers from mutating the cached parts
+        return [{'number': number, 'text': text} for number, text in _parse_story_parts(story_text)]
     
     def _get_system_prompt(self, template, user_settings=None):
         """
@@ -536,39 +1034,14 @@ class NovaService:
         
         Args:
             template (str): Story template type
-            user_settings (UserStorySettings, optional): User's story generation settings
+            user_settings (UserStorySettings or StorySettingsRow, optional): User's story generation settings
         
         Returns:
             str: System prompt for the template with user settings applied
         """
-        # Base system prompt based on user requirements
-        base_prompt = """You are Ace Storyteller, a fun, positive AI companion for kids aged 3-12. Your role is to create interactive, educational stories that spark imagination, teach gentle lessons, and adapt to the child's input. Always keep stories age-appropriate: short and simple for younger kids (3-5: 200-300 words, basic words), engaging with some challenges for mid-ages (6-8: 400-500 words, introduce morals), and adventurous with deeper themes for older kids (9-12: 600-700 words, encourage critical thinking).
-
-Core Rules:
-- Themes: Positive, inclusive, adventurous. Focus on friendship, kindness, bravery, curiosity, and learning from mistakes. Avoid scary, violent, or negative elements.
-- Structure: 4-6 parts with a beginning (setup characters/world), middle (adventure/challenge), end (resolution + moral). Pause for input if interactive.
-- Language: Simple vocabulary, short sentences for young kids; build complexity for older. Use repetition for learners. Make it vivid and fun with sounds (e.g., "Whoosh!").
-- Adaptation: Incorporate user details exactly (e.g., if they say "pet robot", add it seamlessly). If multimodal (e.g., image description), weave it in (e.g., "The hero found your drawn castle!").
-- End: Always include a moral (e.g., "Friendship makes us stronger") and a question to continue (e.g., "What happens next?").
-
-If age is specified, adjust accordingly. If not, default to 6-8. Start narrating in an expressive, storytelling voice."""
-        
-        # Apply user settings if provided
-        if user_settings:
-            # Get preset string from user settings
-            presets = user_settings.get_system_prompt_presets()
-            base_prompt += f"\n\nPresets:\n{presets}"
-        
-        template_prompts = {
-            "adventure": "Create an exciting adventure story with brave heroes, exciting quests, and amazing discoveries. Include elements like treasure, maps, and overcoming challenges.",
-            "fantasy": "Create a magical fantasy story with wizards, dragons, enchanted lands, and mystical creatures. Include elements like magic spells, quests, and good vs. evil.",
-            "sci-fi": "Create a science fiction story with space travel, robots, futuristic technology, and alien worlds. Include elements like spaceships, planets, and scientific discoveries.",
-            "mystery": "Create a mystery story with clues, puzzles, detective work, and solving problems. Include elements like hidden objects, secret codes, and finding answers.",
-            "educational": "Create an educational story that teaches while entertaining. Include facts, learning moments, and positive messages about topics like nature, science, or history."
-        }
-        
-        template_instruction = template_prompts.get(template.lower(), template_prompts["adventure"])
-        return f"{base_prompt}\n\nTemplate Style: {template_instruction}"
+        # The preset string stands in for the settings, so the prompt can be cached on it
+        presets = user_settings.get_system_prompt_presets() if user_settings else None
+        return _build_system_prompt(template, presets)
 
 
 # Example usage (for testing)
@@ -602,6 +1075,10 @@ if __name__ == "__main__":
         sys.exit(1)
 
 
+class NovaSonicStreamError(RuntimeError):
+    """A Nova Sonic ConverseStream request or its response stream failed; the cause is chained."""
+
+
 class NovaSonicStream:
     """
     Handler for bidirectional streaming with Nova 2 Sonic.
@@ -610,7 +1087,7 @@ class NovaSonicStream:
     for real-time speech-to-speech conversations.
     """
     
-    def __init__(self, bedrock_client, model_id, system_prompt=None, language_code="en-US"):
+    def __init__(self, bedrock_client, model_id, system_prompt=None, language_code="en-US", performance_config="optimized", coalesce_bytes=8192):
         """
         Initialize Nova Sonic bidirectional stream.
         
@@ -619,12 +1096,24 @@ class NovaSonicStream:
             model_id: Nova Sonic model ID (amazon.nova-2-sonic-v1:0)
             system_prompt: System prompt for conversation context
             language_code: Language code (default: "en-US")
+            performance_config: Bedrock latency setting, "optimized" or "standard"
+            coalesce_bytes: Audio deltas are merged until this many bytes before being yielded (0 yields each delta)
         """
         self.bedrock_client = bedrock_client
         self.model_id = model_id
         self.system_prompt = system_prompt or "You are a helpful assistant."
         self.language_code = language_code
+        self.performance_config = performance_config
+        self.coalesce_bytes = coalesce_bytes
         self.event_stream = None
+        # Guards event_stream, which close() may clear from another thread mid-turn
+        self._stream_lock = threading.Lock()
+        
+        # converse_stream arguments that are the same for every turn
+        self._converse_kwargs = {
+            'modelId': model_id,
+            'system': [{"text": self.system_prompt}],
+        }
         
     def _create_request_body(self, audio_bytes=None, text_input=None):
         """
@@ -637,31 +1126,22 @@ class NovaSonicStream:
         Returns:
             dict: Request body for InvokeModelWithBidirectionalStream
         """
+        # The system prompt goes in converse_stream's 'system' argument, see __init__
         body = {
             "messages": []
         }
         
-        # Add system message if provided
-        if self.system_prompt:
-            body["messages"].append({
-                "role": "system",
-                "content": [{"text": self.system_prompt}]
-            })
-        
         # Add user input (audio or text)
         if audio_bytes:
-            # Convert audio bytes to base64
-            audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+            # Raw bytes: botocore base64-encodes blob fields itself when serializing
             body["messages"].append({
                 "role": "user",
                 "content": [{
                     "audio": {
-                        "format": "pcm",
                         "source": {
-                            "bytes": audio_base64
+                            "bytes": audio_bytes
                         },
-                        "sampleRate": 16000,
-                        "channels": 1
+                        **_SONIC_INPUT_AUDIO_FORMAT
                     }
                 }]
             })
@@ -681,53 +1161,10 @@ class NovaSonicStream:
             audio_bytes: PCM audio bytes (16kHz, mono, 16-bit)
         
         Yields:
-            bytes or dict: Audio response chunks or metadata
+            bytes, TextChunk or MetadataChunk: Audio response chunks, text or metadata
         """
-        try:
-            # Create request body for ConverseStream API
-            # Nova Sonic 2 uses the ConverseStream API, not invoke_model_with_bidirectional_stream
-            body = self._create_request_body(audio_bytes=audio_bytes)
-            
-            # Use converse_stream API for Nova Sonic 2
-            response = self.bedrock_client.converse_stream(
-                modelId=self.model_id,
-                messages=body['messages'],
-                system=body.get('system', []) if 'system' in body else None
-            )
-            
-            self.event_stream = response.get('stream')
-            
-            # Process stream events
-            if self.event_stream:
-                for event in self.event_stream:
-                    # ConverseStream returns different event structure
-                    if 'contentBlockDelta' in event:
-                        delta = event['contentBlockDelta']
-                        delta_block = delta.get('delta', {})
-                        
-                        # Check for audio output
-                        if 'audio' in delta_block:
-                            audio_data = delta_block['audio']
-                            if 'bytes' in audio_data:
-                                # Decode base64 audio
-                                audio_bytes = base64.b64decode(audio_data['bytes'])
-                                yield audio_bytes
-                        
-                        # Check for text output
-                        if 'text' in delta_block:
-                            text = delta_block['text']
-                            yield {'type': 'text', 'content': text}
-                    
-                    # Check for metadata
-                    if 'metadata' in event:
-                        metadata = event['metadata']
-                        yield {'type': 'metadata', 'content': metadata}
-                        
-        except AttributeError as e:
-            # If converse_stream doesn't exist, try alternative approach
-            raise Exception(f"Nova Sonic 2 API not available. Error: {str(e)}. Please check boto3 version and AWS Bedrock API availability.")
-        except Exception as e:
-            raise Exception(f"Error in Nova Sonic stream: {str(e)}")
+        # Nova Sonic 2 uses the ConverseStream API, not invoke_model_with_bidirectional_stream
+        yield from self._converse(self._create_request_body(audio_bytes=audio_bytes))
     
     def send_text(self, text_input):
         """
@@ -737,59 +1174,101 @@ class NovaSonicStream:
             text_input: Text string
         
         Yields:
-            bytes or dict: Audio response chunks or metadata
+            bytes, TextChunk or MetadataChunk: Audio response chunks, text or metadata
+        """
+        yield from self._converse(self._create_request_body(text_input=text_input))
+    
+    def _converse(self, body):
+        """
+        Send a request body to Nova Sonic with ConverseStream and relay the response stream.
+        
+        Args:
+            body (dict): Output of _create_request_body()
+        
+        Yields:
+            bytes, TextChunk or MetadataChunk: Audio response chunks, text or metadata
         """
         try:
-            # Create request body for ConverseStream API
-            body = self._create_request_body(text_input=text_input)
-            
-            # Use converse_stream API for Nova Sonic 2
-            response = self.bedrock_client.converse_stream(
-                modelId=self.model_id,
+            response = _call_with_performance_config(
+                self.bedrock_client.converse_stream,
+                self.performance_config,
                 messages=body['messages'],
-                system=body.get('system', []) if 'system' in body else None
+                **self._converse_kwargs
             )
             
-            self.event_stream = response.get('stream')
+            event_stream = response.get('stream')
+            with self._stream_lock:
+                self.event_stream = event_stream
             
             # Process stream events
-            if self.event_stream:
-                for event in self.event_stream:
-                    # ConverseStream returns different event structure
-                    if 'contentBlockDelta' in event:
-                        delta = event['contentBlockDelta']
-                        delta_block = delta.get('delta', {})
-                        
-                        # Check for audio output
-                        if 'audio' in delta_block:
-                            audio_data = delta_block['audio']
-                            if 'bytes' in audio_data:
-                                # Decode base64 audio
-                                audio_bytes = base64.b64decode(audio_data['bytes'])
-                                yield audio_bytes
-                        
-                        # Check for text output
-                        if 'text' in delta_block:
-                            text = delta_block['text']
-                            yield {'type': 'text', 'content': text}
-                    
-                    # Check for metadata
-                    if 'metadata' in event:
-                        metadata = event['metadata']
-                        yield {'type': 'metadata', 'content': metadata}
-                            
+            if event_stream:
+                yield from self._iter_stream_events(event_stream)
+            
         except AttributeError as e:
-            # If converse_stream doesn't exist, try alternative approach
-            raise Exception(f"Nova Sonic 2 API not available. Error: {str(e)}. Please check boto3 version and AWS Bedrock API availability.")
-        except Exception as e:
-            raise Exception(f"Error in Nova Sonic stream: {str(e)}")
+            # converse_stream is missing from older boto3 releases
+            raise NovaSonicStreamError(
+                "Nova Sonic 2 API not available. Please check boto3 version and AWS Bedrock API availability."
+            ) from e
+        except (BotoCoreError, ClientError) as e:
+            raise NovaSonicStreamError("Error in Nova Sonic stream") from e
+    
+    def _iter_stream_events(self, event_stream):
+        """
+        Yield audio and text from ConverseStream events as they arrive.
+        
+        Args:
+            event_stream: The 'stream' of a converse_stream response
+        
+        Yields:
+            bytes, TextChunk or MetadataChunk: Audio chunks, text or metadata
+        """
+        # Runs once per audio frame; module globals are bound to locals for the loop
+        b64decode, text_chunk, empty_delta = _b64decode, TextChunk, _EMPTY_DELTA
+        coalesce_bytes = self.coalesce_bytes
+        audio_buffer = bytearray()
+        for event in event_stream:
+            delta = event.get('contentBlockDelta')
+            if delta is not None:
+                delta_block = delta.get('delta') or empty_delta
+                
+                # botocore already decodes blob fields, so audio is handed on as-is
+                audio = delta_block.get('audio')
+                if audio is not None:
+                    audio_bytes = audio.get('bytes')
+                    if audio_bytes:
+                        audio_buffer += b64decode(audio_bytes) if isinstance(audio_bytes, str) else audio_bytes
+                        if len(audio_buffer) >= coalesce_bytes:
+                            yield bytes(audio_buffer)
+                            audio_buffer.clear()
+                
+                text = delta_block.get('text')
+                if not text:
+                    continue
+                item = text_chunk(text)
+            else:
+                # Other events (messageStart, contentBlockStop, ...) carry nothing to relay
+                metadata = event.get('metadata')
+                if metadata is None:
+                    continue
+                item = MetadataChunk(metadata)
+            
+            # Audio received before this item is yielded first, keeping the order
+            if audio_buffer:
+                yield bytes(audio_buffer)
+                audio_buffer.clear()
+            yield item
+        
+        if audio_buffer:
+            yield bytes(audio_buffer)
     
     def close(self):
-        """Close the stream connection."""
-        if self.event_stream:
+        """Close the stream connection; safe to call more than once and from several threads."""
+        # Take the stream and clear it in one critical section, so only one caller closes it
+        with self._stream_lock:
+            event_stream, self.event_stream = self.event_stream, None
+        if event_stream is not None:
             try:
-                self.event_stream.close()
+                event_stream.close()
             except Exception:
                 pass
-            self.event_stream = None
 
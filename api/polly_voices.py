@@ -5,6 +5,8 @@ This module contains a comprehensive list of available Amazon Polly neural voice
 organized by language and gender for easy selection in the story narration feature.
 """
 
+from types import MappingProxyType
+
 # Available Amazon Polly Neural Voices
 # Neural voices provide the best quality and natural-sounding speech
 POLLY_NEURAL_VOICES = {
@@ -86,6 +88,18 @@ DEFAULT_VOICES = {
     'zh-CN': 'Zhiyu',
 }
 
+# Read-only views of the table handed to callers, so one request can't change it for the next
+_FROZEN_VOICES = MappingProxyType({
+    language: tuple(MappingProxyType(voice) for voice in voices)
+    for language, voices in POLLY_NEURAL_VOICES.items()
+})
+
+# Voice IDs per language, for constant-time is_valid_voice() checks
+_VOICE_IDS_BY_LANGUAGE = {
+    language: frozenset(voice['id'] for voice in voices)
+    for language, voices in POLLY_NEURAL_VOICES.items()
+}
+
 def get_available_voices(language_code='en-US'):
     """
     Get list of available voices for a specific language.
@@ -94,18 +108,18 @@ def get_available_voices(language_code='en-US'):
         language_code (str): Language code (default: 'en-US')
     
     Returns:
-        list: List of voice dictionaries with id, name, gender, neural
+        tuple: Read-only voice mappings with id, name, gender, neural
     """
-    return POLLY_NEURAL_VOICES.get(language_code, POLLY_NEURAL_VOICES['en-US'])
+    return _FROZEN_VOICES.get(language_code, _FROZEN_VOICES['en-US'])
 
 def get_all_voices():
     """
     Get all available voices across all languages.
     
     Returns:
-        dict: Dictionary mapping language codes to lists of voices
+        MappingProxyType: Read-only mapping of language codes to voice tuples
     """
-    return POLLY_NEURAL_VOICES
+    return _FROZEN_VOICES
 
 def get_default_voice(language_code='en-US'):
     """
@@ -130,6 +144,5 @@ def is_valid_voice(voice_id, language_code='en-US'):
     Returns:
         bool: True if voice is valid, False otherwise
     """
-    voices = get_available_voices(language_code)
-    return any(voice['id'] == voice_id for voice in voices)
+    return voice_id in _VOICE_IDS_BY_LANGUAGE.get(language_code, _VOICE_IDS_BY_LANGUAGE['en-US'])
 
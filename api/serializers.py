@@ -1,13 +1,237 @@
 """
 Serializers for the API app.
 """
+import copy
+import functools
+
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
 from .models import Item, Category, Permission, Role, UserRole, UserActivity, Subscription, Plan, Invoice, NewsCategory, News, FAQCategory, FAQ, PageCategory, Page, UserProfile, Story, StorySession, StoryRevision, Playlist, UserStorySettings, StoryScene
 
 
-class UserSerializer(serializers.ModelSerializer):
+# Largest image accepted for news/page featured images and profile avatars
+MAX_IMAGE_BYTES = 50 * 1024
+
+
+class EagerLoadingMixin:
+    """
+    Load the relations a serializer reads per row together with the queryset.
+    
+    Meta.select_related and Meta.prefetch_related list the relations the serializer
+    dereferences, Meta.count_related maps count fields to the relation they count, and
+    Meta.annotations maps computed fields to the expression that computes them in SQL;
+    ViewSets pass their queryset through setup_eager_loading().
+    """
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Return the queryset with this serializer's relations joined or prefetched."""
+        select_related = getattr(cls.Meta, 'select_related', ())
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        prefetch_related = getattr(cls.Meta, 'prefetch_related', ())
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        count_related = getattr(cls.Meta, 'count_related', None)
+        if count_related:
+            queryset = queryset.annotate(**{
+                name: Count(relation, distinct=True) for name, relation in count_related.items()
+            })
+        annotations = getattr(cls.Meta, 'annotations', None)
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+        return queryset
+    
+    def update(self, instance, validated_data):
+        """Update the instance and drop annotations that were computed before the update."""
+        instance = super().update(instance, validated_data)
+        # get_object() annotated the instance; the serializer's fallbacks recompute these
+        for name in (*getattr(self.Meta, 'count_related', ()), *getattr(self.Meta, 'annotations', ())):
+            instance.__dict__.pop(name, None)
+        return instance
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields from its declarations and model once per class.
+    
+    ModelSerializer.get_fields() introspects the model, builds the implicit fields and works
+    out uniqueness validators on every instantiation; the result only depends on the class,
+    so it is kept unbound here and each instance gets its own copy.
+    """
+    
+    _fields_cache = {}
+    
+    def get_fields(self):
+        cls = type(self)
+        fields = self._fields_cache.get(cls)
+        if fields is None:
+            fields = self._fields_cache[cls] = copy.deepcopy(super().get_fields())
+        return copy.deepcopy(fields)
+
+
+class FlatRepresentationMixin:
+    """
+    Serialize rows of flat list serializers without per-field get_attribute() dispatch.
+    
+    The first row works out, for each readable field, the attribute path to read and the
+    callable that renders it; every row after that walks those paths directly. Sources must
+    be plain attributes, not methods. Serializers with nested serializers or relational
+    fields use the default to_representation().
+    
+    List views can go further with setup_values(), which turns the queryset into dict rows
+    holding only the rendered columns so no model instances are built at all.
+    """
+    
+    @classmethod
+    def setup_values(cls, queryset):
+        """
+        Return the queryset as dict rows keyed by this serializer's field names.
+        
+        Dotted sources become F() aliases named after the field. SerializerMethodFields are
+        read from a same-named annotation (see EagerLoadingMixin), which must already be
+        on the queryset.
+        """
+        names, aliases = [], {}
+        for field in cls()._readable_fields:
+            source = '__'.join(field.source_attrs)
+            if isinstance(field, serializers.SerializerMethodField) or source == field.field_name:
+                names.append(field.field_name)
+            else:
+                aliases[field.field_name] = F(source)
+        return queryset.values(*names, **aliases)
+    
+    def _representation_plan(self):
+        """Return (field_name, source_attrs, render, field) per readable field, or () if not flat."""
+        plan = self.__dict__.get('_flat_plan')
+        if plan is None:
+            plan = []
+            for field in self._readable_fields:
+                if isinstance(field, (serializers.BaseSerializer, serializers.RelatedField, serializers.ManyRelatedField)):
+                    plan = ()
+                    break
+                if isinstance(field, serializers.SerializerMethodField):
+                    plan.append((field.field_name, (), getattr(self, field.method_name), field))
+                else:
+                    plan.append((field.field_name, tuple(field.source_attrs), field.to_representation, field))
+            self._flat_plan = plan = tuple(plan)
+        return plan
+    
+    def _values_plan(self):
+        """Return (field_name, render) per readable field; method fields arrive already computed."""
+        plan = self.__dict__.get('_flat_values_plan')
+        if plan is None:
+            plan = self._flat_values_plan = tuple(
+                (field_name, None if isinstance(field, serializers.SerializerMethodField) else render)
+                for field_name, _, render, field in self._representation_plan()
+            )
+        return plan
+    
+    def to_representation(self, instance):
+        if type(instance) is dict:
+            # A row from setup_values()
+            ret = {}
+            for field_name, render in self._values_plan():
+                value = instance[field_name]
+                ret[field_name] = value if value is None or render is None else render(value)
+            return ret
+        
+        plan = self._representation_plan()
+        if not plan:
+            return super().to_representation(instance)
+        
+        ret = {}
+        for field_name, source_attrs, render, field in plan:
+            value = instance
+            try:
+                for attr in source_attrs:
+                    value = getattr(value, attr)
+            except ObjectDoesNotExist:
+                value = None
+            except AttributeError:
+                # e.g. a null foreign key in a dotted source: the field applies its default or skips itself
+                try:
+                    value = field.get_attribute(instance)
+                except SkipField:
+                    continue
+            ret[field_name] = None if value is None else render(value)
+        return ret
+
+
+def absolute_media_url(context, url):
+    """
+    Return an absolute URL for a media file URL.
+    
+    The request's scheme and host are resolved once and kept in the serializer context,
+    which list serializers share with their children, instead of once per row.
+    
+    Args:
+        context (dict): Serializer context, with the request if there is one
+        url (str): File URL, usually a path under MEDIA_URL
+    
+    Returns:
+        str: Absolute URL, or the URL unchanged when there is no request
+    """
+    request = context.get('request')
+    if request is None:
+        return url
+    if not url.startswith('/') or url.startswith('//'):
+        return request.build_absolute_uri(url)
+    base_url = context.get('base_url')
+    if base_url is None:
+        base_url = context['base_url'] = request.build_absolute_uri('/')[:-1]
+    return base_url + url
+
+
+def _strip_or_none(value):
+    """Strip a string value, returning None for None or a blank string."""
+    if isinstance(value, str):
+        return value.strip() or None
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _avatar_storage_url(name):
+    """Storage URL for an avatar file; every upload gets a fresh uuid name, so entries never go stale."""
+    return UserProfile._meta.get_field('avatar').storage.url(name)
+
+
+def full_name_expression(prefix=''):
+    """
+    SQL expression for a user's "first last" name, or the username when both are blank.
+    
+    Args:
+        prefix (str): Lookup path to the user, e.g. 'user__' (default: the queried model is User)
+    
+    Returns:
+        Expression: Value for queryset.annotate()
+    """
+    return Coalesce(
+        NullIf(Trim(Concat(f'{prefix}first_name', Value(' '), f'{prefix}last_name')), Value('')),
+        f'{prefix}username'
+    )
+
+
+def faq_stats_expressions():
+    """
+    SQL expressions for an FAQ's counters, 0 when the FAQ has no stats row yet.
+    
+    Returns:
+        dict: Counter name to expression, for queryset.annotate()
+    """
+    return {
+        name: Coalesce(F(f'stats__{name}'), 0)
+        for name in ('views_count', 'helpful_count', 'not_helpful_count')
+    }
+
+
+class UserSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for User model."""
     full_name = serializers.SerializerMethodField()
     is_senior = serializers.SerializerMethodField()
@@ -15,21 +239,24 @@ class UserSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'is_staff', 'is_superuser', 'is_active', 'date_joined', 'is_senior', 'password']
-        read_only_fields = ['id', 'is_staff', 'is_superuser', 'date_joined']
+        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'is_staff', 'is_superuser', 'is_active', 'date_joined', 'is_senior', 'password')
+        read_only_fields = ('id', 'is_staff', 'is_superuser', 'date_joined')
+        annotations = {'full_name': full_name_expression()}
     
     def get_full_name(self, obj):
         """Return full name or username if names are not set."""
+        # Annotated by setup_eager_loading(); users saved through the serializer aren't
+        full_name = getattr(obj, 'full_name', None)
+        if full_name is not None:
+            return full_name
         if obj.first_name or obj.last_name:
             return f"{obj.first_name} {obj.last_name}".strip()
         return obj.username
     
     def get_is_senior(self, obj):
         """Check if user has senior profile."""
-        try:
-            return obj.senior_profile.is_senior if hasattr(obj, 'senior_profile') else False
-        except:
-            return False
+        profile = getattr(obj, 'senior_profile', None)
+        return bool(profile is not None and profile.is_senior)
     
     def create(self, validated_data):
         """Create a new user."""
@@ -44,27 +271,32 @@ class UserSerializer(serializers.ModelSerializer):
         return user
 
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(EagerLoadingMixin, FlatRepresentationMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing users."""
     full_name = serializers.SerializerMethodField()
     
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'is_staff', 'is_superuser', 'is_active', 'date_joined']
-        read_only_fields = ['id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'is_staff', 'is_superuser', 'date_joined']
+        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'is_staff', 'is_superuser', 'is_active', 'date_joined')
+        read_only_fields = ('id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'is_staff', 'is_superuser', 'date_joined')
+        annotations = {'full_name': full_name_expression()}
     
     def get_full_name(self, obj):
         """Return full name or username if names are not set."""
+        # Annotated on user lists; users nested in other serializers aren't
+        full_name = getattr(obj, 'full_name', None)
+        if full_name is not None:
+            return full_name
         if obj.first_name or obj.last_name:
             return f"{obj.first_name} {obj.last_name}".strip()
         return obj.username
 
 
-class UserUpdateSerializer(serializers.ModelSerializer):
+class UserUpdateSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for updating user (specifically is_active status)."""
     class Meta:
         model = User
-        fields = ['is_active']
+        fields = ('is_active',)
     
     def validate_is_active(self, value):
         """Prevent deactivating superusers."""
@@ -114,20 +346,28 @@ class RegistrationSerializer(serializers.Serializer):
     accept_terms = serializers.BooleanField(required=True)
     
     def validate_username(self, value):
-        """Validate username is unique and meets requirements."""
+        """Validate username meets requirements."""
         if len(value) < 4:
             raise serializers.ValidationError("Username must be at least 4 characters long.")
-        
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError("A user with this username already exists.")
-        
         return value
     
-    def validate_email(self, value):
-        """Validate email is unique."""
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
+    def _uniqueness_check(self, attrs):
+        """Check username and email uniqueness (case-insensitively) with a single query."""
+        username_match = Q(username__iexact=attrs['username'])
+        email_match = Q(email__iexact=attrs['email'])
+        # The database compares both, so the result follows its collation rather than Python's ==
+        taken = User.objects.filter(username_match | email_match).aggregate(
+            username=Count('pk', filter=username_match),
+            email=Count('pk', filter=email_match),
+        )
+        
+        errors = {}
+        if taken['username']:
+            errors['username'] = "A user with this username already exists."
+        if taken['email']:
+            errors['email'] = "A user with this email already exists."
+        if errors:
+            raise serializers.ValidationError(errors)
     
     def validate(self, attrs):
         """Validate password confirmation, terms acceptance, and user type."""
@@ -148,6 +388,7 @@ class RegistrationSerializer(serializers.Serializer):
                 'user_type': "User type must be 'admin', 'staff', or 'user'."
             })
         
+        self._uniqueness_check(attrs)
         return attrs
     
     def create(self, validated_data):
@@ -155,16 +396,21 @@ class RegistrationSerializer(serializers.Serializer):
         user_type = validated_data.pop('user_type', 'user')
         validated_data.pop('confirm_password')  # Remove confirm_password
         
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            password=validated_data['password'],
-            first_name=validated_data['first_name'],
-            last_name=validated_data['last_name'],
-            is_active=True,
-            is_staff=(user_type == 'staff' or user_type == 'admin'),
-            is_superuser=(user_type == 'admin')
-        )
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=validated_data['username'],
+                    email=validated_data['email'],
+                    password=validated_data['password'],
+                    first_name=validated_data['first_name'],
+                    last_name=validated_data['last_name'],
+                    is_active=True,
+                    is_staff=(user_type == 'staff' or user_type == 'admin'),
+                    is_superuser=(user_type == 'admin')
+                )
+        except IntegrityError:
+            # A concurrent signup took the username after _uniqueness_check() ran
+            raise serializers.ValidationError({'username': "A user with this username already exists."})
         return user
 
 
@@ -172,16 +418,16 @@ class CategorySerializer(serializers.ModelSerializer):
     """Serializer for Category model."""
     class Meta:
         model = Category
-        fields = ['id', 'name', 'description', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = ('id', 'name', 'description', 'created_at')
+        read_only_fields = ('id', 'created_at')
 
 
 class ItemSerializer(serializers.ModelSerializer):
     """Serializer for Item model."""
     class Meta:
         model = Item
-        fields = ['id', 'name', 'description', 'is_active', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        fields = ('id', 'name', 'description', 'is_active', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'created_at', 'updated_at')
 
     def validate_name(self, value):
         """Validate that name is not empty."""
@@ -190,11 +436,11 @@ class ItemSerializer(serializers.ModelSerializer):
         return value.strip()
 
 
-class ItemListSerializer(serializers.ModelSerializer):
+class ItemListSerializer(FlatRepresentationMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing items."""
     class Meta:
         model = Item
-        fields = ['id', 'name', 'is_active', 'created_at']
+        fields = ('id', 'name', 'is_active', 'created_at')
 
 
 # ========== Roles & Permissions Serializers ==========
@@ -203,23 +449,23 @@ class PermissionSerializer(serializers.ModelSerializer):
     """Serializer for Permission model."""
     class Meta:
         model = Permission
-        fields = ['id', 'name', 'codename', 'description', 'endpoint', 'method', 'is_active', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        fields = ('id', 'name', 'codename', 'description', 'endpoint', 'method', 'is_active', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'created_at', 'updated_at')
 
 
-class PermissionListSerializer(serializers.ModelSerializer):
+class PermissionListSerializer(FlatRepresentationMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing permissions."""
     class Meta:
         model = Permission
-        fields = ['id', 'name', 'codename', 'endpoint', 'method', 'is_active']
+        fields = ('id', 'name', 'codename', 'endpoint', 'method', 'is_active')
 
 
-class RoleSerializer(serializers.ModelSerializer):
+class RoleSerializer(EagerLoadingMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Role model."""
     permissions = PermissionListSerializer(many=True, read_only=True)
     permission_ids = serializers.PrimaryKeyRelatedField(
         many=True,
-        queryset=Permission.objects.all(),
+        queryset=Permission.objects.only('pk'),
         source='permissions',
         write_only=True,
         required=False
@@ -228,26 +474,33 @@ class RoleSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Role
-        fields = ['id', 'name', 'description', 'permissions', 'permission_ids', 'permission_count', 'is_active', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        fields = ('id', 'name', 'description', 'permissions', 'permission_ids', 'permission_count', 'is_active', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'created_at', 'updated_at')
+        prefetch_related = ('permissions',)
+        count_related = {'permission_count': 'permissions'}
     
     def get_permission_count(self, obj):
-        return obj.permissions.count()
+        # Annotated by setup_eager_loading(); a role just created or updated through the serializer isn't
+        count = getattr(obj, 'permission_count', None)
+        return obj.permissions.count() if count is None else count
 
 
-class RoleListSerializer(serializers.ModelSerializer):
+class RoleListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing roles."""
     permission_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Role
-        fields = ['id', 'name', 'description', 'permission_count', 'is_active', 'created_at']
+        fields = ('id', 'name', 'description', 'permission_count', 'is_active', 'created_at')
+        count_related = {'permission_count': 'permissions'}
     
     def get_permission_count(self, obj):
-        return obj.permissions.count()
+        # Nested under UserRoleSerializer the role isn't annotated; role__permissions is prefetched there
+        count = getattr(obj, 'permission_count', None)
+        return obj.permissions.count() if count is None else count
 
 
-class UserRoleSerializer(serializers.ModelSerializer):
+class UserRoleSerializer(EagerLoadingMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for UserRole model."""
     user = UserListSerializer(read_only=True)
     user_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), source='user', write_only=True)
@@ -257,33 +510,46 @@ class UserRoleSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = UserRole
-        fields = ['id', 'user', 'user_id', 'role', 'role_id', 'assigned_at', 'assigned_by', 'assigned_by_username']
-        read_only_fields = ['id', 'assigned_at']
+        fields = ('id', 'user', 'user_id', 'role', 'role_id', 'assigned_at', 'assigned_by', 'assigned_by_username')
+        read_only_fields = ('id', 'assigned_at')
+        select_related = ('user', 'role', 'assigned_by')
+        prefetch_related = ('role__permissions',)
 
 
 # ========== User Activity Serializers ==========
 
-class UserActivitySerializer(serializers.ModelSerializer):
-    """Serializer for UserActivity model."""
+class UserActivitySerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    """
+    Serializer for UserActivity model.
+    
+    Activity endpoints are read-only; code that records activities should insert them with
+    UserActivity.bulk_log() rather than saving through this serializer row by row.
+    """
     user = UserListSerializer(read_only=True)
     user_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), source='user', write_only=True, required=False)
     
     class Meta:
         model = UserActivity
-        fields = ['id', 'user', 'user_id', 'action', 'resource_type', 'resource_id', 'description', 'ip_address', 'user_agent', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = ('id', 'user', 'user_id', 'action', 'resource_type', 'resource_id', 'description', 'ip_address', 'user_agent', 'created_at')
+        read_only_fields = ('id', 'created_at')
+        select_related = ('user',)
 
 
-class UserActivityListSerializer(serializers.ModelSerializer):
+class UserActivityListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing user activities."""
     username = serializers.CharField(source='user.username', read_only=True)
     full_name = serializers.SerializerMethodField()
     
     class Meta:
         model = UserActivity
-        fields = ['id', 'username', 'full_name', 'action', 'resource_type', 'resource_id', 'description', 'ip_address', 'created_at']
+        fields = ('id', 'username', 'full_name', 'action', 'resource_type', 'resource_id', 'description', 'ip_address', 'created_at')
+        select_related = ('user',)
+        annotations = {'full_name': full_name_expression('user__')}
     
     def get_full_name(self, obj):
+        full_name = getattr(obj, 'full_name', None)
+        if full_name is not None:
+            return full_name
         if obj.user.first_name or obj.user.last_name:
             return f"{obj.user.first_name} {obj.user.last_name}".strip()
         return obj.user.username
@@ -296,22 +562,35 @@ class PlanSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Plan
-        fields = ['id', 'uuid', 'name', 'description', 'price', 'duration_months', 'features', 'is_popular', 'is_active', 'display_order', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'uuid', 'created_at', 'updated_at']
+        fields = ('id', 'uuid', 'name', 'description', 'price', 'duration_months', 'features', 'is_popular', 'is_active', 'display_order', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'uuid', 'created_at', 'updated_at')
+    
+    def validate_features(self, value):
+        """Features must be a list of short strings so they fit the features index."""
+        if not isinstance(value, list):
+            raise serializers.ValidationError("Features must be a list.")
+        for feature in value:
+            if not isinstance(feature, str):
+                raise serializers.ValidationError("Each feature must be a string.")
+            if len(feature) > Plan.FEATURE_MAX_LENGTH:
+                raise serializers.ValidationError(
+                    f"Each feature must be at most {Plan.FEATURE_MAX_LENGTH} characters."
+                )
+        return value
 
 
-class PlanListSerializer(serializers.ModelSerializer):
+class PlanListSerializer(FlatRepresentationMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing plans."""
     
     class Meta:
         model = Plan
-        fields = ['id', 'uuid', 'name', 'price', 'duration_months', 'is_popular', 'is_active', 'display_order']
-        read_only_fields = ['id', 'uuid']
+        fields = ('id', 'uuid', 'name', 'price', 'duration_months', 'is_popular', 'is_active', 'display_order')
+        read_only_fields = ('id', 'uuid')
 
 
 # ========== Subscription Serializers ==========
 
-class SubscriptionSerializer(serializers.ModelSerializer):
+class SubscriptionSerializer(EagerLoadingMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Subscription model."""
     user = UserListSerializer(read_only=True)
     user_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), source='user', write_only=True, allow_null=True)
@@ -320,91 +599,86 @@ class SubscriptionSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Subscription
-        fields = ['id', 'uuid', 'user', 'user_id', 'plan', 'plan_id', 'status', 'start_date', 'end_date', 'price', 'notes', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'uuid', 'created_at', 'updated_at']
+        fields = ('id', 'uuid', 'user', 'user_id', 'plan', 'plan_id', 'status', 'start_date', 'end_date', 'price', 'notes', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'uuid', 'created_at', 'updated_at')
+        select_related = ('user', 'plan')
 
 
-class SubscriptionListSerializer(serializers.ModelSerializer):
+class SubscriptionListSerializer(EagerLoadingMixin, FlatRepresentationMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing subscriptions."""
     plan_name = serializers.CharField(source='plan.name', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
     
     class Meta:
         model = Subscription
-        fields = ['id', 'uuid', 'username', 'plan_name', 'status', 'start_date', 'end_date', 'price', 'created_at']
-        read_only_fields = ['id', 'uuid']
+        fields = ('id', 'uuid', 'username', 'plan_name', 'status', 'start_date', 'end_date', 'price', 'created_at')
+        read_only_fields = ('id', 'uuid')
+        select_related = ('user', 'plan')
 
 
 # ========== Invoice Serializers ==========
 
-class InvoiceSerializer(serializers.ModelSerializer):
+class InvoiceSerializer(EagerLoadingMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Invoice model."""
     user = UserListSerializer(read_only=True)
     user_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), source='user', write_only=True)
     plan = PlanListSerializer(read_only=True)
     plan_id = serializers.PrimaryKeyRelatedField(queryset=Plan.objects.all(), source='plan', write_only=True, allow_null=True)
-    subscription_id = serializers.PrimaryKeyRelatedField(queryset=Subscription.objects.all(), source='subscription', write_only=True, allow_null=True)
+    subscription_id = serializers.PrimaryKeyRelatedField(queryset=Subscription.objects.select_related(None).only('pk'), source='subscription', write_only=True, allow_null=True)
     
     class Meta:
         model = Invoice
-        fields = [
+        fields = (
             'id', 'uuid', 'invoice_number', 'user', 'user_id', 'subscription', 'subscription_id', 
             'plan', 'plan_id', 'subtotal', 'discount', 'total', 'status', 'payment_method', 
             'due_date', 'paid_date', 'notes', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'uuid', 'invoice_number', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'uuid', 'invoice_number', 'created_at', 'updated_at')
+        select_related = ('user', 'plan')
 
 
-class InvoiceListSerializer(serializers.ModelSerializer):
+class InvoiceListSerializer(EagerLoadingMixin, FlatRepresentationMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing invoices."""
     username = serializers.CharField(source='user.username', read_only=True)
     plan_name = serializers.CharField(source='plan.name', read_only=True)
     
     class Meta:
         model = Invoice
-        fields = [
+        fields = (
             'id', 'uuid', 'invoice_number', 'username', 'plan_name', 'total', 
             'status', 'payment_method', 'due_date', 'created_at'
-        ]
-        read_only_fields = ['id', 'uuid']
-    username = serializers.CharField(source='user.username', read_only=True)
-    full_name = serializers.SerializerMethodField()
-    
-    class Meta:
-        model = Subscription
-        fields = ['id', 'username', 'full_name', 'plan', 'status', 'start_date', 'end_date', 'price', 'created_at']
-    
-    def get_full_name(self, obj):
-        if obj.user.first_name or obj.user.last_name:
-            return f"{obj.user.first_name} {obj.user.last_name}".strip()
-        return obj.user.username
+        )
+        read_only_fields = ('id', 'uuid')
+        select_related = ('user', 'plan')
 
 
 # ========== News Serializers ==========
 
-class NewsCategorySerializer(serializers.ModelSerializer):
+class NewsCategorySerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for NewsCategory model."""
     news_count = serializers.SerializerMethodField()
     
     class Meta:
         model = NewsCategory
-        fields = ['id', 'uuid', 'name', 'slug', 'description', 'is_active', 'news_count', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'uuid', 'created_at', 'updated_at']
+        fields = ('id', 'uuid', 'name', 'slug', 'description', 'is_active', 'news_count', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'uuid', 'created_at', 'updated_at')
+        count_related = {'news_count': 'news_items'}
     
     def get_news_count(self, obj):
         """Return count of news items in this category."""
-        return obj.news_items.count()
+        count = getattr(obj, 'news_count', None)
+        return obj.news_items.count() if count is None else count
 
 
-class NewsCategoryListSerializer(serializers.ModelSerializer):
+class NewsCategoryListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing news categories."""
     class Meta:
         model = NewsCategory
-        fields = ['id', 'uuid', 'name', 'slug', 'is_active']
-        read_only_fields = ['id', 'uuid']
+        fields = ('id', 'uuid', 'name', 'slug', 'is_active')
+        read_only_fields = ('id', 'uuid')
 
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for News model."""
     category = NewsCategoryListSerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
@@ -419,12 +693,14 @@ class NewsSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = News
-        fields = [
+        fields = (
             'id', 'uuid', 'title', 'slug', 'category', 'category_id', 'author', 'author_username', 
-            'author_full_name', 'content', 'excerpt', 'featured_image', 'featured_image_url', 'status', 
+            'author_full_name', 'content', 'excerpt', 'featured_image', 'featured_image_url',
+            'featured_image_width', 'featured_image_height', 'featured_image_size', 'status', 
             'is_featured', 'views_count', 'published_at', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'uuid', 'author', 'views_count', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'uuid', 'author', 'views_count', 'created_at', 'updated_at')
+        select_related = ('category', 'author')
     
     def get_author_full_name(self, obj):
         """Return author's full name or username."""
@@ -437,16 +713,13 @@ class NewsSerializer(serializers.ModelSerializer):
     def get_featured_image_url(self, obj):
         """Return full URL for featured image."""
         if obj.featured_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.featured_image.url)
-            return obj.featured_image.url
+            return absolute_media_url(self.context, obj.featured_image.url)
         return None
     
     def validate_featured_image(self, value):
         """Validate image size (max 50KB)."""
         if value:
-            if value.size > 50 * 1024:  # 50KB in bytes
+            if value.size > MAX_IMAGE_BYTES:
                 raise serializers.ValidationError("Image size cannot exceed 50KB.")
         return value
     
@@ -456,7 +729,7 @@ class NewsSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class NewsListSerializer(serializers.ModelSerializer):
+class NewsListSerializer(EagerLoadingMixin, FlatRepresentationMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing news."""
     category_name = serializers.CharField(source='category.name', read_only=True)
     author_username = serializers.CharField(source='author.username', read_only=True)
@@ -464,47 +737,48 @@ class NewsListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = News
-        fields = [
+        fields = (
             'id', 'uuid', 'title', 'slug', 'category_name', 'author_username', 
             'excerpt', 'status', 'is_featured', 'views_count', 
-            'published_at', 'created_at', 'featured_image_url'
-        ]
+            'published_at', 'created_at', 'featured_image_url',
+            'featured_image_width', 'featured_image_height'
+        )
+        select_related = ('category', 'author')
     
     def get_featured_image_url(self, obj):
         """Return full URL for featured image."""
         if obj.featured_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.featured_image.url)
-            return obj.featured_image.url
+            return absolute_media_url(self.context, obj.featured_image.url)
         return None
 
 
 # ========== FAQ Serializers ==========
 
-class FAQCategorySerializer(serializers.ModelSerializer):
+class FAQCategorySerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for FAQCategory model."""
     faq_count = serializers.SerializerMethodField()
     
     class Meta:
         model = FAQCategory
-        fields = ['id', 'uuid', 'name', 'slug', 'description', 'display_order', 'is_active', 'faq_count', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'uuid', 'created_at', 'updated_at']
+        fields = ('id', 'uuid', 'name', 'slug', 'description', 'display_order', 'is_active', 'faq_count', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'uuid', 'created_at', 'updated_at')
+        count_related = {'faq_count': 'faq_items'}
     
     def get_faq_count(self, obj):
         """Return count of FAQs in this category."""
-        return obj.faq_items.count()
+        count = getattr(obj, 'faq_count', None)
+        return obj.faq_items.count() if count is None else count
 
 
-class FAQCategoryListSerializer(serializers.ModelSerializer):
+class FAQCategoryListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing FAQ categories."""
     class Meta:
         model = FAQCategory
-        fields = ['id', 'uuid', 'name', 'slug', 'display_order', 'is_active']
-        read_only_fields = ['id', 'uuid']
+        fields = ('id', 'uuid', 'name', 'slug', 'display_order', 'is_active')
+        read_only_fields = ('id', 'uuid')
 
 
-class FAQSerializer(serializers.ModelSerializer):
+class FAQSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for FAQ model."""
     category = FAQCategoryListSerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
@@ -515,16 +789,38 @@ class FAQSerializer(serializers.ModelSerializer):
     )
     author_username = serializers.CharField(source='author.username', read_only=True)
     author_full_name = serializers.SerializerMethodField()
+    views_count = serializers.SerializerMethodField()
+    helpful_count = serializers.SerializerMethodField()
+    not_helpful_count = serializers.SerializerMethodField()
     
     class Meta:
         model = FAQ
-        fields = [
+        fields = (
             'id', 'uuid', 'question', 'slug', 'answer', 'category', 'category_id', 'author', 
             'author_username', 'author_full_name', 'status', 'display_order', 
             'views_count', 'helpful_count', 'not_helpful_count', 
             'published_at', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'uuid', 'author', 'views_count', 'helpful_count', 'not_helpful_count', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'uuid', 'author', 'created_at', 'updated_at')
+        select_related = ('category', 'author')
+        annotations = faq_stats_expressions()
+    
+    def _stats_count(self, obj, name):
+        # Annotated by setup_eager_loading(); FAQs loaded elsewhere or just saved read the stats row
+        count = getattr(obj, name, None)
+        if count is None:
+            stats = getattr(obj, 'stats', None)
+            count = getattr(stats, name, 0)
+        return count
+    
+    def get_views_count(self, obj):
+        return self._stats_count(obj, 'views_count')
+    
+    def get_helpful_count(self, obj):
+        return self._stats_count(obj, 'helpful_count')
+    
+    def get_not_helpful_count(self, obj):
+        return self._stats_count(obj, 'not_helpful_count')
     
     def get_author_full_name(self, obj):
         """Return author's full name or username."""
@@ -540,45 +836,53 @@ class FAQSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class FAQListSerializer(serializers.ModelSerializer):
+class FAQListSerializer(EagerLoadingMixin, FlatRepresentationMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing FAQs."""
     category_name = serializers.CharField(source='category.name', read_only=True)
     author_username = serializers.CharField(source='author.username', read_only=True)
+    # Annotated by setup_eager_loading()
+    views_count = serializers.IntegerField(read_only=True)
+    helpful_count = serializers.IntegerField(read_only=True)
+    not_helpful_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = FAQ
-        fields = [
+        fields = (
             'id', 'uuid', 'question', 'slug', 'category_name', 'author_username', 
             'status', 'display_order', 'views_count', 
             'helpful_count', 'not_helpful_count', 'published_at', 'created_at'
-        ]
+        )
+        select_related = ('category', 'author')
+        annotations = faq_stats_expressions()
 
 
 # ========== Page Serializers ==========
 
-class PageCategorySerializer(serializers.ModelSerializer):
+class PageCategorySerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for PageCategory model."""
     page_count = serializers.SerializerMethodField()
     
     class Meta:
         model = PageCategory
-        fields = ['id', 'uuid', 'name', 'slug', 'description', 'display_order', 'is_active', 'page_count', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'uuid', 'created_at', 'updated_at']
+        fields = ('id', 'uuid', 'name', 'slug', 'description', 'display_order', 'is_active', 'page_count', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'uuid', 'created_at', 'updated_at')
+        count_related = {'page_count': 'pages'}
     
     def get_page_count(self, obj):
         """Return count of pages in this category."""
-        return obj.pages.count()
+        count = getattr(obj, 'page_count', None)
+        return obj.pages.count() if count is None else count
 
 
-class PageCategoryListSerializer(serializers.ModelSerializer):
+class PageCategoryListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing page categories."""
     class Meta:
         model = PageCategory
-        fields = ['id', 'uuid', 'name', 'slug', 'display_order', 'is_active']
-        read_only_fields = ['id', 'uuid']
+        fields = ('id', 'uuid', 'name', 'slug', 'display_order', 'is_active')
+        read_only_fields = ('id', 'uuid')
 
 
-class PageSerializer(serializers.ModelSerializer):
+class PageSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for Page model."""
     category = PageCategoryListSerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
@@ -593,12 +897,14 @@ class PageSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Page
-        fields = [
+        fields = (
             'id', 'uuid', 'title', 'slug', 'category', 'category_id', 'author', 'author_username', 
-            'author_full_name', 'description', 'featured_image', 'featured_image_url', 'status', 
+            'author_full_name', 'description', 'featured_image', 'featured_image_url',
+            'featured_image_width', 'featured_image_height', 'featured_image_size', 'status', 
             'is_featured', 'views_count', 'published_at', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'uuid', 'author', 'views_count', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'uuid', 'author', 'views_count', 'created_at', 'updated_at')
+        select_related = ('category', 'author')
     
     def get_author_full_name(self, obj):
         """Return author's full name or username."""
@@ -611,16 +917,13 @@ class PageSerializer(serializers.ModelSerializer):
     def get_featured_image_url(self, obj):
         """Return full URL for featured image."""
         if obj.featured_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.featured_image.url)
-            return obj.featured_image.url
+            return absolute_media_url(self.context, obj.featured_image.url)
         return None
     
     def validate_featured_image(self, value):
         """Validate image size (max 50KB)."""
         if value:
-            if value.size > 50 * 1024:  # 50KB in bytes
+            if value.size > MAX_IMAGE_BYTES:
                 raise serializers.ValidationError("Image size cannot exceed 50KB.")
         return value
     
@@ -630,7 +933,7 @@ class PageSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class PageListSerializer(serializers.ModelSerializer):
+class PageListSerializer(EagerLoadingMixin, FlatRepresentationMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing pages."""
     category_name = serializers.CharField(source='category.name', read_only=True)
     author_username = serializers.CharField(source='author.username', read_only=True)
@@ -638,19 +941,18 @@ class PageListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Page
-        fields = [
+        fields = (
             'id', 'uuid', 'title', 'slug', 'category_name', 'author_username', 
             'status', 'is_featured', 'views_count', 
-            'published_at', 'created_at', 'featured_image_url'
-        ]
+            'published_at', 'created_at', 'featured_image_url',
+            'featured_image_width', 'featured_image_height'
+        )
+        select_related = ('category', 'author')
     
     def get_featured_image_url(self, obj):
         """Return full URL for featured image."""
         if obj.featured_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.featured_image.url)
-            return obj.featured_image.url
+            return absolute_media_url(self.context, obj.featured_image.url)
         return None
 
 
@@ -666,28 +968,23 @@ class UserProfileSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = UserProfile
-        fields = [
+        fields = (
             'id', 'user', 'title', 'contact_phone', 'business_name', 
             'avatar', 'avatar_url', 'user_email', 'user_first_name', 
             'user_last_name', 'user_username', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'user', 'created_at', 'updated_at')
     
     def get_avatar_url(self, obj):
         """Return full URL for avatar image."""
         if obj.avatar:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.avatar.url)
-            return obj.avatar.url
+            return absolute_media_url(self.context, _avatar_storage_url(obj.avatar.name))
         return None
     
     def validate_avatar(self, value):
         """Validate avatar file size (max 50KB)."""
         if value:
-            # Check file size (50KB = 50 * 1024 bytes)
-            max_size = 50 * 1024
-            if value.size > max_size:
+            if value.size > MAX_IMAGE_BYTES:
                 raise serializers.ValidationError(
                     f"Avatar file size must be less than 50KB. Current size: {value.size / 1024:.2f}KB"
                 )
@@ -701,63 +998,27 @@ class UserProfileUpdateSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = UserProfile
-        fields = ['title', 'contact_phone', 'business_name', 'avatar', 'first_name', 'last_name']
+        fields = ('title', 'contact_phone', 'business_name', 'avatar', 'first_name', 'last_name')
+    
+    # Optional text fields stored as NULL rather than '' when left blank
+    _BLANK_NULL_FIELDS = frozenset({'title', 'contact_phone', 'business_name', 'first_name', 'last_name'})
+    
+    def to_internal_value(self, data):
+        """Strip the optional text fields and convert blank values to None."""
+        validated = super().to_internal_value(data)
+        for field_name in self._BLANK_NULL_FIELDS.intersection(validated):
+            validated[field_name] = _strip_or_none(validated[field_name])
+        return validated
     
     def validate_avatar(self, value):
         """Validate avatar file size (max 50KB)."""
         if value:
-            max_size = 50 * 1024
-            if value.size > max_size:
+            if value.size > MAX_IMAGE_BYTES:
                 raise serializers.ValidationError(
                     f"Avatar file size must be less than 50KB. Current size: {value.size / 1024:.2f}KB"
                 )
         return value
     
-    def validate_title(self, value):
-        """Convert empty string to None."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            value = value.strip()
-            return value if value else None
-        return value
-    
-    def validate_contact_phone(self, value):
-        """Convert empty string to None."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            value = value.strip()
-            return value if value else None
-        return value
-    
-    def validate_business_name(self, value):
-        """Convert empty string to None."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            value = value.strip()
-            return value if value else None
-        return value
-    
-    def validate_first_name(self, value):
-        """Convert empty string to None."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            value = value.strip()
-            return value if value else None
-        return value
-    
-    def validate_last_name(self, value):
-        """Convert empty string to None."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            value = value.strip()
-            return value if value else None
-        return value
-    
     def update(self, instance, validated_data):
         """Update profile and user fields."""
         # Extract user fields first
@@ -828,6 +1089,11 @@ class StorySerializer(serializers.ModelSerializer):
     """Serializer for Story model."""
     user_name = serializers.CharField(source='user.username', read_only=True)
     user_email = serializers.CharField(source='user.email', read_only=True)
+    # Stored on StoryContent; declared explicitly because they are properties on Story
+    prompt = serializers.CharField()
+    system_prompt_used = serializers.CharField(required=False, allow_blank=True)
+    story_text = serializers.CharField(required=False, allow_blank=True)
+    image_description = serializers.CharField(read_only=True)
     image_url = serializers.SerializerMethodField()
     voice_id = serializers.SerializerMethodField()
     audio_url = serializers.SerializerMethodField()
@@ -844,20 +1110,18 @@ class StorySerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Story
-        fields = [
+        fields = (
             'id', 'user', 'user_name', 'user_email', 'title', 'prompt', 'system_prompt_used',
             'story_text', 'template', 'image', 'image_url', 'image_description', 
-            'audio_file', 'audio_url', 'voice_id', 'is_published', 'scenes', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at', 'image_description', 'scenes']
+            'audio_file', 'audio_url', 'audio_file_size', 'audio_duration_ms', 'voice_id', 'is_published',
+            'scenes', 'created_at', 'updated_at'
+        )
+        read_only_fields = ('id', 'user', 'created_at', 'updated_at', 'image_description', 'scenes')
     
     def get_image_url(self, obj):
         """Return full URL for image if it exists."""
         if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
+            return absolute_media_url(self.context, obj.image.url)
         return None
     
     def get_audio_url(self, obj):
@@ -871,10 +1135,7 @@ class StorySerializer(serializers.ModelSerializer):
             
             # Check if file exists
             if os.path.exists(file_path):
-                request = self.context.get('request')
-                if request:
-                    return request.build_absolute_uri(obj.audio_file.url)
-                return obj.audio_file.url
+                return absolute_media_url(self.context, obj.audio_file.url)
             else:
                 # File path in database but file doesn't exist
                 # This could be an old path structure - return None to trigger regeneration
@@ -886,13 +1147,15 @@ class StorySerializer(serializers.ModelSerializer):
     
     def get_scenes(self, obj):
         """Return serialized scenes for this story."""
-        scenes = obj.scenes.all().order_by('scene_number')
+        # Default ordering is scene_number within a story; calling order_by() here
+        # would bypass scenes prefetched by Story.objects.with_scenes()
+        scenes = obj.scenes.all()
         # Use StorySceneSerializer defined later in the file
         # Import here to avoid circular dependency
         return [
             {
                 'id': str(scene.id),
-                'story': str(scene.story.id),
+                'story': str(scene.story_id),
                 'scene_number': scene.scene_number,
                 'scene_text': scene.scene_text,
                 'image_url': self._get_scene_image_url(scene),
@@ -906,10 +1169,7 @@ class StorySerializer(serializers.ModelSerializer):
     def _get_scene_image_url(self, scene):
         """Helper to get scene image URL."""
         if scene.image and hasattr(scene.image, 'url'):
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(scene.image.url)
-            return scene.image.url
+            return absolute_media_url(self.context, scene.image.url)
         return None
 
 
@@ -922,18 +1182,15 @@ class StoryListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Story
-        fields = [
+        fields = (
             'id', 'user', 'user_name', 'title', 'template', 'is_published', 
-            'created_at', 'updated_at', 'image_url', 'audio_url'
-        ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+            'created_at', 'updated_at', 'image_url', 'audio_url', 'audio_duration_ms'
+        )
+        read_only_fields = ('id', 'user', 'created_at', 'updated_at')
     
     def get_image_url(self, obj):
         if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
+            return absolute_media_url(self.context, obj.image.url)
         return None
 
     def get_audio_url(self, obj):
@@ -947,10 +1204,7 @@ class StoryListSerializer(serializers.ModelSerializer):
             
             # Check if file exists
             if os.path.exists(file_path):
-                request = self.context.get('request')
-                if request:
-                    return request.build_absolute_uri(obj.audio_file.url)
-                return obj.audio_file.url
+                return absolute_media_url(self.context, obj.audio_file.url)
             else:
                 # File path in database but file doesn't exist - return None
                 return None
@@ -963,10 +1217,10 @@ class StoryRevisionSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = StoryRevision
-        fields = [
+        fields = (
             'id', 'story', 'story_text', 'created_at', 'created_by', 'created_by_name'
-        ]
-        read_only_fields = ['id', 'story', 'created_at', 'created_by']
+        )
+        read_only_fields = ('id', 'story', 'created_at', 'created_by')
 
 
 class StorySessionSerializer(serializers.ModelSerializer):
@@ -977,12 +1231,12 @@ class StorySessionSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = StorySession
-        fields = [
+        fields = (
             'id', 'story', 'story_title', 'user', 'user_name',
             'started_at', 'ended_at', 'duration_seconds', 'duration_formatted',
-            'completed', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+            'completed', 'updated_at'
+        )
+        read_only_fields = ('id', 'user', 'updated_at')
     
     def get_duration_formatted(self, obj):
         """Format duration as MM:SS or HH:MM:SS."""
@@ -1002,10 +1256,10 @@ class PlaylistSerializer(serializers.ModelSerializer):
     """Serializer for Playlist model."""
     user_name = serializers.CharField(source='user.username', read_only=True)
     story_count = serializers.SerializerMethodField()
-    stories = StoryListSerializer(many=True, read_only=True)
+    stories = serializers.SerializerMethodField()
     story_ids = serializers.PrimaryKeyRelatedField(
         many=True,
-        queryset=Story.objects.all(),
+        queryset=Story.objects.select_related(None).only('pk'),
         write_only=True,
         required=False,
         source='stories'
@@ -1013,22 +1267,27 @@ class PlaylistSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Playlist
-        fields = [
+        fields = (
             'id', 'user', 'user_name', 'name', 'description', 'stories', 'story_ids',
             'story_count', 'is_public', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'user', 'created_at', 'updated_at')
     
     def get_story_count(self, obj):
         """Return the number of stories in the playlist."""
-        return obj.stories.count()
+        return len(obj.entries.all())
+    
+    def get_stories(self, obj):
+        """Return the playlist stories in playback order."""
+        entries = obj.entries.all()
+        return StoryListSerializer([entry.story for entry in entries], many=True, context=self.context).data
     
     def create(self, validated_data):
         """Create playlist and set user."""
         stories = validated_data.pop('stories', [])
         playlist = Playlist.objects.create(**validated_data)
         if stories:
-            playlist.stories.set(stories)
+            playlist.set_stories(stories)
         return playlist
     
     def update(self, instance, validated_data):
@@ -1038,26 +1297,28 @@ class PlaylistSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
         if stories is not None:
-            instance.stories.set(stories)
+            instance.set_stories(stories)
         return instance
 
 
-class PlaylistListSerializer(serializers.ModelSerializer):
+class PlaylistListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Lightweight serializer for listing playlists."""
     user_name = serializers.CharField(source='user.username', read_only=True)
     story_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Playlist
-        fields = [
+        fields = (
             'id', 'user_name', 'name', 'description', 'story_count',
             'is_public', 'created_at', 'updated_at'
-        ]
+        )
         read_only_fields = fields
+        count_related = {'story_count': 'entries'}
     
     def get_story_count(self, obj):
         """Return the number of stories in the playlist."""
-        return obj.stories.count()
+        count = getattr(obj, 'story_count', None)
+        return obj.entries.count() if count is None else count
 
 
 class StorySessionListSerializer(serializers.ModelSerializer):
@@ -1068,11 +1329,11 @@ class StorySessionListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = StorySession
-        fields = [
+        fields = (
             'id', 'story', 'story_title', 'user_name',
             'started_at', 'ended_at', 'duration_seconds', 'duration_formatted',
             'completed'
-        ]
+        )
         read_only_fields = fields
     
     def get_duration_formatted(self, obj):
@@ -1091,16 +1352,22 @@ class StorySessionListSerializer(serializers.ModelSerializer):
 
 class UserStorySettingsSerializer(serializers.ModelSerializer):
     """Serializer for UserStorySettings model."""
+    # Bits of UserStorySettings.flags, exposed as the original boolean fields
+    include_diversity = serializers.BooleanField(required=False)
+    include_sensory_details = serializers.BooleanField(required=False)
+    include_interactive_questions = serializers.BooleanField(required=False)
+    include_sound_effects = serializers.BooleanField(required=False)
+    explain_complex_words = serializers.BooleanField(required=False)
     
     class Meta:
         model = UserStorySettings
-        fields = [
+        fields = (
             'id', 'user', 'age_range', 'genre_preference', 'language_level',
             'moral_theme', 'include_diversity', 'include_sensory_details',
             'include_interactive_questions', 'max_word_count', 'story_parts',
             'include_sound_effects', 'explain_complex_words', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'user', 'created_at', 'updated_at')
     
     def validate_story_parts(self, value):
         """Ensure story_parts is between 3 and 8."""
@@ -1121,14 +1388,11 @@ class StorySceneSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = StoryScene
-        fields = ['id', 'story', 'scene_number', 'scene_text', 'image', 'image_url', 'prompt_used', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'story', 'created_at', 'updated_at']
+        fields = ('id', 'story', 'scene_number', 'scene_text', 'image', 'image_url', 'prompt_used', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'story', 'created_at', 'updated_at')
     
     def get_image_url(self, obj):
         """Return the full URL for the scene image."""
         if obj.image and hasattr(obj.image, 'url'):
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
+            return absolute_media_url(self.context, obj.image.url)
         return None
@@ -1,3 +1,168 @@
-from django.test import TestCase
+import importlib
+import uuid
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase
+from rest_framework import serializers
+
+from .models import Plan, UserStorySettings
+from .nova_service import _parse_story_parts, _polly_chunks
+from .serializers import PlanListSerializer
+from .utils import uuid7
+
+flags_migration = importlib.import_module('api.migrations.0039_userstorysettings_flags')
+
+
+class ParseStoryPartsTests(SimpleTestCase):
+    """Part headers split the story and every line of a part's body is kept."""
+
+    def test_labelled_parts_keep_body_lines(self):
+        story = "Part 1: The Forest\nMia walked in.\nIt was dark.\nPart 2: The Light\nShe found a lamp."
+        self.assertEqual(_parse_story_parts(story), (
+            (1, "The Forest\nMia walked in.\nIt was dark."),
+            (2, "The Light\nShe found a lamp."),
+        ))
+
+    def test_labelled_part_body_without_title(self):
+        self.assertEqual(_parse_story_parts("Part 1: x\nbody"), ((1, "x\nbody"),))
+
+    def test_markdown_headers_win_over_labels(self):
+        story = "### Part 2\nSecond.\n### Part 1\nFirst.\nChapter 3: ignored"
+        self.assertEqual(_parse_story_parts(story), (
+            (1, "First.\nChapter 3: ignored"),
+            (2, "Second."),
+        ))
+
+    def test_numbered_sections_keep_body_lines(self):
+        body = "The rocket shook as it climbed above the clouds and into space."
+        story = f"1. Liftoff\n{body}\n2. Orbit\n{body}"
+        self.assertEqual(_parse_story_parts(story), (
+            (1, f"Liftoff\n{body}"),
+            (2, f"Orbit\n{body}"),
+        ))
+
+    def test_short_numbered_sections_are_not_parts(self):
+        story = "1. Eggs\n2. Milk"
+        self.assertEqual(_parse_story_parts(story), ((1, story),))
+
+    def test_crlf_text_comes_back_with_plain_newlines(self):
+        self.assertEqual(_parse_story_parts("Part 1: a\r\nb\r\n"), ((1, "a\nb"),))
+
+
+class PollyChunksTests(SimpleTestCase):
+    """Text is split at sentence ends into pieces that fit one Polly request."""
+
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(list(_polly_chunks("Hello there.")), ["Hello there."])
+
+    def test_splits_at_sentence_ends(self):
+        text = "One two. Three four. Five six."
+        chunks = list(_polly_chunks(text, max_chars=12))
+        self.assertEqual(chunks, ["One two. ", "Three four. ", "Five six."])
+
+    def test_long_sentence_breaks_at_last_space(self):
+        text = "a " * 20 + "end."
+        chunks = list(_polly_chunks(text, max_chars=10))
+        self.assertEqual("".join(chunks), text)
+        self.assertTrue(all(len(chunk) <= 10 for chunk in chunks))
+        self.assertTrue(all(chunk.endswith(" ") for chunk in chunks[:-1]))
+
+    def test_text_without_spaces_is_cut_at_the_limit(self):
+        self.assertEqual([len(chunk) for chunk in _polly_chunks("y" * 25, max_chars=10)], [10, 10, 5])
+
+    def test_blank_text_yields_nothing(self):
+        self.assertEqual(list(_polly_chunks("   ")), [])
+
+
+class UUID7Tests(SimpleTestCase):
+    """uuid7() sets RFC 9562 version and variant bits and sorts by creation time."""
+
+    def test_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_leading_bits_hold_the_timestamp(self):
+        with mock.patch('api.utils.time.time_ns', return_value=1_700_000_000_123_456_789):
+            value = uuid7()
+        self.assertEqual(value.int >> 80, 1_700_000_000_123)
+
+    def test_later_values_sort_after_earlier_ones(self):
+        with mock.patch('api.utils.time.time_ns', side_effect=[1_000_000_000, 2_000_000_000]):
+            first, second = uuid7(), uuid7()
+        self.assertLess(first, second)
+
+
+class UserStorySettingsFlagsTests(SimpleTestCase):
+    """The content toggles live in one bitmask; the migration packs and unpacks it."""
+
+    def _migration_apps(self, rows):
+        apps = mock.Mock()
+        model = apps.get_model.return_value
+        model.objects.values.return_value.iterator.return_value = rows
+        return apps, model
+
+    def test_migration_bits_match_the_model(self):
+        settings = UserStorySettings(flags=0)
+        for name, bit in flags_migration.FLAG_BITS.items():
+            settings.flags = bit
+            self.assertTrue(getattr(settings, name), name)
+            self.assertEqual(
+                [other for other in flags_migration.FLAG_BITS if getattr(settings, other)], [name]
+            )
+
+    def test_pack_flags(self):
+        row = dict.fromkeys(flags_migration.FLAG_BITS, False)
+        row.update(id=1, include_diversity=True, explain_complex_words=True)
+        apps, model = self._migration_apps([row])
+        flags_migration.pack_flags(apps, None)
+        model.objects.filter.assert_called_once_with(pk=1)
+        model.objects.filter.return_value.update.assert_called_once_with(flags=1 | 16)
+
+    def test_unpack_flags(self):
+        apps, model = self._migration_apps([{'id': 1, 'flags': 2 | 8}])
+        flags_migration.unpack_flags(apps, None)
+        model.objects.filter.return_value.update.assert_called_once_with(
+            include_diversity=False,
+            include_sensory_details=True,
+            include_interactive_questions=False,
+            include_sound_effects=True,
+            explain_complex_words=False,
+        )
+
+    def test_all_toggles_on_by_default(self):
+        settings = UserStorySettings()
+        self.assertEqual(settings.flags, 31)
+        self.assertTrue(settings.include_sound_effects)
+
+    def test_setting_a_toggle_only_changes_its_bit(self):
+        settings = UserStorySettings(flags=31)
+        settings.include_sensory_details = False
+        self.assertEqual(settings.flags, 31 & ~2)
+        self.assertFalse(settings.include_sensory_details)
+        self.assertTrue(settings.include_diversity)
+        settings.include_sensory_details = True
+        self.assertEqual(settings.flags, 31)
+
+
+class FlatRepresentationTests(TestCase):
+    """The flat list serializers render exactly what ModelSerializer would."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Plan.objects.create(name='Basic', price='4.99', duration_months=1, display_order=2)
+        Plan.objects.create(name='Family', price='49.00', duration_months=12, is_popular=True, is_active=False)
+
+    def _model_serializer_data(self, rows):
+        serializer = PlanListSerializer()
+        return [serializers.ModelSerializer.to_representation(serializer, row) for row in rows]
+
+    def test_instances_match_model_serializer(self):
+        rows = list(Plan.objects.order_by('pk'))
+        data = PlanListSerializer(rows, many=True).data
+        self.assertEqual([dict(row) for row in data], self._model_serializer_data(rows))
+
+    def test_setup_values_rows_match_model_serializer(self):
+        queryset = Plan.objects.order_by('pk')
+        data = PlanListSerializer(PlanListSerializer.setup_values(queryset), many=True).data
+        self.assertEqual([dict(row) for row in data], self._model_serializer_data(queryset))
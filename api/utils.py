@@ -3,6 +3,8 @@ Utility functions for the API app.
 """
 import os
 import io
+import time
+import uuid
 import wave
 from datetime import datetime
 from django.core.files.storage import default_storage
@@ -16,6 +18,26 @@ except ImportError:
     AUDIO_AVAILABLE = False
 
 
+def uuid7():
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits hold the Unix timestamp in milliseconds, so new values
+    sort after older ones and primary-key inserts append to the end of the
+    InnoDB clustered index instead of splitting random pages.
+
+    Returns:
+        uuid.UUID: Version 7 UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    value |= int.from_bytes(os.urandom(10), 'big') & ((1 << 80) - 1)
+    # Set version (0111) and RFC 4122 variant (10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
 def get_image_upload_path(instance, filename, category='images'):
     """
     Generate upload path with year/month/storyid structure for stories.
@@ -94,28 +116,49 @@ def story_audio_upload_path(instance, filename):
     return get_image_upload_path(instance, filename, 'stories')
 
 
+def _scene_path_parts(story_id, now=None):
+    """Return the (directory prefix, timestamp) shared by every scene image of a story."""
+    now = now or datetime.now()
+    return f"{now.strftime('%Y')}/{now.strftime('%m')}/{story_id}/scenes", now.strftime('%Y%m%d_%H%M%S')
+
+
 def story_scene_image_upload_path(instance, filename):
     """
     Upload path function for StoryScene model images.
     Returns: year/month/storyid/scenes/scene_<number>_<timestamp>.jpg
     This is a callable that Django migrations can serialize.
     """
-    now = datetime.now()
-    year = now.strftime('%Y')
-    month = now.strftime('%m')
-    timestamp = now.strftime('%Y%m%d_%H%M%S')
-    
     # Get file extension
     _, ext = os.path.splitext(filename)
     if not ext:
         ext = '.jpg'
     
-    # Get story ID from instance
-    story_id = str(instance.story.id) if instance and hasattr(instance, 'story') and instance.story else 'unknown'
+    # Use the FK id directly so building the path doesn't fetch the story row
+    story_id = str(instance.story_id) if instance and getattr(instance, 'story_id', None) else 'unknown'
     scene_number = instance.scene_number if instance and hasattr(instance, 'scene_number') else 1
+    prefix, timestamp = _scene_path_parts(story_id)
     
     # Return path: year/month/storyid/scenes/scene_<number>_<timestamp>.ext
-    return f"{year}/{month}/{story_id}/scenes/scene_{scene_number}_{timestamp}{ext}"
+    return f"{prefix}/scene_{scene_number}_{timestamp}{ext}"
+
+
+def build_scene_paths(story_id, scene_numbers, ext='.png'):
+    """
+    Build upload paths for many scenes of one story in a single pass.
+    
+    The year/month/story prefix and timestamp are computed once instead of
+    once per scene as story_scene_image_upload_path does.
+    
+    Args:
+        story_id: Story primary key
+        scene_numbers: Iterable of scene numbers
+        ext: File extension including the dot
+    
+    Returns:
+        dict: scene_number -> path in the same format as story_scene_image_upload_path
+    """
+    prefix, timestamp = _scene_path_parts(story_id)
+    return {number: f"{prefix}/scene_{number}_{timestamp}{ext}" for number in scene_numbers}
 
 
 def save_image_file(uploaded_file, category='images', instance=None, filename=None):
@@ -367,6 +410,23 @@ def upsample_audio(pcm_data, from_rate=16000, to_rate=24000, channels=1, sample_
         return pcm_data
 
 
+def pcm_duration_ms(pcm_data, sample_rate=24000, channels=1, sample_width=2):
+    """
+    Compute the playback length of raw PCM audio without decoding it.
+    
+    Args:
+        pcm_data (bytes): Raw PCM audio data
+        sample_rate (int): Sample rate in Hz (default: 24000 for Nova Sonic output)
+        channels (int): Number of channels (default: 1 for mono)
+        sample_width (int): Sample width in bytes (default: 2 for 16-bit)
+    
+    Returns:
+        int: Duration in milliseconds
+    """
+    frame_size = channels * sample_width
+    return (len(pcm_data) // frame_size) * 1000 // sample_rate
+
+
 def pcm_to_mp3(pcm_data, sample_rate=24000, channels=1, sample_width=2):
     """
     Convert PCM audio data to MP3 format for storage and playback.
@@ -1,5 +1,7 @@
 from rest_framework import viewsets, status, filters
-from rest_framework.decorators import api_view, action, permission_classes
+from rest_framework.decorators import api_view, action, permission_classes, parser_classes
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated, BasePermission
 from rest_framework.authtoken.models import Token
@@ -7,7 +9,7 @@ from rest_framework.pagination import PageNumberPagination
 from django.utils import timezone
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db.models import Q, F
 from django.conf import settings
 from collections import defaultdict
 import os
@@ -18,7 +20,7 @@ from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
-from .models import Item, Category, Permission, Role, UserRole, UserActivity, Subscription, Plan, Invoice, NewsCategory, News, FAQCategory, FAQ, PageCategory, Page, UserProfile, Story, StorySession, Playlist, UserStorySettings, StoryScene
+from .models import Item, Category, Permission, Role, UserRole, UserActivity, Subscription, Plan, Invoice, NewsCategory, News, FAQCategory, FAQ, FAQStats, PageCategory, Page, UserProfile, Story, StorySession, Playlist, UserStorySettings, StoryScene
 from .serializers import (
     ItemSerializer, ItemListSerializer, CategorySerializer, 
     UserSerializer, UserListSerializer, UserUpdateSerializer,
@@ -40,7 +42,8 @@ from .serializers import (
     StorySerializer, StoryListSerializer,
     StorySessionSerializer, StorySessionListSerializer,
     PlaylistSerializer, PlaylistListSerializer,
-    StoryRevisionSerializer, UserStorySettingsSerializer
+    StoryRevisionSerializer, UserStorySettingsSerializer,
+    MAX_IMAGE_BYTES
 )
 
 
@@ -60,6 +63,29 @@ class UserPagination(PageNumberPagination):
     max_page_size = 100
 
 
+# ========== Parsers ==========
+
+class ImageUploadParser(MultiPartParser):
+    """
+    Multipart parser for forms carrying a single image upload.
+    
+    Bodies whose Content-Length could not hold a valid image are refused before any of the
+    body is read or spooled to disk; the serializer validators still check each file.
+    """
+    # One image plus room for the accompanying text fields and the multipart framing
+    max_content_length = MAX_IMAGE_BYTES + 16 * 1024
+    
+    def parse(self, stream, media_type=None, parser_context=None):
+        request = parser_context['request']
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > self.max_content_length:
+            raise ParseError(f"Upload too large. Images cannot exceed {MAX_IMAGE_BYTES // 1024}KB.")
+        return super().parse(stream, media_type, parser_context)
+
+
 # ========== Custom Permissions ==========
 
 class IsStaffOrReadOnly(BasePermission):
@@ -98,6 +124,8 @@ class ItemViewSet(viewsets.ModelViewSet):
         if is_active is not None:
             is_active_bool = is_active.lower() == 'true'
             queryset = queryset.filter(is_active=is_active_bool)
+        if self.action == 'list':
+            queryset = ItemListSerializer.setup_values(queryset)
         return queryset
 
     @action(detail=True, methods=['post'])
@@ -357,6 +385,9 @@ class UserViewSet(viewsets.ModelViewSet):
         # using the search_fields defined above, so we don't need to manually filter here
         # This method is kept for any future custom filtering needs
         
+        queryset = self.get_serializer_class().setup_eager_loading(queryset)
+        if self.action == 'list':
+            queryset = UserListSerializer.setup_values(queryset)
         return queryset
     
     def list(self, request, *args, **kwargs):
@@ -473,6 +504,8 @@ class PermissionViewSet(viewsets.ModelViewSet):
         if is_active is not None:
             is_active_bool = is_active.lower() == 'true'
             queryset = queryset.filter(is_active=is_active_bool)
+        if self.action == 'list':
+            queryset = PermissionListSerializer.setup_values(queryset)
         return queryset
 
 
@@ -489,6 +522,10 @@ class RoleViewSet(viewsets.ModelViewSet):
         if self.action == 'list':
             return RoleListSerializer
         return RoleSerializer
+    
+    def get_queryset(self):
+        queryset = Role.objects.all().order_by('name')
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
 
 class UserRoleViewSet(viewsets.ModelViewSet):
@@ -501,6 +538,10 @@ class UserRoleViewSet(viewsets.ModelViewSet):
     ordering_fields = ['assigned_at']
     ordering = ['-assigned_at']
     
+    def get_queryset(self):
+        queryset = UserRole.objects.all().order_by('-assigned_at')
+        return self.get_serializer_class().setup_eager_loading(queryset)
+    
     def perform_create(self, serializer):
         """Set assigned_by to current user."""
         serializer.save(assigned_by=self.request.user)
@@ -579,7 +620,7 @@ class UserActivityViewSet(viewsets.ReadOnlyModelViewSet):
             except (ValueError, TypeError):
                 pass
         
-        return queryset
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
 
 # ========== Plan ViewSet ==========
@@ -607,6 +648,8 @@ class PlanViewSet(viewsets.ModelViewSet):
         if is_active is not None:
             is_active_bool = is_active.lower() == 'true'
             queryset = queryset.filter(is_active=is_active_bool)
+        if self.action == 'list':
+            queryset = PlanListSerializer.setup_values(queryset)
         return queryset
 
 
@@ -645,7 +688,9 @@ class SubscriptionViewSet(viewsets.ModelViewSet):
         status_filter = self.request.query_params.get('status', None)
         if status_filter:
             queryset = queryset.filter(status=status_filter)
-        return queryset
+        if self.action == 'list':
+            return SubscriptionListSerializer.setup_values(queryset)
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
 
 # ========== Invoice ViewSet ==========
@@ -698,7 +743,9 @@ class InvoiceViewSet(viewsets.ModelViewSet):
         subscription_id = self.request.query_params.get('subscription_id', None)
         if subscription_id:
             queryset = queryset.filter(subscription_id=subscription_id)
-        return queryset
+        if self.action == 'list':
+            return InvoiceListSerializer.setup_values(queryset)
+        return self.get_serializer_class().setup_eager_loading(queryset)
     
     def perform_create(self, serializer):
         """Generate invoice number on create."""
@@ -1125,7 +1172,7 @@ class NewsCategoryViewSet(viewsets.ModelViewSet):
         if is_active is not None:
             is_active_bool = is_active.lower() == 'true'
             queryset = queryset.filter(is_active=is_active_bool)
-        return queryset
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
 
 class NewsViewSet(viewsets.ModelViewSet):
@@ -1147,6 +1194,10 @@ class NewsViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = News.objects.all().order_by('-created_at')
         
+        # List rows never serialize the body text, so don't fetch it
+        if self.action == 'list':
+            queryset = queryset.defer('content')
+        
         # Filter by category
         category_id = self.request.query_params.get('category_id', None)
         if category_id:
@@ -1168,7 +1219,7 @@ class NewsViewSet(viewsets.ModelViewSet):
         if author_id:
             queryset = queryset.filter(author_id=author_id)
         
-        return queryset
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
 
 # ========== FAQ Management ViewSets ==========
@@ -1195,7 +1246,7 @@ class FAQCategoryViewSet(viewsets.ModelViewSet):
         if is_active is not None:
             is_active_bool = is_active.lower() == 'true'
             queryset = queryset.filter(is_active=is_active_bool)
-        return queryset
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
 
 class FAQViewSet(viewsets.ModelViewSet):
@@ -1223,6 +1274,10 @@ class FAQViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = FAQ.objects.all().order_by('display_order', '-created_at')
         
+        # List rows never serialize the body text, so don't fetch it
+        if self.action == 'list':
+            queryset = queryset.defer('answer')
+        
         # Filter by category
         category_id = self.request.query_params.get('category_id', None)
         if category_id:
@@ -1238,7 +1293,7 @@ class FAQViewSet(viewsets.ModelViewSet):
         if author_id:
             queryset = queryset.filter(author_id=author_id)
         
-        return queryset
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
 
 # ========== Page Management ViewSets ==========
@@ -1265,7 +1320,7 @@ class PageCategoryViewSet(viewsets.ModelViewSet):
         if is_active is not None:
             is_active_bool = is_active.lower() == 'true'
             queryset = queryset.filter(is_active=is_active_bool)
-        return queryset
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
 
 class PageViewSet(viewsets.ModelViewSet):
@@ -1293,6 +1348,10 @@ class PageViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = Page.objects.all().order_by('-created_at')
         
+        # List rows never serialize the body text, so don't fetch it
+        if self.action == 'list':
+            queryset = queryset.defer('description')
+        
         # Filter by category
         category_id = self.request.query_params.get('category_id', None)
         if category_id:
@@ -1314,7 +1373,7 @@ class PageViewSet(viewsets.ModelViewSet):
         if author_id:
             queryset = queryset.filter(author_id=author_id)
         
-        return queryset
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
 
 # ========== Public Slug-Based Endpoints ==========
@@ -1324,9 +1383,9 @@ def news_by_slug(request, slug):
     """Get published news article by slug."""
     try:
         news = News.objects.get(slug=slug, status='published')
-        # Increment view count
+        # Increment view count in a single UPDATE without rewriting the row
+        News.objects.filter(pk=news.pk).update(views_count=F('views_count') + 1)
         news.views_count += 1
-        news.save(update_fields=['views_count'])
         
         serializer = NewsSerializer(news, context={'request': request})
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1341,10 +1400,14 @@ def news_by_slug(request, slug):
 def faq_by_slug(request, slug):
     """Get published FAQ by slug."""
     try:
-        faq = FAQ.objects.get(slug=slug, status='published')
-        # Increment view count
-        faq.views_count += 1
-        faq.save(update_fields=['views_count'])
+        faq = FAQ.objects.select_related('stats').get(slug=slug, status='published')
+        # Increment view count on the stats sidecar so the FAQ row itself is never locked
+        FAQStats.increment(faq.pk, 'views_count')
+        if hasattr(faq, 'stats'):
+            faq.stats.views_count += 1
+        else:
+            # increment() just created the stats row with this first view
+            faq.views_count = 1
         
         serializer = FAQSerializer(faq, context={'request': request})
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1360,9 +1423,9 @@ def page_by_slug(request, slug):
     """Get published page by slug."""
     try:
         page = Page.objects.get(slug=slug, status='published')
-        # Increment view count
+        # Increment view count in a single UPDATE without rewriting the row
+        Page.objects.filter(pk=page.pk).update(views_count=F('views_count') + 1)
         page.views_count += 1
-        page.save(update_fields=['views_count'])
         
         serializer = PageSerializer(page, context={'request': request})
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1374,6 +1437,7 @@ def page_by_slug(request, slug):
 
 
 @api_view(['GET', 'PATCH'])
+@parser_classes([JSONParser, FormParser, ImageUploadParser])
 def user_profile(request):
     """Get or update current user's profile."""
     if not request.user.is_authenticated:
@@ -1394,8 +1458,10 @@ def user_profile(request):
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     elif request.method == 'PATCH':
+        # Parse outside the try so an oversized upload is reported as a 400, not a 500
+        data = request.data
         try:
-            serializer = UserProfileUpdateSerializer(profile, data=request.data, partial=True, context={'request': request})
+            serializer = UserProfileUpdateSerializer(profile, data=data, partial=True, context={'request': request})
             
             if serializer.is_valid():
                 serializer.save()
@@ -1600,7 +1666,7 @@ class StoryViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     pagination_class = StandardPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['title', 'prompt', 'story_text']
+    search_fields = ['title', 'content__prompt', 'content__story_text']
     ordering_fields = ['created_at', 'updated_at', 'title']
     ordering = ['-created_at']
     
@@ -1614,6 +1680,12 @@ class StoryViewSet(viewsets.ModelViewSet):
         """Return stories for the authenticated user, or all stories for superadmin."""
         queryset = Story.objects.all()
         
+        # Scenes are only serialized on the detail view; lists never join the text columns
+        if self.action == 'retrieve':
+            queryset = queryset.with_scenes()
+        if self.action != 'list':
+            queryset = queryset.with_content()
+        
         # Superadmin can see all stories
         if not self.request.user.is_superuser:
             # Regular users only see their own stories
@@ -1656,19 +1728,17 @@ class StoryViewSet(viewsets.ModelViewSet):
             
             # Generate story text (skip if only generating audio)
             if not generate_only_audio:
-                # Get user's story settings if available
-                user_settings = None
-                try:
-                    user_settings = UserStorySettings.objects.get(user=story.user)
-                except UserStorySettings.DoesNotExist:
-                    pass  # Use defaults if settings don't exist
+                # Get user's story settings if available (None means use defaults)
+                user_settings = UserStorySettings.get_for_user(story.user_id)
                 
-                story_text, system_prompt = nova.generate_story(
+                # Narration is synthesized sentence by sentence while the story streams in;
+                # pcm_audio is None if that failed, and is retried below
+                story_text, system_prompt, pcm_audio = nova.generate_story_with_speech(
                     prompt=story.prompt,
                     image_description=image_description or story.image_description,
                     template=story.template,
                     user_settings=user_settings,
-                    return_system_prompt=True
+                    voice_id=story.voice_id or None
                 )
                 story.story_text = story_text
                 story.system_prompt_used = system_prompt
@@ -1677,6 +1747,7 @@ class StoryViewSet(viewsets.ModelViewSet):
             else:
                 # Use existing story text
                 story_text = story.story_text
+                pcm_audio = None
             
             # Generate audio using Amazon Polly (simplified approach)
             try:
@@ -1697,9 +1768,10 @@ class StoryViewSet(viewsets.ModelViewSet):
                 voice_id = getattr(story, 'voice_id', None)
                 if not voice_id or voice_id == '':
                     voice_id = None  # Let Polly use default
-                logger.info(f"Calling nova.synthesize_speech() with voice_id={voice_id}...")
-                print(f"Calling nova.synthesize_speech() with voice_id={voice_id}...")
-                pcm_audio = nova.synthesize_speech(story_text, voice_id=voice_id)
+                if not pcm_audio:
+                    logger.info(f"Calling nova.synthesize_speech() with voice_id={voice_id}...")
+                    print(f"Calling nova.synthesize_speech() with voice_id={voice_id}...")
+                    pcm_audio = nova.synthesize_speech(story_text, voice_id=voice_id)
                 
                 if not pcm_audio or len(pcm_audio) == 0:
                     raise Exception("No audio data returned from synthesize_speech")
@@ -1747,9 +1819,12 @@ class StoryViewSet(viewsets.ModelViewSet):
                 logger.info(f"Audio file saved to: {audio_path}")
                 print(f"Audio file saved to: {audio_path}")
                 
-                # Update story with audio file path
+                # Update story with audio file path and metadata
+                from .utils import pcm_duration_ms
                 story.audio_file.name = audio_path
-                story.save(update_fields=['audio_file'])
+                story.audio_file_size = len(audio_data)
+                story.audio_duration_ms = pcm_duration_ms(pcm_audio, sample_rate=16000)
+                story.save(update_fields=['audio_file', 'audio_file_size', 'audio_duration_ms'])
                 
                 # Delete old audio files AFTER saving the new one
                 # Delete the specific old file AND clean up any other old audio files in the story directory
@@ -2054,19 +2129,20 @@ class StoryViewSet(viewsets.ModelViewSet):
             else:
                 prompt_to_use = f"{story.prompt}\n\nUser requested changes: {modifications}"
             
-            # Get user's story settings if available
-            user_settings = None
-            try:
-                user_settings = UserStorySettings.objects.get(user=story.user)
-            except UserStorySettings.DoesNotExist:
-                pass  # Use defaults if settings don't exist
+            # Get user's story settings if available (None means use defaults)
+            user_settings = UserStorySettings.get_for_user(story.user_id)
             
-            story_text, system_prompt = nova.generate_story(
+            # Use story's voice_id or default to 'Joanna'
+            voice_id = story.voice_id or 'Joanna'
+            
+            # Narration is synthesized while the story streams in; None means retry below
+            story_text, system_prompt, pcm_audio = nova.generate_story_with_speech(
                 prompt=prompt_to_use,
                 image_description=image_description,
                 template=template,
                 user_settings=user_settings,
-                return_system_prompt=True
+                voice_id=voice_id,
+                bypass_cache=True
             )
             
             story.story_text = story_text
@@ -2075,11 +2151,9 @@ class StoryViewSet(viewsets.ModelViewSet):
             
             # Regenerate audio using Amazon Polly
             try:
-                # Use story's voice_id or default to 'Joanna'
-                voice_id = story.voice_id or 'Joanna'
-                
                 # Polly returns PCM audio (16kHz)
-                pcm_audio = nova.synthesize_speech(story_text, voice_id=voice_id)
+                if not pcm_audio:
+                    pcm_audio = nova.synthesize_speech(story_text, voice_id=voice_id)
                 
                 # Convert PCM to MP3 for storage and playback
                 from .utils import pcm_to_mp3
@@ -2102,8 +2176,11 @@ class StoryViewSet(viewsets.ModelViewSet):
                 if not audio_path:
                     raise Exception("Failed to save audio file - no path returned")
                 
-                # Update story with audio file path
+                # Update story with audio file path and metadata
+                from .utils import pcm_duration_ms
                 story.audio_file.name = audio_path
+                story.audio_file_size = len(audio_data)
+                story.audio_duration_ms = pcm_duration_ms(pcm_audio, sample_rate=16000)
                 
                 # Delete old audio file after successful save
                 if old_audio_path and old_audio_path != audio_path:
@@ -2179,58 +2256,68 @@ class StoryViewSet(viewsets.ModelViewSet):
             
             logger.info(f"Generating {len(parts)} scenes for story {story.id}")
             
-            # Delete existing scenes for this story
-            StoryScene.objects.filter(story=story).delete()
+            from django.core.files.base import ContentFile
+            from django.core.files.storage import default_storage
+            from .utils import build_scene_paths
             
-            generated_scenes = []
+            scene_paths = build_scene_paths(story.id, [part['number'] for part in parts])
+            new_scenes = []
             
-            # Generate image for each part
-            for part in parts:
-                try:
-                    # Create a prompt for image generation based on the scene text
-                    # Limit scene text to first 500 characters for prompt
-                    scene_text = part['text'][:500]
-                    
-                    # Create image generation prompt
-                    image_prompt = f"A beautiful, colorful, child-friendly portrait illustration for a children's story scene. {scene_text}. Style: whimsical, vibrant, safe for children, portrait orientation, detailed characters and setting."
-                    
-                    logger.info(f"Generating image for scene {part['number']} of story {story.id}")
-                    
-                    # Generate image (portrait orientation: 1024x1024 or 768x1024)
-                    image_bytes = nova.generate_image(
-                        prompt=image_prompt,
-                        width=768,
-                        height=1024,  # Portrait orientation
-                        style_preset="photographic"
-                    )
-                    
-                    # Create StoryScene object first (without image)
-                    scene = StoryScene.objects.create(
-                        story=story,
-                        scene_number=part['number'],
-                        scene_text=part['text'],
-                        prompt_used=image_prompt
-                    )
-                    
-                    # Save image using Django's file handling
-                    from django.core.files.base import ContentFile
-                    from django.core.files.uploadedfile import InMemoryUploadedFile
-                    import io
-                    from datetime import datetime
-                    
-                    # Create a ContentFile from the image bytes
-                    image_file = ContentFile(image_bytes, name=f'scene_{part["number"]}.png')
-                    
-                    # Assign to the scene's image field (will use upload_to function)
-                    scene.image.save(f'scene_{part["number"]}.png', image_file, save=True)
-                    
-                    generated_scenes.append(scene)
-                    logger.info(f"Successfully generated scene {part['number']} for story {story.id}")
-                    
-                except Exception as e:
-                    logger.error(f"Error generating scene {part['number']} for story {story.id}: {e}", exc_info=True)
-                    # Continue with other scenes even if one fails
-                    continue
+            def scene_image(part):
+                # Create a prompt for image generation based on the scene text
+                # Limit scene text to first 500 characters for prompt
+                scene_text = part['text'][:500]
+                
+                # Create image generation prompt
+                image_prompt = f"A beautiful, colorful, child-friendly portrait illustration for a children's story scene. {scene_text}. Style: whimsical, vibrant, safe for children, portrait orientation, detailed characters and setting."
+                
+                logger.info(f"Generating image for scene {part['number']} of story {story.id}")
+                
+                # Generate image (portrait orientation: 1024x1024 or 768x1024)
+                image_bytes = nova.generate_image(
+                    prompt=image_prompt,
+                    width=768,
+                    height=1024,  # Portrait orientation
+                    style_preset="photographic"
+                )
+                return image_prompt, image_bytes
+            
+            # Generate the images for all parts concurrently, then store them in scene order
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                scene_futures = [(part, pool.submit(scene_image, part)) for part in parts]
+                for part, future in scene_futures:
+                    try:
+                        image_prompt, image_bytes = future.result()
+                        
+                        # Store the image now; the scene rows are written together below
+                        image_name = default_storage.save(scene_paths[part['number']], ContentFile(image_bytes))
+                        
+                        new_scenes.append(StoryScene(
+                            story=story,
+                            scene_number=part['number'],
+                            scene_text=part['text'],
+                            prompt_used=image_prompt,
+                            image=image_name
+                        ))
+                        logger.info(f"Successfully generated scene {part['number']} for story {story.id}")
+                        
+                    except Exception as e:
+                        logger.error(f"Error generating scene {part['number']} for story {story.id}: {e}", exc_info=True)
+                        # Continue with other scenes even if one fails
+                        continue
+            
+            generated_scenes = []
+            if new_scenes:
+                # Upsert all scenes in one statement and drop scenes the new transcript no longer has
+                StoryScene.bulk_upsert(new_scenes, update_fields=['scene_text', 'prompt_used', 'image'])
+                generated_numbers = [scene.scene_number for scene in new_scenes]
+                StoryScene.objects.filter(story=story).exclude(
+                    scene_number__in=[part['number'] for part in parts]
+                ).delete()
+                generated_scenes = list(
+                    StoryScene.objects.filter(story=story, scene_number__in=generated_numbers).order_by('scene_number')
+                )
             
             if not generated_scenes:
                 return Response(
@@ -2370,24 +2457,25 @@ class StoryViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Create or update scene objects (don't delete existing ones with images)
-            created_scenes = []
-            for part in parts:
-                scene, created = StoryScene.objects.get_or_create(
+            # Create or update scene objects in one upsert (existing images and prompts are kept)
+            StoryScene.bulk_upsert(
+                [
+                    StoryScene(
+                        story=story,
+                        scene_number=part['number'],
+                        scene_text=part['text'],
+                        prompt_used='Manual upload'
+                    )
+                    for part in parts
+                ],
+                update_fields=['scene_text']
+            )
+            created_scenes = list(
+                StoryScene.objects.filter(
                     story=story,
-                    scene_number=part['number'],
-                    defaults={
-                        'scene_text': part['text'],
-                        'prompt_used': 'Manual upload'
-                    }
-                )
-                
-                # Update scene_text if it changed
-                if not created and scene.scene_text != part['text']:
-                    scene.scene_text = part['text']
-                    scene.save()
-                
-                created_scenes.append(scene)
+                    scene_number__in=[part['number'] for part in parts]
+                ).order_by('scene_number')
+            )
             
             # Serialize and return
             from .serializers import StorySceneSerializer
@@ -2569,6 +2657,18 @@ class StorySessionViewSet(viewsets.ModelViewSet):
         if story_id:
             queryset = queryset.filter(story_id=story_id)
         
+        # Optional filter by completion (served by the user/completed/started_at index)
+        completed = self.request.query_params.get('completed', None)
+        if completed is not None:
+            queryset = queryset.filter(completed=completed.lower() in ('true', '1'))
+        
+        if self.action == 'list':
+            # Only the columns StorySessionListSerializer renders; skips the wide story/user rows
+            queryset = queryset.only(
+                'id', 'started_at', 'ended_at', 'duration_seconds', 'completed',
+                'story__title', 'user__username',
+            )
+        
         return queryset
     
     def perform_create(self, serializer):
@@ -2631,7 +2731,10 @@ class PlaylistViewSet(viewsets.ModelViewSet):
                 Q(user=self.request.user) | Q(is_public=True)
             )
         
-        return queryset.prefetch_related('stories', 'user')
+        # List rows only count the stories; the other actions render them
+        if self.action == 'list':
+            return PlaylistListSerializer.setup_eager_loading(queryset)
+        return queryset.with_entries()
     
     def perform_create(self, serializer):
         """Create playlist and set user."""
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import importlib.util
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -91,6 +92,19 @@ except ImportError:
     # Channels not installed, WebSocket features unavailable
     pass
 
+# Cache configuration
+# Without CACHE_REDIS_URL Django uses a per-process in-memory cache. Anything cached
+# with save/delete invalidation (e.g. UserStorySettings.get_for_user) needs a cache
+# shared by every worker, so set CACHE_REDIS_URL for multi-process deployments.
+cache_redis_url = os.getenv('CACHE_REDIS_URL')
+if cache_redis_url:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': cache_redis_url,
+        }
+    }
+
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
@@ -175,6 +189,22 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/6.0/topics/auth/passwords/#using-argon2-with-django
+# New passwords are hashed with the first hasher; the rest still verify existing hashes,
+# which are upgraded on the user's next login.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Prefer Argon2 when argon2-cffi is installed. It is memory-hard rather than cheaper than PBKDF2:
+# each hash takes about 100MB with Django's defaults, so size workers for concurrent logins
+if importlib.util.find_spec('argon2') is not None:
+    PASSWORD_HASHERS.insert(0, 'django.contrib.auth.hashers.Argon2PasswordHasher')
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
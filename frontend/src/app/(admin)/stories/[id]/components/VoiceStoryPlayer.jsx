@@ -20,6 +20,7 @@ const VoiceStoryPlayer = ({ story, audioUrl, onSessionStart, onSessionEnd, canEd
   const audioRef = useRef(null);
   const audioContextRef = useRef(null);
   const audioQueueRef = useRef([]);
+  const nextChunkTimeRef = useRef(0);
   const novaSonicClientRef = useRef(null);
 
   useEffect(() => {
@@ -260,6 +261,12 @@ const VoiceStoryPlayer = ({ story, audioUrl, onSessionStart, onSessionEnd, canEd
         }
         break;
         
+      case 'audio_chunk':
+        // Partial response audio, streamed while the rest is still being generated
+        setIsProcessing(false);
+        await playAudioChunk(data.audio, data.sample_rate);
+        break;
+        
       case 'text_output':
         setIsProcessing(false);
         addMessage('ai_response', data.text);
@@ -354,6 +361,52 @@ const VoiceStoryPlayer = ({ story, audioUrl, onSessionStart, onSessionEnd, canEd
     }
   };
 
+  const playAudioChunk = async (audioBase64, sampleRate = 24000) => {
+    try {
+      // Decode base64 audio
+      const audioBytes = Uint8Array.from(atob(audioBase64), c => c.charCodeAt(0));
+      
+      // Create audio context
+      if (!audioContextRef.current) {
+        audioContextRef.current = new (window.AudioContext || window.webkitAudioContext)({ sampleRate });
+      }
+      
+      // Convert 16-bit PCM (little-endian, signed) to float32
+      const audioBuffer = audioContextRef.current.createBuffer(1, audioBytes.length / 2, sampleRate);
+      const channelData = audioBuffer.getChannelData(0);
+      const samples = new DataView(audioBytes.buffer);
+      for (let i = 0; i < channelData.length; i++) {
+        channelData[i] = samples.getInt16(i * 2, true) / 32768.0;
+      }
+      
+      // Schedule right after the previous chunk so the parts play without gaps
+      const source = audioContextRef.current.createBufferSource();
+      source.buffer = audioBuffer;
+      source.connect(audioContextRef.current.destination);
+      
+      const startTime = Math.max(audioContextRef.current.currentTime, nextChunkTimeRef.current);
+      nextChunkTimeRef.current = startTime + audioBuffer.duration;
+      
+      source.onended = () => {
+        // Only the last scheduled chunk ends the speaking state
+        if (audioContextRef.current && audioContextRef.current.currentTime >= nextChunkTimeRef.current - 0.05) {
+          setIsSpeaking(false);
+          if (onSpeakingChange) {
+            onSpeakingChange(false);
+          }
+        }
+      };
+      
+      source.start(startTime);
+      setIsSpeaking(true);
+      if (onSpeakingChange) {
+        onSpeakingChange(true);
+      }
+    } catch (error) {
+      console.error('Error playing audio chunk:', error);
+    }
+  };
+
   const playAudioResponse = async (audioBase64, sampleRate = 24000) => {
     try {
       // Decode base64 audio